@@ -0,0 +1,45 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import List
+
+from sims4communitylib.exceptions.common_exception_coalescer import CommonExceptionCoalescer
+from sims4communitylib.exceptions.common_stacktrace_utils import CommonStacktraceUtil
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+def _raise_and_get_stack_signature(value: int) -> int:
+    try:
+        raise ValueError(f'Value {value}')
+    except ValueError as ex:
+        return CommonStacktraceUtil.get_stack_signature(exception=ex)
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity())
+class CommonExceptionCoalescerTests:
+    @staticmethod
+    @CommonTestService.test()
+    def _try_coalesce_should_only_count_exceptions_repeated_at_the_same_place() -> None:
+        coalescer: CommonExceptionCoalescer = CommonExceptionCoalescer.create_standalone_instance()
+        results: List[bool] = list()
+        try:
+            for value in range(3):
+                results.append(coalescer.try_coalesce('s4cl_test_mod', _raise_and_get_stack_signature(value), 'Test exception'))
+            results.append(coalescer.try_coalesce('s4cl_test_mod', CommonStacktraceUtil.get_stack_signature(exception=ValueError()), 'Other test exception'))
+            results.append(coalescer.try_coalesce('s4cl_test_mod_two', _raise_and_get_stack_signature(0), 'Test exception'))
+            # The same place with a different message is logged in full.
+            results.append(coalescer.try_coalesce('s4cl_test_mod', _raise_and_get_stack_signature(0), 'Test exception -> ValueError: Value 0'))
+        finally:
+            if coalescer._summary_timer is not None:
+                coalescer._summary_timer.cancel()
+        CommonAssertionUtils.are_equal(results, [False, True, True, False, False, False])
+        CommonAssertionUtils.is_true(coalescer.should_notify('s4cl_test_mod'))
+        CommonAssertionUtils.is_false(coalescer.should_notify('s4cl_test_mod'))
+        CommonAssertionUtils.is_true(coalescer.should_notify('s4cl_test_mod_two'))
@@ -0,0 +1,129 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, Tuple, List
+
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.persistence.data_management.common_data_manager import CommonDataManager
+from sims4communitylib.persistence.data_stores.common_data_store import CommonDataStore
+from sims4communitylib.persistence.persistence_services.common_persistence_service import CommonPersistenceService
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+class _TestPersistenceService(CommonPersistenceService):
+    def __init__(self, data: Dict[str, Any]):
+        super().__init__()
+        self.data = data
+        self.saved_data: List[Dict[str, Any]] = list()
+
+    def load(self, mod_identity: CommonModIdentity, identifier: str=None) -> Dict[str, Any]:
+        return self.data
+
+    def save(self, mod_identity: CommonModIdentity, data: Dict[str, Any], identifier: str=None) -> bool:
+        self.saved_data.append(dict(data))
+        return True
+
+    def remove(self, mod_identity: CommonModIdentity, identifier: str=None) -> bool:
+        return True
+
+
+class _TestDataStore(CommonDataStore):
+    @classmethod
+    def get_identifier(cls) -> str:
+        return 's4cl_test_data_store'
+
+    @property
+    def _version(self) -> int:
+        return 1
+
+    @property
+    def _default_data(self) -> Dict[str, Any]:
+        return {
+            'test_value': 0,
+            'test_list': list()
+        }
+
+
+class _TestMarkDirtyDataStore(_TestDataStore):
+    @property
+    def _mark_unsaved_changes_on_mutable_read(self) -> bool:
+        return False
+
+
+class _TestDataManager(CommonDataManager):
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    @property
+    def log_identifier(self) -> str:
+        return 's4cl_test_data_manager'
+
+    @property
+    def persistence_services(self) -> Tuple[CommonPersistenceService]:
+        return self._test_persistence_service,
+
+    def __init__(self, persistence_service: _TestPersistenceService):
+        super().__init__()
+        self._test_persistence_service = persistence_service
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity())
+class CommonDataManagerTests:
+    @staticmethod
+    @CommonTestService.test()
+    def _save_should_only_persist_when_data_changed() -> None:
+        persistence_service = _TestPersistenceService({_TestDataStore.get_identifier(): {'test_value': 1, 'version': 1}})
+        data_manager = _TestDataManager(persistence_service)
+        data_store = data_manager.get_data_store_by_type(_TestDataStore)
+        CommonAssertionUtils.are_equal(data_store.get_value_by_key('test_value'), 1)
+        CommonAssertionUtils.is_true(data_manager.save())
+        CommonAssertionUtils.has_length(persistence_service.saved_data, 0)
+
+        data_store.set_value_by_key('test_value', 2)
+        CommonAssertionUtils.is_true(data_manager.save())
+        CommonAssertionUtils.has_length(persistence_service.saved_data, 1)
+        CommonAssertionUtils.are_equal(persistence_service.saved_data[0][_TestDataStore.get_identifier()]['test_value'], 2)
+        CommonAssertionUtils.is_true(data_manager.save())
+        CommonAssertionUtils.has_length(persistence_service.saved_data, 1)
+
+        # Retrieving a missing value stores its default value.
+        data_store.get_value_by_key('test_list').append(1)
+        CommonAssertionUtils.is_true(data_manager.save())
+        CommonAssertionUtils.has_length(persistence_service.saved_data, 2)
+        # Values that can be modified in place are treated as changed once retrieved.
+        data_store.get_value_by_key('test_list').append(2)
+        CommonAssertionUtils.is_true(data_manager.save())
+        CommonAssertionUtils.has_length(persistence_service.saved_data, 3)
+        CommonAssertionUtils.are_equal(persistence_service.saved_data[2][_TestDataStore.get_identifier()]['test_list'], [1, 2])
+
+    @staticmethod
+    @CommonTestService.test()
+    def _mark_dirty_should_be_required_when_opted_out_of_mutable_reads() -> None:
+        data_store = _TestMarkDirtyDataStore()
+        data_store.has_unsaved_changes = False
+        data_store.get_value_by_key('test_list').append(1)
+        CommonAssertionUtils.is_false(data_store.has_unsaved_changes)
+        data_store.mark_dirty('test_list')
+        CommonAssertionUtils.is_true(data_store.has_unsaved_changes)
+
+    @staticmethod
+    @CommonTestService.test()
+    def _decoded_values_should_not_be_stale() -> None:
+        data_store = _TestDataStore()
+        data_store.set_value_by_key('test_list', [1])
+        decoded_list = data_store.get_value_by_key('test_list', decode=list)
+        decoded_list.append(2)
+        # Results that can be modified in place are decoded again for every caller.
+        CommonAssertionUtils.are_equal(data_store.get_value_by_key('test_list', decode=list), [1])
+        CommonAssertionUtils.are_equal(data_store.get_value_by_key('test_list', decode=tuple), (1,))
+        data_store.get_value_by_key('test_list').append(3)
+        data_store.mark_dirty('test_list')
+        CommonAssertionUtils.are_equal(data_store.get_value_by_key('test_list', decode=tuple), (1, 3))
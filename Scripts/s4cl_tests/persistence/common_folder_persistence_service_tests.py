@@ -0,0 +1,97 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import os
+import random
+import shutil
+import tempfile
+from typing import Any, Dict
+
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.persistence.persistence_services.common_folder_persistence_service import \
+    CommonFolderPersistenceService
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+from sims4communitylib.utils.common_collection_utils import CommonCollectionUtils
+
+
+def _merge_dict_one_file_at_a_time(destination: Dict[Any, Any], source: Dict[Any, Any], prefer_source_values: bool=True, allow_duplicates_in_collections: bool=True) -> Dict[Any, Any]:
+    # The merge used before files were merged in place, copying the destination and comparing every collection value one by one.
+    merged = destination.copy()
+    for (source_key, source_val) in source.items():
+        if source_key in merged:
+            destination_val = merged[source_key]
+            if isinstance(source_val, dict) and isinstance(destination_val, dict):
+                merged[source_key] = _merge_dict_one_file_at_a_time(destination_val, source_val, allow_duplicates_in_collections=allow_duplicates_in_collections)
+            elif CommonCollectionUtils.is_collection(source_val) and CommonCollectionUtils.is_collection(destination_val):
+                if allow_duplicates_in_collections:
+                    if prefer_source_values:
+                        merged[source_key] = (*source_val, *destination_val)
+                    else:
+                        merged[source_key] = (*destination_val, *source_val)
+                else:
+                    new_collection = list(destination_val)
+                    for val in source_val:
+                        if val not in new_collection:
+                            new_collection.append(val)
+                    merged[source_key] = tuple(new_collection)
+            elif source_val == destination_val:
+                continue
+            elif prefer_source_values:
+                merged[source_key] = source_val
+        else:
+            merged[source_key] = source_val
+    return merged
+
+
+def _create_random_value(data_random: random.Random, depth: int) -> Any:
+    value_type = data_random.randrange(6 if depth < 3 else 3)
+    if value_type == 0:
+        return data_random.randrange(5)
+    if value_type == 1:
+        return data_random.choice(('a', 'b', 'c', True, False, None, 1.5))
+    if value_type == 2:
+        return [data_random.choice((1, 2, 3, 'a', 'b', True, 1.0)) for _ in range(data_random.randrange(6))]
+    if value_type == 3:
+        return [_create_random_value(data_random, depth + 1) for _ in range(data_random.randrange(4))]
+    return {f'key_{data_random.randrange(6)}': _create_random_value(data_random, depth + 1) for _ in range(data_random.randrange(5))}
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity())
+class CommonFolderPersistenceServiceTests:
+    @staticmethod
+    @CommonTestService.test(True)
+    @CommonTestService.test(False)
+    def _load_should_match_merging_one_file_at_a_time(allow_duplicates_in_collections: bool) -> None:
+        mod_identity = ModInfo.get_identity()
+        data_random = random.Random(1234)
+        data_folder_path = tempfile.mkdtemp()
+        try:
+            persistence_service = CommonFolderPersistenceService(allow_duplicates_in_collections=allow_duplicates_in_collections, data_folder_path=data_folder_path, create_combined_file=False)
+            # noinspection PyProtectedMember
+            folder_path = persistence_service._folder_path(mod_identity)
+            os.makedirs(folder_path, exist_ok=True)
+            file_names = [f'preset_{index}.json' for index in range(40)] + ['Preset_Upper.json', 'main.json']
+            file_data = dict()
+            for file_name in file_names:
+                file_data[file_name] = {f'key_{index}': _create_random_value(data_random, 0) for index in range(20)}
+                with open(os.path.join(folder_path, file_name), mode='w', encoding='utf-8') as file:
+                    file.write(json.dumps(file_data[file_name]))
+
+            expected_data = dict()
+            expected_file_names = ['main.json']
+            for file_name in sorted(file_names[:-1], key=lambda _file_name: (_file_name.upper(), _file_name)):
+                expected_file_names.append(file_name)
+                expected_data = _merge_dict_one_file_at_a_time(expected_data, file_data[file_name], allow_duplicates_in_collections=allow_duplicates_in_collections)
+            expected_data = _merge_dict_one_file_at_a_time(expected_data, file_data['main.json'], allow_duplicates_in_collections=allow_duplicates_in_collections)
+            expected_data['loaded_file_names'] = expected_file_names
+
+            CommonAssertionUtils.are_equal(json.dumps(persistence_service.load(mod_identity)), json.dumps(expected_data))
+        finally:
+            shutil.rmtree(data_folder_path, ignore_errors=True)
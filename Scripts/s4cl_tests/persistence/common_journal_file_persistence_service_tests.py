@@ -0,0 +1,50 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+import shutil
+import tempfile
+
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.persistence.persistence_services.common_journal_file_persistence_service import \
+    CommonJournalFilePersistenceService
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity())
+class CommonJournalFilePersistenceServiceTests:
+    @staticmethod
+    @CommonTestService.test()
+    def _load_should_replay_committed_changes_over_snapshot() -> None:
+        mod_identity = ModInfo.get_identity()
+        data_folder_path = tempfile.mkdtemp()
+        try:
+            persistence_service = CommonJournalFilePersistenceService(per_save=False, data_folder_path=data_folder_path, compaction_ratio=100.0)
+            data = {'sim_data': {'1': {'value': 1}, '2': {'value': 2}, 'version': 1}}
+            CommonAssertionUtils.is_true(persistence_service.save(mod_identity, data))
+            # noinspection PyProtectedMember
+            file_path = persistence_service._file_path(mod_identity)
+            # noinspection PyProtectedMember
+            journal_file_path = persistence_service._journal_file_path(file_path)
+            CommonAssertionUtils.is_false(os.path.exists(journal_file_path))
+
+            data = {'sim_data': {'1': {'value': 10}, '3': {'value': 3}, 'version': 1}}
+            CommonAssertionUtils.is_true(persistence_service.save(mod_identity, data))
+            CommonAssertionUtils.is_true(os.path.exists(journal_file_path))
+            CommonAssertionUtils.is_true(persistence_service.load(mod_identity) == data)
+
+            # A save interrupted while appending to the journal is not loaded, nor does it hide later saves.
+            with open(journal_file_path, mode='a', encoding='utf-8') as file:
+                file.write('["s","sim_data","1",{"val')
+            CommonAssertionUtils.is_true(persistence_service.load(mod_identity) == data)
+            data = {'sim_data': {'3': {'value': 3}, 'version': 1}}
+            CommonAssertionUtils.is_true(persistence_service.save(mod_identity, data))
+            CommonAssertionUtils.is_true(persistence_service.load(mod_identity) == data)
+        finally:
+            shutil.rmtree(data_folder_path, ignore_errors=True)
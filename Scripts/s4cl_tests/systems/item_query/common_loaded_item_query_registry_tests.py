@@ -0,0 +1,274 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+from typing import Any, Tuple, Dict, Set, List
+
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.systems.item_query.common_loaded_item_query_registry import CommonLoadedItemQueryRegistry
+from sims4communitylib.systems.item_query.common_loaded_item_registry import CommonLoadedItemRegistry
+from sims4communitylib.systems.item_query.dtos.common_loaded_item import CommonLoadedItem
+from sims4communitylib.systems.item_query.enums.common_query_method_type import CommonQueryMethodType
+from sims4communitylib.systems.item_query.query.common_loaded_item_filter import CommonLoadedItemFilter
+from sims4communitylib.systems.item_query.query.common_loaded_item_filter_request import CommonLoadedItemFilterRequest
+from sims4communitylib.systems.item_query.query.common_loaded_item_key import CommonLoadedItemKey
+from sims4communitylib.systems.item_query.query.common_loaded_item_organizer import CommonLoadedItemOrganizer
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+# Each test item has one value for each key type, chosen from this many possible values. Filters also ask for values that no item has.
+_VALUE_COUNT_BY_KEY_TYPE: Tuple[int, ...] = (3, 8, 24)
+_ITEM_COUNT = 600
+_REQUEST_COUNT = 250
+
+
+class _TestLoadedItem(CommonLoadedItem):
+    @classmethod
+    def get_mod_identity(cls) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    @classmethod
+    def get_log_identifier(cls) -> str:
+        return 's4cl_test_loaded_item'
+
+    def __init__(self, index: int, tags: Tuple[int, ...]):
+        self._index = index
+        super().__init__(tags, is_original=True)
+
+    def _get_identifier(self) -> str:
+        return f'test_item_{self._index}'
+
+
+class _TestItemOrganizer(CommonLoadedItemOrganizer):
+    def get_key_values(self, item: _TestLoadedItem) -> Tuple[Any]:
+        return item.tags[self.key_type],
+
+
+class _TestItemFilter(CommonLoadedItemFilter):
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    @property
+    def log_identifier(self) -> str:
+        return 's4cl_test_item_filter'
+
+    def __init__(self, key_type: int, values: Tuple[int, ...], match_all: bool, match_at_least_one: bool = False, exclude: bool = False):
+        super().__init__(match_all, match_at_least_one=match_at_least_one, exclude=exclude)
+        self._keys = tuple([CommonLoadedItemKey(key_type, value) for value in values])
+
+    def get_keys(self) -> Tuple[CommonLoadedItemKey]:
+        return self._keys
+
+
+class _TestItemRegistry(CommonLoadedItemRegistry):
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    @property
+    def log_identifier(self) -> str:
+        return 's4cl_test_item_registry'
+
+
+class _TestItemQueryRegistry(CommonLoadedItemQueryRegistry):
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    @property
+    def log_identifier(self) -> str:
+        return 's4cl_test_item_query_registry'
+
+    @property
+    def _registry(self) -> CommonLoadedItemRegistry:
+        return self._test_item_registry
+
+
+def _create_query_registry() -> _TestItemQueryRegistry:
+    item_registry: _TestItemRegistry = _TestItemRegistry.create_standalone_instance()
+    item_registry.loaded_items = dict()
+    item_registry._loaded = True
+    query_registry: _TestItemQueryRegistry = _TestItemQueryRegistry.create_standalone_instance()
+    query_registry._test_item_registry = item_registry
+    for key_type in range(len(_VALUE_COUNT_BY_KEY_TYPE)):
+        query_registry.add_item_organizer(_TestItemOrganizer, key_type)
+    tag_random = random.Random(_ITEM_COUNT)
+    query_registry._organize(tuple([_TestLoadedItem(index, tuple([tag_random.randrange(value_count) for value_count in _VALUE_COUNT_BY_KEY_TYPE])) for index in range(_ITEM_COUNT)]))
+    return query_registry
+
+
+def _create_requests(query_type: CommonQueryMethodType) -> List[CommonLoadedItemFilterRequest]:
+    request_random = random.Random(int(query_type))
+    requests: List[CommonLoadedItemFilterRequest] = list()
+    for _ in range(_REQUEST_COUNT):
+        item_filters: List[_TestItemFilter] = list()
+        for _filter_index in range(request_random.randrange(0, 5)):
+            key_type = request_random.randrange(len(_VALUE_COUNT_BY_KEY_TYPE))
+            # Values past the value count of the key type are not within the item library.
+            values = tuple(set([request_random.randrange(_VALUE_COUNT_BY_KEY_TYPE[key_type] + 2) for _value_index in range(request_random.randrange(1, 4))]))
+            filter_type = request_random.randrange(4)
+            item_filters.append(_TestItemFilter(key_type, values, filter_type == 0, match_at_least_one=filter_type == 1, exclude=filter_type == 2))
+        requests.append(CommonLoadedItemFilterRequest(item_filters, tuple(), query_type=query_type))
+    return requests
+
+
+def _query_by_reference(item_library: Dict[Tuple[Any, Any], Set[str]], request: CommonLoadedItemFilterRequest) -> Set[str]:
+    # The key filtering used by queries prior to the query planner, using the sets of the item library.
+    all_keys = request.include_all_keys
+    any_keys = request.include_any_keys
+    found_item_identifiers = None
+    for match_at_least_one_key_set in request.must_match_at_least_one_key_sets:
+        total_matching_items = None
+        for match_at_least_one_key in match_at_least_one_key_set:
+            if match_at_least_one_key is None or match_at_least_one_key.key not in item_library:
+                continue
+            new_found_items = item_library[match_at_least_one_key.key]
+            total_matching_items = new_found_items if total_matching_items is None else total_matching_items | new_found_items
+        if not total_matching_items:
+            return set()
+        found_item_identifiers = total_matching_items if found_item_identifiers is None else found_item_identifiers & total_matching_items
+
+    for include_all_key in all_keys:
+        if include_all_key is None:
+            continue
+        if include_all_key.key not in item_library:
+            return set()
+        new_found_items = item_library[include_all_key.key]
+        found_item_identifiers = new_found_items if found_item_identifiers is None else found_item_identifiers & new_found_items
+    if found_item_identifiers is None and all_keys:
+        return set()
+
+    found_items_via_any_keys = set()
+    for include_any_key in any_keys:
+        if include_any_key is None or include_any_key.key not in item_library:
+            continue
+        found_items_via_any_keys = found_items_via_any_keys | item_library[include_any_key.key]
+    if found_item_identifiers is None:
+        return found_items_via_any_keys
+
+    query_type = request.query_type
+    if not any_keys and (query_type == CommonQueryMethodType.ALL_INTERSECT_ANY or query_type == CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE):
+        query_type = CommonQueryMethodType.ALL_PLUS_ANY
+    if query_type == CommonQueryMethodType.ALL_PLUS_ANY:
+        found_item_identifiers = found_item_identifiers | found_items_via_any_keys
+    elif query_type == CommonQueryMethodType.ALL_INTERSECT_ANY:
+        found_item_identifiers = found_item_identifiers & found_items_via_any_keys
+    if query_type == CommonQueryMethodType.ALL_PLUS_ANY_MUST_HAVE_ONE:
+        if not found_items_via_any_keys:
+            return set()
+        found_item_identifiers = found_item_identifiers | found_items_via_any_keys
+    elif query_type == CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE:
+        if not found_items_via_any_keys:
+            return set()
+        found_item_identifiers = found_item_identifiers & found_items_via_any_keys
+    if not found_item_identifiers:
+        return set()
+
+    for exclude_key in request.exclude_keys:
+        if exclude_key is None or exclude_key.key not in item_library:
+            continue
+        found_item_identifiers = found_item_identifiers - item_library[exclude_key.key]
+    return found_item_identifiers
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity())
+class CommonLoadedItemQueryRegistryTests:
+    @staticmethod
+    @CommonTestService.test(CommonQueryMethodType.ALL_PLUS_ANY)
+    @CommonTestService.test(CommonQueryMethodType.ALL_INTERSECT_ANY)
+    @CommonTestService.test(CommonQueryMethodType.ALL_PLUS_ANY_MUST_HAVE_ONE)
+    @CommonTestService.test(CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE)
+    def _query_should_match_reference_query(query_type: CommonQueryMethodType) -> None:
+        query_registry = _create_query_registry()
+        item_library = query_registry.item_library
+        for request in _create_requests(query_type):
+            expected_item_identifiers = _query_by_reference(item_library, request)
+            item_identifiers = set([item.identifier for item in query_registry._query_items(request, request.item_tests)])
+            CommonAssertionUtils.are_equal(item_identifiers, expected_item_identifiers, message=str(request))
+
+    @staticmethod
+    @CommonTestService.test(CommonQueryMethodType.ALL_PLUS_ANY)
+    @CommonTestService.test(CommonQueryMethodType.ALL_INTERSECT_ANY)
+    @CommonTestService.test(CommonQueryMethodType.ALL_PLUS_ANY_MUST_HAVE_ONE)
+    @CommonTestService.test(CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE)
+    def _query_should_return_nothing_when_all_key_is_missing(query_type: CommonQueryMethodType) -> None:
+        query_registry = _create_query_registry()
+        request = CommonLoadedItemFilterRequest((
+            _TestItemFilter(0, (0,), True),
+            _TestItemFilter(1, (_VALUE_COUNT_BY_KEY_TYPE[1],), True),
+            _TestItemFilter(2, (0, 1), False),
+        ), tuple(), query_type=query_type)
+        CommonAssertionUtils.has_length(tuple(query_registry._query_items(request, request.item_tests)), 0)
+
+    @staticmethod
+    @CommonTestService.test(CommonQueryMethodType.ALL_PLUS_ANY, True)
+    @CommonTestService.test(CommonQueryMethodType.ALL_INTERSECT_ANY, False)
+    @CommonTestService.test(CommonQueryMethodType.ALL_PLUS_ANY_MUST_HAVE_ONE, True)
+    @CommonTestService.test(CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE, False)
+    def _query_should_only_return_any_key_items_when_plus_and_all_keys_match_nothing(query_type: CommonQueryMethodType, has_items: bool) -> None:
+        query_registry = _create_query_registry()
+        request = CommonLoadedItemFilterRequest((
+            _TestItemFilter(0, (0,), True),
+            _TestItemFilter(0, (1,), True),
+            _TestItemFilter(2, (3,), False),
+        ), tuple(), query_type=query_type)
+        item_identifiers = set([item.identifier for item in query_registry._query_items(request, request.item_tests)])
+        expected_item_identifiers = query_registry.item_library[(2, 3)] if has_items else set()
+        CommonAssertionUtils.are_equal(item_identifiers, expected_item_identifiers)
+
+    @staticmethod
+    @CommonTestService.test()
+    def _query_cache_should_return_cached_items_for_equivalent_requests() -> None:
+        query_registry = _create_query_registry()
+        query_registry.max_cached_queries = 8
+        request = CommonLoadedItemFilterRequest((
+            _TestItemFilter(0, (0, 1), True),
+            _TestItemFilter(2, (3, 5), False),
+        ), tuple(), query_type=CommonQueryMethodType.ALL_PLUS_ANY)
+        # The same keys in a different order.
+        equivalent_request = CommonLoadedItemFilterRequest((
+            _TestItemFilter(2, (5, 3), False),
+            _TestItemFilter(0, (1, 0), True),
+        ), tuple(), query_type=CommonQueryMethodType.ALL_PLUS_ANY)
+        item_identifiers = set([item.identifier for item in query_registry._query_items(request, request.item_tests)])
+        cached_item_identifiers = set([item.identifier for item in query_registry._query_items(equivalent_request, equivalent_request.item_tests)])
+        CommonAssertionUtils.are_equal(cached_item_identifiers, item_identifiers)
+        CommonAssertionUtils.are_equal(query_registry.query_cache_misses, 1)
+        CommonAssertionUtils.are_equal(query_registry.query_cache_hits, 1)
+
+    @staticmethod
+    @CommonTestService.test()
+    def _query_cache_should_be_discarded_when_items_change() -> None:
+        query_registry = _create_query_registry()
+        query_registry.max_cached_queries = 8
+        request = CommonLoadedItemFilterRequest((_TestItemFilter(1, (2,), True),), tuple())
+        tuple(query_registry._query_items(request, request.item_tests))
+        query_registry._organize(tuple(query_registry._items_by_ordinal))
+        tuple(query_registry._query_items(request, request.item_tests))
+        query_registry._registry.add_item(_TestLoadedItem(_ITEM_COUNT, (0, 0, 0)))
+        tuple(query_registry._query_items(request, request.item_tests))
+        CommonAssertionUtils.are_equal(query_registry.query_cache_misses, 3)
+        CommonAssertionUtils.are_equal(query_registry.query_cache_hits, 0)
+
+    @staticmethod
+    @CommonTestService.test(0)
+    @CommonTestService.test(8)
+    def _query_should_return_items_with_verbose_logging_enabled(max_cached_queries: int) -> None:
+        query_registry = _create_query_registry()
+        query_registry.max_cached_queries = max_cached_queries
+        request = CommonLoadedItemFilterRequest((_TestItemFilter(0, (0,), True),), tuple())
+        expected_item_identifiers = query_registry.item_library[(0, 0)]
+        query_registry.verbose_log.enable()
+        try:
+            item_identifiers = set([item.identifier for item in query_registry._query_items(request, request.item_tests)])
+        finally:
+            query_registry.verbose_log.disable()
+        CommonAssertionUtils.is_true(len(expected_item_identifiers) > 0)
+        CommonAssertionUtils.are_equal(item_identifiers, expected_item_identifiers)
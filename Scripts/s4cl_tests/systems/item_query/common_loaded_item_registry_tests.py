@@ -0,0 +1,164 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Tuple, Dict, Set, List, Iterator, Union
+
+from sims4communitylib.classes.testing.common_test_result import CommonTestResult
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.systems.item_query.common_loaded_item_registry import CommonLoadedItemRegistry
+from sims4communitylib.systems.item_query.dtos.common_loaded_item import CommonLoadedItem
+from sims4communitylib.systems.item_query.item_loaders.common_base_item_loader import CommonBaseItemLoader
+from sims4communitylib.systems.item_query.persistence.common_loaded_item_cache import CommonLoadedItemCache
+from sims4communitylib.systems.item_query.persistence.common_loaded_item_cache_service import \
+    CommonLoadedItemCacheService
+from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
+from sims4communitylib.testing.common_test_service import CommonTestService
+
+
+class _TestLoadedItem(CommonLoadedItem):
+    @classmethod
+    def get_mod_identity(cls) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    @classmethod
+    def get_log_identifier(cls) -> str:
+        return 's4cl_test_loaded_item'
+
+    def __init__(self, name: str):
+        self._name = name
+        super().__init__(tuple(), is_original=True)
+
+    def _get_identifier(self) -> str:
+        return self._name
+
+    def verify(self) -> CommonTestResult:
+        return CommonTestResult.TRUE
+
+
+class _TestItemLoader(CommonBaseItemLoader):
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    @property
+    def log_identifier(self) -> str:
+        return 's4cl_test_item_loader'
+
+    @property
+    def snippet_names(self) -> Tuple[str]:
+        return tuple()
+
+    def __init__(self, checksums_by_snippet_name: Dict[str, int]):
+        super().__init__()
+        self.checksums_by_snippet_name = checksums_by_snippet_name
+        self.loaded_snippet_names: List[str] = list()
+
+    def get_checksum_data_gen(self) -> Iterator[Tuple[str, int, int]]:
+        for (snippet_name, checksum) in self.checksums_by_snippet_name.items():
+            yield snippet_name, 0, checksum
+
+    def load_snippets_gen(self, snippet_keys: Set[Tuple[str, int]] = None) -> Iterator[Tuple[str, int, Tuple[_TestLoadedItem, ...]]]:
+        for (snippet_name, checksum) in self.checksums_by_snippet_name.items():
+            if snippet_keys is not None and (snippet_name, 0) not in snippet_keys:
+                continue
+            self.loaded_snippet_names.append(snippet_name)
+            yield snippet_name, 0, tuple([_TestLoadedItem(f'{snippet_name}_{checksum}_{index}') for index in range(3)])
+
+
+class _TestItemCacheService(CommonLoadedItemCacheService):
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    def save_to_cache(self, cache: CommonLoadedItemCache) -> None:
+        self._cache = cache
+
+    def load_from_cache(self) -> Union[CommonLoadedItemCache, None]:
+        return self._cache
+
+    def clear_cache(self) -> None:
+        self._cache = None
+
+    def create_cache(self, objects: Tuple[CommonLoadedItem], checksums: Tuple[Any]) -> CommonLoadedItemCache:
+        return CommonLoadedItemCache(objects, {self.get_checksum_key(snippet_name, snippet_id): checksum for (snippet_name, snippet_id, checksum) in checksums})
+
+
+class _TestItemRegistry(CommonLoadedItemRegistry):
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    @property
+    def log_identifier(self) -> str:
+        return 's4cl_test_item_registry'
+
+    def _get_cache_service(self) -> CommonLoadedItemCacheService:
+        return self._test_cache_service
+
+    def _should_load_asynchronously(self) -> bool:
+        return self._test_load_asynchronously
+
+    def _add_additional_item_data(self, item: CommonLoadedItem) -> None:
+        pass
+
+
+def _create_item_loader(checksums_by_snippet_name: Dict[str, int]) -> _TestItemLoader:
+    return _TestItemLoader.create_standalone_instance(checksums_by_snippet_name)
+
+
+def _create_item_registry(item_loader: _TestItemLoader, load_asynchronously: bool = False) -> _TestItemRegistry:
+    cache_service: _TestItemCacheService = _TestItemCacheService.create_standalone_instance()
+    item_registry: _TestItemRegistry = _TestItemRegistry.create_standalone_instance()
+    item_registry._test_cache_service = cache_service
+    item_registry._test_load_asynchronously = load_asynchronously
+    item_registry.add_item_loader(item_loader)
+    return item_registry
+
+
+def _reload(item_registry: _TestItemRegistry) -> Set[str]:
+    item_registry._loaded = False
+    item_registry.load()
+    return set(item_registry.loaded_items.keys())
+
+
+# noinspection PyMissingOrEmptyDocstring
+@CommonTestService.test_class(ModInfo.get_identity())
+class CommonLoadedItemRegistryTests:
+    @staticmethod
+    @CommonTestService.test()
+    def _load_should_only_reload_snippets_with_changed_checksums() -> None:
+        item_loader = _create_item_loader({'snippet_a': 1, 'snippet_b': 1, 'snippet_c': 1})
+        item_registry = _create_item_registry(item_loader)
+        _reload(item_registry)
+        CommonAssertionUtils.are_equal(item_loader.loaded_snippet_names, ['snippet_a', 'snippet_b', 'snippet_c'])
+        item_loader.loaded_snippet_names.clear()
+        CommonAssertionUtils.are_equal(len(_reload(item_registry)), 9)
+        CommonAssertionUtils.has_length(item_loader.loaded_snippet_names, 0)
+
+        # Change one snippet, remove another, and add a new one.
+        item_loader.checksums_by_snippet_name = {'snippet_a': 1, 'snippet_b': 2, 'snippet_d': 1}
+        item_identifiers = _reload(item_registry)
+        CommonAssertionUtils.are_equal(sorted(item_loader.loaded_snippet_names), ['snippet_b', 'snippet_d'])
+        CommonAssertionUtils.are_equal(item_identifiers, set([f'{snippet_name}_{index}' for snippet_name in ('snippet_a_1', 'snippet_b_2', 'snippet_d_1') for index in range(3)]))
+        item_loader.loaded_snippet_names.clear()
+        CommonAssertionUtils.are_equal(_reload(item_registry), item_identifiers)
+        CommonAssertionUtils.has_length(item_loader.loaded_snippet_names, 0)
+
+    @staticmethod
+    @CommonTestService.test()
+    def _load_should_finish_on_main_thread_when_loading_asynchronously() -> None:
+        item_registry = _create_item_registry(_create_item_loader({'snippet_a': 1, 'snippet_b': 1}), load_asynchronously=True)
+        progress: List[int] = list()
+        item_registry.register_on_loading_progress_callback(progress.append)
+        item_registry.load()
+        # Loading can only finish once the main thread runs the functions queued by the background thread.
+        CommonAssertionUtils.is_false(item_registry.loaded)
+        CommonAssertionUtils.is_true(item_registry.loading)
+        CommonAssertionUtils.is_true(item_registry.wait_until_loaded())
+        CommonAssertionUtils.are_equal(len(item_registry.loaded_items), 6)
+        CommonAssertionUtils.are_equal(progress[-1], 6)
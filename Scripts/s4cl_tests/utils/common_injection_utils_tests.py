@@ -5,7 +5,7 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Any
+from typing import Any, List
 
 from sims4communitylib.modinfo import ModInfo
 from sims4communitylib.testing.common_assertion_utils import CommonAssertionUtils
@@ -34,6 +34,10 @@ class FakeClassToBeOverridden:
     def the_instance_method(self) -> bool:
         return False
 
+    # noinspection PyMissingOrEmptyDocstring
+    def the_stacked_instance_method(self, value: int) -> int:
+        return value
+
 
 # noinspection PyMissingOrEmptyDocstring
 @CommonTestService.test_class(ModInfo.get_identity())
@@ -73,3 +77,27 @@ class CommonInjectionUtilsTests:
             return True
 
         CommonAssertionUtils.is_true(FakeClassToBeOverridden().the_instance_method())
+
+    @staticmethod
+    @CommonTestService.test()
+    def _should_invoke_stacked_injections_and_fall_back_to_original_on_error() -> None:
+        invoked_injections: List[str] = list()
+
+        @CommonInjectionUtils.inject_safely_into(ModInfo.get_identity(), FakeClassToBeOverridden, FakeClassToBeOverridden.the_stacked_instance_method.__name__)
+        def _first_injection(original, self, value: int) -> int:
+            invoked_injections.append('first')
+            return original(self, value) + 1
+
+        # noinspection PyUnusedLocal
+        @CommonInjectionUtils.inject_safely_into(ModInfo.get_identity(), FakeClassToBeOverridden, FakeClassToBeOverridden.the_stacked_instance_method.__name__)
+        def _failing_injection(original, self, value: int) -> int:
+            invoked_injections.append('failing')
+            raise Exception('Expected test exception.')
+
+        @CommonInjectionUtils.inject_safely_into(ModInfo.get_identity(), FakeClassToBeOverridden, FakeClassToBeOverridden.the_stacked_instance_method.__name__, handle_exceptions=False)
+        def _last_injection(original, self, value: int) -> int:
+            invoked_injections.append('last')
+            return original(self, value) + 10
+
+        CommonAssertionUtils.are_equal(FakeClassToBeOverridden().the_stacked_instance_method(100), 111)
+        CommonAssertionUtils.are_equal(invoked_injections, ['last', 'failing', 'first'])
@@ -128,9 +128,8 @@ class CommonRunnable(HasClassLog, Generic[CommonRunnableContextType]):
 
     def _stop_updater(self) -> None:
         if self._update_dispatcher is not None:
-            if self._update_dispatcher in CommonIntervalEventRegistry()._registered_interval_trackers:
-                self.log.format_with_message('Removing update dispatcher from interval trackers.')
-                CommonIntervalEventRegistry()._registered_interval_trackers.remove(self._update_dispatcher)
+            if CommonIntervalEventRegistry().unregister_dispatcher(self._update_dispatcher):
+                self.log.format_with_message('Removed update dispatcher from interval trackers.')
             self._update_dispatcher = None
 
         if self._update_alarm is not None:
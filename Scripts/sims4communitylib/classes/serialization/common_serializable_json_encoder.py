@@ -0,0 +1,28 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from json import JSONEncoder
+from typing import Any
+
+from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
+
+
+class CommonSerializableJSONEncoder(JSONEncoder):
+    """CommonSerializableJSONEncoder(*args, **kwargs)
+
+    A JSON encoder that serializes :class:`.CommonSerializable` objects using their serialize function and other objects using their attributes.
+
+    .. note:: Instances keep no state between encodes, so a single instance can be reused to encode many objects.
+    """
+
+    # noinspection PyMissingOrEmptyDocstring
+    def default(self, o: Any) -> Any:
+        if isinstance(o, CommonSerializable):
+            return o.serialize()
+        if hasattr(o, '__dict__'):
+            return o.__dict__
+        return super().default(o)
@@ -0,0 +1,110 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from collections import namedtuple
+from typing import Tuple, List, Any
+
+from sims4.resources import Types
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.services.resources.common_instance_manager_modification_registry import \
+    CommonInstanceManagerModificationRegistry
+from sims4communitylib.services.resources.modification_handlers.common_add_interactions_to_affordance_lists_handler import \
+    CommonAddInteractionsToAffordanceListsModificationHandler
+
+_SyntheticKey = namedtuple('_SyntheticKey', ('type', 'instance'))
+
+
+class _SyntheticInstanceManager:
+    TYPE = Types.SNIPPET
+
+    def __init__(self, affordance_list_count: int, affordance_count: int) -> None:
+        self._tuned_classes = dict()
+        for instance_id in range(affordance_list_count):
+            affordance_list = type(f'_SyntheticAffordanceList{instance_id}', (object,), {'value': tuple(object() for _ in range(affordance_count))})
+            self._tuned_classes[_SyntheticKey(Types.SNIPPET, instance_id)] = affordance_list
+
+
+class _SyntheticAddInteractionsHandler(CommonAddInteractionsToAffordanceListsModificationHandler):
+    def __init__(self, interactions: List[Any], affordance_list_ids: Tuple[int, ...]) -> None:
+        super().__init__()
+        # Set directly, so the synthetic interactions are not looked up in the instance manager.
+        self._cached_interactions = interactions
+        self._affordance_list_ids = affordance_list_ids
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def interaction_ids(self) -> Tuple[int]:
+        return tuple()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def affordance_list_ids(self) -> Tuple[int]:
+        return self._affordance_list_ids
+
+
+def _create_synthetic_handlers(handler_count: int, interaction_count: int, affordance_list_count: int, affordance_list_count_per_handler: int) -> List[_SyntheticAddInteractionsHandler]:
+    # Handlers share some of their interactions, so some of the additions are duplicates.
+    shared_interactions = [object() for _ in range(interaction_count // 2)]
+    handlers = list()
+    for handler_index in range(handler_count):
+        interactions = shared_interactions + [object() for _ in range(interaction_count - len(shared_interactions))]
+        affordance_list_ids = tuple((handler_index + offset) % affordance_list_count for offset in range(affordance_list_count_per_handler))
+        handlers.append(_SyntheticAddInteractionsHandler(interactions, affordance_list_ids))
+    return handlers
+
+
+def _apply_one_at_a_time(handler: CommonAddInteractionsToAffordanceListsModificationHandler, instance_manager: Any) -> None:
+    # Mirrors the modifications applied by each handler prior to gathering the additions across handlers.
+    for instance in handler._load_instances_from_manager(instance_manager, handler.affordance_list_ids):
+        new_interactions = list()
+        for interaction_instance_to_add in handler._interaction_instances_gen():
+            if interaction_instance_to_add in instance.value:
+                continue
+            new_interactions.append(interaction_instance_to_add)
+        if not new_interactions:
+            continue
+        instance.value += tuple(new_interactions)
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_affordance_list_additions',
+    'Compare the time taken to add interactions to synthetic affordance lists one handler at a time against gathering the additions of all handlers first.',
+    command_arguments=(
+        CommonConsoleCommandArgument('handler_count', 'Number', 'The number of synthetic modification handlers to register.', is_optional=True, default_value='40'),
+        CommonConsoleCommandArgument('interaction_count', 'Number', 'The number of interactions each synthetic modification handler adds.', is_optional=True, default_value='40'),
+        CommonConsoleCommandArgument('affordance_count', 'Number', 'The number of affordances each synthetic affordance list starts with.', is_optional=True, default_value='10000'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_affordance_list_additions(output: CommonConsoleCommandOutput, handler_count: int=40, interaction_count: int=40, affordance_count: int=10000):
+    affordance_list_count = 10
+    affordance_list_count_per_handler = 3
+    stop_watch = CommonStopWatch()
+    output(f'Benchmarking affordance list additions with {handler_count} handler(s) adding {interaction_count} interaction(s) each to {affordance_list_count_per_handler} of {affordance_list_count} affordance list(s) of {affordance_count} affordance(s).')
+    instance_manager = _SyntheticInstanceManager(affordance_list_count, affordance_count)
+    handlers = _create_synthetic_handlers(handler_count, interaction_count, affordance_list_count, affordance_list_count_per_handler)
+    stop_watch.start()
+    for handler in handlers:
+        _apply_one_at_a_time(handler, instance_manager)
+    one_at_a_time_milliseconds = stop_watch.stop_milliseconds()
+    one_at_a_time_values = [affordance_list.value for affordance_list in instance_manager._tuned_classes.values()]
+
+    modification_registry: CommonInstanceManagerModificationRegistry = CommonInstanceManagerModificationRegistry.create_standalone_instance()
+    for handler in handlers:
+        modification_registry.register_handler(handler)
+    instance_manager = _SyntheticInstanceManager(affordance_list_count, affordance_count)
+    stop_watch.start()
+    modification_registry._try_modify(instance_manager)
+    gathered_milliseconds = stop_watch.stop_milliseconds()
+    gathered_values = [affordance_list.value for affordance_list in instance_manager._tuned_classes.values()]
+    added_counts_match = [len(value) for value in one_at_a_time_values] == [len(value) for value in gathered_values]
+    output(f'One At A Time: {one_at_a_time_milliseconds:.3f}ms, Gathered: {gathered_milliseconds:.3f}ms, Same Number Of Affordances Added: {added_counts_match}')
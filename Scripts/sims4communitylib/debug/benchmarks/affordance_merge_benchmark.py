@@ -0,0 +1,81 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Tuple, List, Any
+
+from objects.script_object import ScriptObject
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.services.interactions.interaction_registration_service import CommonInteractionRegistry, \
+    CommonScriptObjectInteractionHandler, CommonInteractionType
+
+# The number of affordances each synthetic object type starts with.
+_AFFORDANCE_COUNT_PER_OBJECT_TYPE = 150
+
+
+class _SyntheticInteractionHandler(CommonScriptObjectInteractionHandler):
+    def __init__(self, interactions: List[Any], object_type_divisor: int, depends_only_on_object_type: bool) -> None:
+        super().__init__()
+        # Set directly, so the synthetic interactions are not looked up in the instance manager.
+        self._cached_interactions_to_add = interactions
+        self._object_type_divisor = object_type_divisor
+        self._depends_only_on_object_type = depends_only_on_object_type
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def interactions_to_add(self) -> Tuple[int]:
+        return tuple()
+
+    # noinspection PyMissingOrEmptyDocstring
+    def should_add(self, script_object: ScriptObject, *args, **kwargs) -> bool:
+        return type(script_object).synthetic_index % self._object_type_divisor == 0
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def should_add_depends_only_on_object_type(self) -> bool:
+        return self._depends_only_on_object_type
+
+
+def _create_synthetic_registry(handler_count: int, interaction_count: int, depends_only_on_object_type: bool) -> CommonInteractionRegistry:
+    interaction_registry: CommonInteractionRegistry = CommonInteractionRegistry.create_standalone_instance()
+    for handler_index in range(handler_count):
+        interactions = [object() for _ in range(interaction_count)]
+        interaction_handler = _SyntheticInteractionHandler(interactions, handler_index % 3 + 1, depends_only_on_object_type)
+        interaction_registry.register_handler(interaction_handler, CommonInteractionType.ON_SCRIPT_OBJECT_LOAD)
+    return interaction_registry
+
+
+def _create_synthetic_objects(object_count: int, object_type_count: int) -> List[Any]:
+    object_types = [type(f'_SyntheticScriptObject{index}', (object,), {'_super_affordances': tuple(object() for _ in range(_AFFORDANCE_COUNT_PER_OBJECT_TYPE)), 'synthetic_index': index}) for index in range(object_type_count)]
+    return [object_types[index % object_type_count]() for index in range(object_count)]
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_affordance_merge',
+    'Compare the time taken to add the interactions of handlers to synthetic script objects when merged for each object against merged once for each object type.',
+    command_arguments=(
+        CommonConsoleCommandArgument('object_count', 'Number', 'The number of synthetic script objects to add.', is_optional=True, default_value='2000'),
+        CommonConsoleCommandArgument('object_type_count', 'Number', 'The number of types the synthetic script objects are spread across.', is_optional=True, default_value='50'),
+        CommonConsoleCommandArgument('handler_count', 'Number', 'The number of synthetic interaction handlers to register.', is_optional=True, default_value='20'),
+        CommonConsoleCommandArgument('interaction_count', 'Number', 'The number of interactions each synthetic interaction handler adds.', is_optional=True, default_value='10'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_affordance_merge(output: CommonConsoleCommandOutput, object_count: int=2000, object_type_count: int=50, handler_count: int=20, interaction_count: int=10):
+    stop_watch = CommonStopWatch()
+    output(f'Benchmarking affordance merge with {object_count} object(s) across {object_type_count} type(s), {handler_count} handler(s) and {interaction_count} interaction(s) per handler.')
+    for (label, depends_only_on_object_type) in (('Merged Per Object', False), ('Merged Per Object Type', True)):
+        interaction_registry = _create_synthetic_registry(handler_count, interaction_count, depends_only_on_object_type)
+        script_objects = _create_synthetic_objects(object_count, object_type_count)
+        stop_watch.start()
+        for script_object in script_objects:
+            interaction_registry.on_script_object_add(script_object)
+        output(f'{label}: {stop_watch.stop_milliseconds():.3f}ms')
@@ -0,0 +1,55 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+from typing import Any, Callable
+
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.utils.common_environment import CommonEnvironment
+from sims4communitylib.utils.common_log_utils import CommonLogUtils
+
+
+def _resolve_mod_data_location_path() -> str:
+    # How the mod_data folder was resolved on every call before the environment was resolved once.
+    # noinspection PyProtectedMember
+    return os.path.join(CommonEnvironment._resolve_mods_location_path(), 'mod_data')
+
+
+def _resolve_sims_documents_location_path() -> str:
+    # noinspection PyProtectedMember
+    return CommonEnvironment._resolve_sims_documents_location_path(CommonEnvironment._resolve_mods_location_path())
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_environment',
+    'Compare the time taken to resolve the folders S4CL uses on each call against reading them from the environment resolved once.',
+    command_arguments=(
+        CommonConsoleCommandArgument('call_count', 'Number', 'The number of times to retrieve each folder.', is_optional=True, default_value='100000'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_environment(output: CommonConsoleCommandOutput, call_count: int=100000):
+    stop_watch = CommonStopWatch()
+
+    def _benchmark_calls(func: Callable[[], Any]) -> float:
+        stop_watch.start()
+        for _ in range(call_count):
+            func()
+        return stop_watch.stop_milliseconds() * 1000 / call_count
+
+    output(f'Benchmarking the environment with {call_count} call(s).')
+    stop_watch.start()
+    CommonEnvironment.reload()
+    output(f'Resolve Environment: {stop_watch.stop_milliseconds():.3f}ms')
+    output(f'Mod Data Location: Resolved {_benchmark_calls(_resolve_mod_data_location_path):.2f}us, Environment {_benchmark_calls(CommonLogUtils.get_mod_data_location_path):.2f}us per call')
+    output(f'Sims Documents Location: Resolved {_benchmark_calls(_resolve_sims_documents_location_path):.2f}us, Environment {_benchmark_calls(CommonLogUtils.get_sims_documents_location_path):.2f}us per call')
+    output(f'Exceptions File Path: {_benchmark_calls(lambda: CommonLogUtils.get_exceptions_file_path(ModInfo.get_identity())):.2f}us per call')
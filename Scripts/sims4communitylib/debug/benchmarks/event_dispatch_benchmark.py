@@ -0,0 +1,76 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Type, Callable, List
+
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.events.event_handling.common_event import CommonEvent
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.interaction.events.interaction_queued import S4CLInteractionQueuedEvent
+from sims4communitylib.events.zone_update.events.zone_update_event import S4CLZoneUpdateEvent
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+
+
+def _create_event_function(event_type: Type[CommonEvent]) -> Callable[[CommonEvent], bool]:
+    def _handle_event(event_data) -> bool:
+        return True
+    _handle_event.__annotations__['event_data'] = event_type
+    return _handle_event
+
+
+def _create_synthetic_event_registry(handler_count: int) -> CommonEventRegistry:
+    event_registry: CommonEventRegistry = CommonEventRegistry.create_standalone_instance()
+    synthetic_event_types: List[Type[CommonEvent]] = [type('S4CLBenchmarkEvent{}'.format(index), (CommonEvent,), dict()) for index in range(48)]
+    event_types: List[Type[CommonEvent]] = [S4CLZoneUpdateEvent, S4CLInteractionQueuedEvent, *synthetic_event_types]
+    for index in range(handler_count):
+        event_type = event_types[index % len(event_types)]
+        event_registry._register_event_handler(ModInfo.get_identity(), _create_event_function(event_type))
+    return event_registry
+
+
+def _dispatch_by_linear_scan(event_registry: CommonEventRegistry, event: CommonEvent) -> bool:
+    # Mirrors the dispatch behavior prior to the per event type dispatch table.
+    result = True
+    for event_handler in list(event_registry._event_handlers):
+        if not event_handler.can_handle_event(event):
+            continue
+        if not event_handler.handle_event(event):
+            result = False
+    return result
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_event_dispatch',
+    'Compare the per dispatch cost of a linear scan of all event handlers against the per event type dispatch table using synthetic event handlers.',
+    command_arguments=(
+        CommonConsoleCommandArgument('handler_count', 'Number', 'The number of synthetic event handlers to register.', is_optional=True, default_value='500'),
+        CommonConsoleCommandArgument('dispatch_count', 'Number', 'The number of times each event is dispatched.', is_optional=True, default_value='10000'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_event_dispatch(output: CommonConsoleCommandOutput, handler_count: int=500, dispatch_count: int=10000):
+    event_registry = _create_synthetic_event_registry(handler_count)
+    events = (
+        S4CLZoneUpdateEvent(None, False, 0),
+        S4CLInteractionQueuedEvent(None, None),
+    )
+    stop_watch = CommonStopWatch()
+    output(f'Benchmarking event dispatch with {handler_count} handler(s) and {dispatch_count} dispatch(es) per event.')
+    for event in events:
+        stop_watch.start()
+        for _ in range(dispatch_count):
+            _dispatch_by_linear_scan(event_registry, event)
+        linear_scan_milliseconds = stop_watch.stop_milliseconds()
+        stop_watch.start()
+        for _ in range(dispatch_count):
+            event_registry._dispatch(event)
+        dispatch_table_milliseconds = stop_watch.stop_milliseconds()
+        output(f'{event.event_name}: Linear Scan {linear_scan_milliseconds * 1000 / dispatch_count:.3f}us per dispatch, Dispatch Table {dispatch_table_milliseconds * 1000 / dispatch_count:.3f}us per dispatch.')
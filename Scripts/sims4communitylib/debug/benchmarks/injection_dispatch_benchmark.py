@@ -0,0 +1,102 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from functools import wraps
+from typing import Any, Callable, Tuple
+
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.utils.common_injection_utils import CommonInjectionUtils
+
+
+def _create_synthetic_class() -> type:
+    # noinspection PyMissingOrEmptyDocstring
+    class _SyntheticInjectionTarget:
+        def instance_method(self, value: int) -> int:
+            return value
+
+        @classmethod
+        def class_method(cls, value: int) -> int:
+            return value
+
+    return _SyntheticInjectionTarget
+
+
+def _instance_method_injection(original, self, *args, **kwargs) -> Any:
+    return original(self, *args, **kwargs)
+
+
+def _class_method_injection(original, cls, *args, **kwargs) -> Any:
+    return original(*args, **kwargs)
+
+
+def _inject_by_nesting(target_object: type, target_function_name: str, new_function: Callable[..., Any]) -> None:
+    # Mirrors the wrappers installed prior to the injection chains, one wrapper around another for each injection.
+    original_function = getattr(target_object, target_function_name)
+    if isinstance(original_function, type(_create_synthetic_class().class_method)):
+        original_function_func = original_function.__func__
+
+        @wraps(original_function)
+        def _wrapped_class_function(cls, *args, **kwargs) -> Any:
+            try:
+                def _do_original(*_, **__):
+                    return original_function_func(cls, *_, **__)
+
+                return new_function(_do_original, cls, *args, **kwargs)
+            except Exception:
+                return original_function_func(cls, *args, **kwargs)
+        setattr(target_object, target_function_name, classmethod(_wrapped_class_function))
+        return
+
+    @wraps(original_function)
+    def _wrapped_self_function(self, *args, **kwargs) -> Any:
+        try:
+            return new_function(original_function, self, *args, **kwargs)
+        except Exception:
+            return original_function(self, *args, **kwargs)
+    setattr(target_object, target_function_name, _wrapped_self_function)
+
+
+def _create_targets(injection_count: int) -> Tuple[type, type]:
+    nested_target = _create_synthetic_class()
+    chained_target = _create_synthetic_class()
+    for _ in range(injection_count):
+        _inject_by_nesting(nested_target, nested_target.instance_method.__name__, _instance_method_injection)
+        _inject_by_nesting(nested_target, nested_target.class_method.__name__, _class_method_injection)
+        CommonInjectionUtils.inject_safely_into(ModInfo.get_identity(), chained_target, chained_target.instance_method.__name__)(_instance_method_injection)
+        CommonInjectionUtils.inject_safely_into(ModInfo.get_identity(), chained_target, chained_target.class_method.__name__)(_class_method_injection)
+    return nested_target, chained_target
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_injection_dispatch',
+    'Compare the per call cost of nested injection wrappers against injection chains for 1, 5 and 20 injections into the same function of a synthetic class.',
+    command_arguments=(
+        CommonConsoleCommandArgument('call_count', 'Number', 'The number of times to call each injected function.', is_optional=True, default_value='100000'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_injection_dispatch(output: CommonConsoleCommandOutput, call_count: int=100000):
+    stop_watch = CommonStopWatch()
+
+    def _benchmark_calls(func: Callable[[int], int]) -> float:
+        stop_watch.start()
+        for value in range(call_count):
+            func(value)
+        return stop_watch.stop_milliseconds() * 1000 / call_count
+
+    output(f'Benchmarking injection dispatch with {call_count} call(s).')
+    uninjected_target = _create_synthetic_class()
+    output(f'No Injections: Instance Method {_benchmark_calls(uninjected_target().instance_method):.3f}us, Class Method {_benchmark_calls(uninjected_target.class_method):.3f}us per call')
+    for injection_count in (1, 5, 20):
+        (nested_target, chained_target) = _create_targets(injection_count)
+        output(f'{injection_count} Injection(s): Instance Method Nested {_benchmark_calls(nested_target().instance_method):.3f}us, Chained {_benchmark_calls(chained_target().instance_method):.3f}us per call')
+        output(f'{injection_count} Injection(s): Class Method Nested {_benchmark_calls(nested_target.class_method):.3f}us, Chained {_benchmark_calls(chained_target.class_method):.3f}us per call')
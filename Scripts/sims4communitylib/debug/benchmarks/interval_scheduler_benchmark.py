@@ -0,0 +1,79 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import List
+
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.events.interval.common_interval_event_service import CommonIntervalEventRegistry, \
+    CommonIntervalDispatcher
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+
+# Approximately the number of milliseconds between zone updates.
+_MILLISECONDS_PER_UPDATE = 33
+# The number of dispatchers due on every update, the remaining dispatchers only become due after the benchmark ends.
+_FREQUENT_DISPATCHER_COUNT = 5
+
+
+def _get_synthetic_interval_milliseconds(index: int) -> int:
+    if index < _FREQUENT_DISPATCHER_COUNT:
+        return _MILLISECONDS_PER_UPDATE
+    return 3600000 + index
+
+
+def _create_synthetic_interval_registry(dispatcher_count: int) -> CommonIntervalEventRegistry:
+    interval_registry: CommonIntervalEventRegistry = CommonIntervalEventRegistry.create_standalone_instance()
+    for index in range(dispatcher_count):
+        interval_registry._add_tracker(ModInfo.get_identity(), _get_synthetic_interval_milliseconds(index), _on_interval)
+    return interval_registry
+
+
+def _create_synthetic_dispatchers(dispatcher_count: int) -> List[CommonIntervalDispatcher]:
+    return [CommonIntervalDispatcher(ModInfo.get_identity(), _get_synthetic_interval_milliseconds(index), _on_interval) for index in range(dispatcher_count)]
+
+
+def _dispatch_by_linear_scan(dispatchers: List[CommonIntervalDispatcher], milliseconds_since_last_update: int) -> None:
+    # Mirrors the dispatch behavior prior to the dispatcher heap.
+    for dispatcher in list(dispatchers):
+        dispatcher.try_dispatch(milliseconds_since_last_update)
+        if dispatcher.run_once:
+            dispatchers.remove(dispatcher)
+
+
+def _on_interval() -> None:
+    pass
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_interval_dispatch',
+    'Compare the per update cost of checking every interval dispatcher against popping only the due dispatchers from a heap using synthetic dispatchers.',
+    command_arguments=(
+        CommonConsoleCommandArgument('dispatcher_count', 'Number', 'The number of synthetic interval dispatchers to register.', is_optional=True, default_value='5000'),
+        CommonConsoleCommandArgument('update_count', 'Number', 'The number of zone updates to simulate.', is_optional=True, default_value='1000'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_interval_dispatch(output: CommonConsoleCommandOutput, dispatcher_count: int=5000, update_count: int=1000):
+    stop_watch = CommonStopWatch()
+    output(f'Benchmarking interval dispatch with {dispatcher_count} dispatcher(s), {min(dispatcher_count, _FREQUENT_DISPATCHER_COUNT)} of which are due on each of {update_count} update(s).')
+    dispatchers = _create_synthetic_dispatchers(dispatcher_count)
+    stop_watch.start()
+    for _ in range(update_count):
+        _dispatch_by_linear_scan(dispatchers, _MILLISECONDS_PER_UPDATE)
+    linear_scan_milliseconds = stop_watch.stop_milliseconds()
+    stop_watch.start()
+    interval_registry = _create_synthetic_interval_registry(dispatcher_count)
+    registration_milliseconds = stop_watch.stop_milliseconds()
+    stop_watch.start()
+    for _ in range(update_count):
+        interval_registry._attempt_to_dispatch(_MILLISECONDS_PER_UPDATE)
+    heap_milliseconds = stop_watch.stop_milliseconds()
+    output(f'Registration: {registration_milliseconds:.3f}ms for {dispatcher_count} dispatcher(s).')
+    output(f'Dispatch: Linear Scan {linear_scan_milliseconds * 1000 / update_count:.3f}us per update, Heap {heap_milliseconds * 1000 / update_count:.3f}us per update.')
@@ -0,0 +1,182 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import random
+import sys
+from typing import Any, Tuple, Dict, Set, Iterator
+
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.systems.item_query.common_loaded_item_query_registry import CommonLoadedItemQueryRegistry
+from sims4communitylib.systems.item_query.dtos.common_loaded_item import CommonLoadedItem
+from sims4communitylib.systems.item_query.enums.common_query_method_type import CommonQueryMethodType
+from sims4communitylib.systems.item_query.query.common_loaded_item_filter import CommonLoadedItemFilter
+from sims4communitylib.systems.item_query.query.common_loaded_item_filter_request import CommonLoadedItemFilterRequest
+from sims4communitylib.systems.item_query.query.common_loaded_item_key import CommonLoadedItemKey
+from sims4communitylib.systems.item_query.query.common_loaded_item_organizer import CommonLoadedItemOrganizer
+
+# Each synthetic item has one value for each key type, chosen from this many possible values.
+_VALUE_COUNT_BY_KEY_TYPE: Tuple[int, ...] = (4, 16, 64, 256)
+
+
+class _S4CLBenchmarkLoadedItem(CommonLoadedItem):
+    # noinspection PyMissingOrEmptyDocstring
+    @classmethod
+    def get_mod_identity(cls) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @classmethod
+    def get_log_identifier(cls) -> str:
+        return 's4cl_benchmark_loaded_item'
+
+    def __init__(self, index: int, tags: Tuple[int, ...]):
+        self._index = index
+        super().__init__(tags, is_original=True)
+
+    def _get_identifier(self) -> str:
+        return f'benchmark_item_{self._index}'
+
+
+class _S4CLBenchmarkItemOrganizer(CommonLoadedItemOrganizer):
+    # noinspection PyMissingOrEmptyDocstring
+    def get_key_values(self, item: _S4CLBenchmarkLoadedItem) -> Tuple[Any]:
+        return item.tags[self.key_type],
+
+
+class _S4CLBenchmarkItemFilter(CommonLoadedItemFilter):
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 's4cl_benchmark_item_filter'
+
+    def __init__(self, key_type: int, values: Tuple[int, ...], match_all: bool, match_at_least_one: bool = False, exclude: bool = False):
+        super().__init__(match_all, match_at_least_one=match_at_least_one, exclude=exclude)
+        self._keys = tuple([CommonLoadedItemKey(key_type, value) for value in values])
+
+    # noinspection PyMissingOrEmptyDocstring
+    def get_keys(self) -> Tuple[CommonLoadedItemKey]:
+        return self._keys
+
+
+class _S4CLBenchmarkItemQueryRegistry(CommonLoadedItemQueryRegistry):
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 's4cl_benchmark_item_query_registry'
+
+
+def _create_synthetic_query_registry(item_count: int) -> Tuple[_S4CLBenchmarkItemQueryRegistry, Tuple[_S4CLBenchmarkLoadedItem, ...]]:
+    query_registry: _S4CLBenchmarkItemQueryRegistry = _S4CLBenchmarkItemQueryRegistry.create_standalone_instance()
+    for key_type in range(len(_VALUE_COUNT_BY_KEY_TYPE)):
+        query_registry.add_item_organizer(_S4CLBenchmarkItemOrganizer, key_type)
+    # Seeded, so every run organizes the same items.
+    tag_random = random.Random(item_count)
+    items = tuple([_S4CLBenchmarkLoadedItem(index, tuple([tag_random.randrange(value_count) for value_count in _VALUE_COUNT_BY_KEY_TYPE])) for index in range(item_count)])
+    query_registry._organize(items)
+    return query_registry, items
+
+
+def _create_requests() -> Tuple[CommonLoadedItemFilterRequest, ...]:
+    return (
+        CommonLoadedItemFilterRequest((
+            _S4CLBenchmarkItemFilter(0, (1,), True),
+            _S4CLBenchmarkItemFilter(1, (2, 3, 5, 7), False),
+        ), tuple(), query_type=CommonQueryMethodType.ALL_INTERSECT_ANY),
+        CommonLoadedItemFilterRequest((
+            _S4CLBenchmarkItemFilter(0, (2,), True),
+            _S4CLBenchmarkItemFilter(2, tuple(range(0, 64, 2)), False),
+            _S4CLBenchmarkItemFilter(3, tuple(range(0, 256, 3)), False, exclude=True),
+        ), tuple(), query_type=CommonQueryMethodType.ALL_PLUS_ANY),
+        CommonLoadedItemFilterRequest((
+            _S4CLBenchmarkItemFilter(1, (1, 4, 9), False, match_at_least_one=True),
+            _S4CLBenchmarkItemFilter(2, tuple(range(32)), False, match_at_least_one=True),
+            _S4CLBenchmarkItemFilter(0, (3,), False, exclude=True),
+        ), tuple(), query_type=CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE),
+    )
+
+
+def _query_by_sets(item_library: Dict[Tuple[Any, Any], Set[str]], items_by_identifier: Dict[str, CommonLoadedItem], request: CommonLoadedItemFilterRequest) -> Iterator[CommonLoadedItem]:
+    # Mirrors the set operations used by queries prior to item libraries being stored as bitmasks.
+    found_item_identifiers = None
+    for match_at_least_one_key_set in request.must_match_at_least_one_key_sets:
+        total_matching_items = set()
+        for match_at_least_one_key in match_at_least_one_key_set:
+            if match_at_least_one_key.key in item_library:
+                total_matching_items = total_matching_items | item_library[match_at_least_one_key.key]
+        if not total_matching_items:
+            return
+        found_item_identifiers = total_matching_items if found_item_identifiers is None else found_item_identifiers & total_matching_items
+    for include_all_key in request.include_all_keys:
+        if include_all_key.key not in item_library:
+            return
+        new_found_items = item_library[include_all_key.key]
+        found_item_identifiers = new_found_items if found_item_identifiers is None else found_item_identifiers & new_found_items
+    found_items_via_any_keys = set()
+    for include_any_key in request.include_any_keys:
+        if include_any_key.key in item_library:
+            found_items_via_any_keys = found_items_via_any_keys | item_library[include_any_key.key]
+    if found_item_identifiers is None:
+        found_item_identifiers = found_items_via_any_keys
+    elif request.query_type in (CommonQueryMethodType.ALL_INTERSECT_ANY, CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE) and request.include_any_keys:
+        found_item_identifiers = found_item_identifiers & found_items_via_any_keys
+    else:
+        found_item_identifiers = found_item_identifiers | found_items_via_any_keys
+    for exclude_key in request.exclude_keys:
+        if exclude_key.key in item_library:
+            found_item_identifiers = found_item_identifiers - item_library[exclude_key.key]
+    for item_identifier in found_item_identifiers:
+        item = items_by_identifier.get(item_identifier, None)
+        if item is not None:
+            yield item
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_item_query',
+    'Compare the query latency and memory use of item libraries stored as sets of identifiers against item libraries stored as bitmasks using a synthetic item registry.',
+    command_arguments=(
+        CommonConsoleCommandArgument('item_count', 'Number', 'The number of synthetic items to organize.', is_optional=True, default_value='50000'),
+        CommonConsoleCommandArgument('query_count', 'Number', 'The number of times each query is run.', is_optional=True, default_value='20'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_item_query(output: CommonConsoleCommandOutput, item_count: int=50000, query_count: int=20):
+    output(f'Organizing {item_count} synthetic item(s).')
+    query_registry, items = _create_synthetic_query_registry(item_count)
+    item_library = query_registry.item_library
+    items_by_identifier = {item.identifier: item for item in items}
+    set_bytes = sys.getsizeof(item_library) + sum([sys.getsizeof(item_identifiers) for item_identifiers in item_library.values()])
+    bitmask_bytes = sys.getsizeof(query_registry._item_key_masks) + sys.getsizeof(query_registry._items_by_ordinal) + sum([sys.getsizeof(items_mask) for items_mask in query_registry._item_key_masks.values()])
+    output(f'Library Memory: Sets {set_bytes / 1024:.1f}KB, Bitmasks {bitmask_bytes / 1024:.1f}KB for {len(item_library)} key(s).')
+    stop_watch = CommonStopWatch()
+    for (index, request) in enumerate(_create_requests()):
+        stop_watch.start()
+        set_result_count = 0
+        for _ in range(query_count):
+            set_result_count = len(list(_query_by_sets(item_library, items_by_identifier, request)))
+        set_milliseconds = stop_watch.stop_milliseconds()
+        stop_watch.start()
+        bitmask_result_count = 0
+        for _ in range(query_count):
+            bitmask_result_count = len(list(query_registry._query_items(request, request.item_tests)))
+        bitmask_milliseconds = stop_watch.stop_milliseconds()
+        output(f'Query {index + 1} ({bitmask_result_count} item(s)): Sets {set_milliseconds / query_count:.3f}ms ({set_result_count} item(s)), Bitmasks {bitmask_milliseconds / query_count:.3f}ms per query.')
@@ -0,0 +1,75 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import os
+from typing import Any, Callable, Tuple
+
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.debug.benchmarks.object_cache_benchmark import _create_synthetic_cache_data
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.utils.common_io_utils import CommonIOUtils
+from sims4communitylib.utils.common_json_io_utils import CommonJSONIOUtils
+from sims4communitylib.utils.common_log_utils import CommonLogUtils
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+def _measure(func: Callable[[], Any]) -> Tuple[Any, float, float]:
+    # Returns the result, the milliseconds taken, and the peak memory allocated in megabytes.
+    # Tracing allocations slows everything down, so the time and the peak memory are measured separately.
+    stop_watch = CommonStopWatch()
+    stop_watch.start()
+    result = func()
+    milliseconds = stop_watch.stop_milliseconds()
+    if tracemalloc is None:
+        return result, milliseconds, 0.0
+    tracemalloc.start()
+    try:
+        func()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, milliseconds, peak_memory / (1024 * 1024)
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_json_write',
+    'Compare the time and peak memory of writing and reading a JSON cache file with and without streaming and compact output.',
+    command_arguments=(
+        CommonConsoleCommandArgument('object_count', 'Number', 'The number of synthetic objects to cache.', is_optional=True, default_value='150000'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_json_write(output: CommonConsoleCommandOutput, object_count: int=150000):
+    folder_path = os.path.join(CommonLogUtils.get_mod_data_location_path(), ModInfo.get_identity().base_namespace.lower(), 'benchmarks')
+    os.makedirs(folder_path, exist_ok=True)
+    file_path = os.path.join(folder_path, 'benchmark_json_write.json')
+    output(f'Benchmarking JSON writes with {object_count} object(s).')
+    if tracemalloc is None:
+        output('Peak memory is not available, tracemalloc could not be imported.')
+    cache_data = _create_synthetic_cache_data(object_count)
+    try:
+        for (stream, compact) in ((False, False), (False, True), (True, False), (True, True)):
+            (_, milliseconds, peak_memory) = _measure(lambda: CommonJSONIOUtils.write_to_file(file_path, cache_data, stream=stream, compact=compact))
+            output(f'Write (stream={stream}, compact={compact}): {milliseconds:.1f}ms, Peak {peak_memory:.1f}MB, Size {os.path.getsize(file_path) / (1024 * 1024):.1f}MB')
+
+        (text_data, text_milliseconds, text_peak_memory) = _measure(lambda: json.loads(CommonIOUtils.load_from_file(file_path)))
+        (loaded_data, milliseconds, peak_memory) = _measure(lambda: CommonJSONIOUtils.load_from_file(file_path))
+        output(f'Read: Text {text_milliseconds:.1f}ms, Peak {text_peak_memory:.1f}MB, Bytes {milliseconds:.1f}ms, Peak {peak_memory:.1f}MB')
+        if loaded_data != text_data or loaded_data != cache_data:
+            output('ERROR: The JSON file did not load the same data that was written.')
+    finally:
+        if os.path.exists(file_path):
+            CommonIOUtils.delete_file(file_path)
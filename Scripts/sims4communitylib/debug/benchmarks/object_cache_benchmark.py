@@ -0,0 +1,88 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+import random
+from typing import Any, Dict, List
+
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.systems.caching.common_serializable_object_cache_file import CommonSerializableObjectCacheFile
+from sims4communitylib.utils.common_io_utils import CommonIOUtils
+from sims4communitylib.utils.common_json_io_utils import CommonJSONIOUtils
+from sims4communitylib.utils.common_log_utils import CommonLogUtils
+
+
+def _create_synthetic_cache_data(object_count: int) -> Dict[str, Any]:
+    # Shaped like the serialized data of loaded items, with tags repeated across many objects.
+    data_random = random.Random(object_count)
+    tags = [f'TAG_{tag_group}_{tag_index}' for tag_group in ('ANIMATION', 'POSE', 'LOCATION', 'ACTOR') for tag_index in range(40)]
+    cached_objects: List[Dict[str, Any]] = list()
+    for index in range(object_count):
+        cached_objects.append({
+            'identifier': f'benchmark_item_{index}_{data_random.getrandbits(32):08x}',
+            'tuning_name': f'benchmark_snippet_{index // 100}',
+            'tags': data_random.sample(tags, 8),
+            'actor_count': data_random.randrange(1, 4),
+            'duration': data_random.random() * 10,
+            'is_custom': index % 3 == 0,
+            'actors': [{'actor_id': actor_id, 'gender': data_random.choice(('MALE', 'FEMALE')), 'age': data_random.choice(('ADULT', 'TEEN'))} for actor_id in range(2)]
+        })
+    cached_checksums = {f'benchmark_snippet_{snippet_index}-{snippet_index}': data_random.getrandbits(32) for snippet_index in range(object_count // 100 + 1)}
+    return {'cached_checksums': cached_checksums, 'cached_objects': cached_objects}
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_object_cache',
+    'Compare the size, save time, and load time of a JSON cache file against a binary cache file using synthetic cached objects.',
+    command_arguments=(
+        CommonConsoleCommandArgument('object_count', 'Number', 'The number of synthetic objects to cache.', is_optional=True, default_value='40000'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_object_cache(output: CommonConsoleCommandOutput, object_count: int=40000):
+    folder_path = os.path.join(CommonLogUtils.get_mod_data_location_path(), ModInfo.get_identity().base_namespace.lower(), 'caches')
+    os.makedirs(folder_path, exist_ok=True)
+    json_file_path = os.path.join(folder_path, 'benchmark_object_cache.json')
+    binary_file_path = os.path.join(folder_path, f'benchmark_object_cache.{CommonSerializableObjectCacheFile.FILE_EXTENSION}')
+    output(f'Benchmarking cache files with {object_count} object(s).')
+    cache_data = _create_synthetic_cache_data(object_count)
+    stop_watch = CommonStopWatch()
+    try:
+        stop_watch.start()
+        CommonJSONIOUtils.write_to_file(json_file_path, cache_data)
+        json_save_milliseconds = stop_watch.stop_milliseconds()
+        stop_watch.start()
+        CommonSerializableObjectCacheFile.write_to_file(binary_file_path, {'cached_checksums': cache_data['cached_checksums']}, cache_data['cached_objects'])
+        binary_save_milliseconds = stop_watch.stop_milliseconds()
+        output(f'Size: JSON {os.path.getsize(json_file_path) / 1024:.1f}KB, Binary {os.path.getsize(binary_file_path) / 1024:.1f}KB')
+        output(f'Save: JSON {json_save_milliseconds:.1f}ms, Binary {binary_save_milliseconds:.1f}ms')
+
+        stop_watch.start()
+        json_data = CommonJSONIOUtils.load_from_file(json_file_path)
+        json_checksums = json_data['cached_checksums']
+        json_load_milliseconds = stop_watch.stop_milliseconds()
+        stop_watch.start()
+        cache_file = CommonSerializableObjectCacheFile.load_from_file(binary_file_path)
+        binary_checksums = cache_file.header['cached_checksums']
+        binary_load_milliseconds = stop_watch.stop_milliseconds()
+        output(f'Load Checksums: JSON {json_load_milliseconds:.1f}ms, Binary {binary_load_milliseconds:.1f}ms')
+
+        stop_watch.start()
+        binary_objects = list(cache_file.get_records_gen())
+        binary_decode_milliseconds = stop_watch.stop_milliseconds()
+        output(f'Load All Objects: JSON {json_load_milliseconds:.1f}ms, Binary {binary_load_milliseconds + binary_decode_milliseconds:.1f}ms')
+        if binary_checksums != json_checksums or binary_objects != json_data['cached_objects']:
+            output('ERROR: The binary cache file did not load the same data as the JSON cache file.')
+    finally:
+        for file_path in (json_file_path, binary_file_path):
+            if os.path.exists(file_path):
+                CommonIOUtils.delete_file(file_path)
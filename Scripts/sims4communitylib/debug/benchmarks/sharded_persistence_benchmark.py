@@ -0,0 +1,101 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+import random
+import shutil
+from typing import Any, Dict
+
+from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.persistence.data_stores.common_sim_data_store import CommonSimDataStore
+from sims4communitylib.persistence.persistence_services.common_file_persistence_service import CommonFilePersistenceService
+from sims4communitylib.persistence.persistence_services.common_persistence_service import CommonPersistenceService
+from sims4communitylib.persistence.persistence_services.common_sharded_file_persistence_service import \
+    CommonShardedFilePersistenceService
+from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
+    CommonConsoleCommandArgument
+from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.utils.common_log_utils import CommonLogUtils
+
+
+def _create_synthetic_sim_data(sim_count: int) -> Dict[str, Any]:
+    # Shaped like the data of a mod storing a few values per Sim using CommonPersistedSimDataStorage.
+    data_random = random.Random(sim_count)
+    sim_data: Dict[str, Any] = {'version': 1}
+    for index in range(sim_count):
+        sim_data[str(100000000 + index)] = {
+            'sim_name': f'Benchmark Sim {index}',
+            'trait_ids': [data_random.getrandbits(32) for _ in range(4)],
+            'motive_level': data_random.random() * 100,
+            'is_enabled': index % 2 == 0
+        }
+    return {CommonSimDataStore.get_identifier(): sim_data}
+
+
+def _change_synthetic_sim_data(data: Dict[str, Any], change_percentage: float) -> int:
+    sim_data = data[CommonSimDataStore.get_identifier()]
+    sim_ids = [key for key in sim_data.keys() if key != 'version']
+    changed_sim_ids = random.Random(len(sim_ids)).sample(sim_ids, max(1, int(len(sim_ids) * change_percentage / 100)))
+    for sim_id in changed_sim_ids:
+        sim_data[sim_id] = dict(sim_data[sim_id], motive_level=sim_data[sim_id]['motive_level'] + 1)
+    return len(changed_sim_ids)
+
+
+def _get_size_in_kilobytes(path: str) -> float:
+    if os.path.isfile(path):
+        return os.path.getsize(path) / 1024
+    return sum(os.path.getsize(os.path.join(path, file_name)) for file_name in os.listdir(path)) / 1024
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.benchmark_sharded_persistence',
+    'Compare the save and load times of the file persistence service against the sharded file persistence service using synthetic Sim data.',
+    command_arguments=(
+        CommonConsoleCommandArgument('sim_count', 'Number', 'The number of synthetic Sims to save data for.', is_optional=True, default_value='5000'),
+        CommonConsoleCommandArgument('change_percentage', 'Decimal Number', 'The percentage of Sims to change between saves.', is_optional=True, default_value='1.0'),
+    ),
+    show_with_help_command=False
+)
+def _common_benchmark_sharded_persistence(output: CommonConsoleCommandOutput, sim_count: int=5000, change_percentage: float=1.0):
+    mod_identity = ModInfo.get_identity()
+    data_folder_path = os.path.join(CommonLogUtils.get_mod_data_location_path(), mod_identity.base_namespace.lower(), 'benchmarks')
+    file_persistence_service = CommonFilePersistenceService(per_save=False, custom_file_name='benchmark_persistence.json', data_folder_path=data_folder_path)
+    sharded_persistence_service = CommonShardedFilePersistenceService(per_save=False, custom_file_name='benchmark_sharded_persistence.json', data_folder_path=data_folder_path)
+    output(f'Benchmarking persistence services with {sim_count} Sim(s).')
+    data = _create_synthetic_sim_data(sim_count)
+    stop_watch = CommonStopWatch()
+
+    def _benchmark_save(persistence_service: CommonPersistenceService) -> float:
+        stop_watch.start()
+        persistence_service.save(mod_identity, data)
+        return stop_watch.stop_milliseconds()
+
+    def _benchmark_load(persistence_service: CommonPersistenceService) -> float:
+        stop_watch.start()
+        loaded_data = persistence_service.load(mod_identity)
+        load_milliseconds = stop_watch.stop_milliseconds()
+        if loaded_data != data:
+            output(f'ERROR: {persistence_service.__class__.__name__} did not load the same data that was saved.')
+        return load_milliseconds
+
+    try:
+        output(f'Save All: File {_benchmark_save(file_persistence_service):.1f}ms, Sharded {_benchmark_save(sharded_persistence_service):.1f}ms')
+        # noinspection PyProtectedMember
+        file_path = file_persistence_service._file_path(mod_identity)
+        # noinspection PyProtectedMember
+        folder_path = sharded_persistence_service._folder_path(mod_identity)
+        output(f'Size: File {_get_size_in_kilobytes(file_path):.1f}KB, Sharded {_get_size_in_kilobytes(folder_path):.1f}KB')
+        changed_sim_count = _change_synthetic_sim_data(data, change_percentage)
+        modified_times = {file_name: os.path.getmtime(os.path.join(folder_path, file_name)) for file_name in os.listdir(folder_path)}
+        output(f'Save {changed_sim_count} Changed Sim(s): File {_benchmark_save(file_persistence_service):.1f}ms, Sharded {_benchmark_save(sharded_persistence_service):.1f}ms')
+        rewritten_file_names = [file_name for file_name in os.listdir(folder_path) if modified_times.get(file_name) != os.path.getmtime(os.path.join(folder_path, file_name))]
+        output(f'Sharded files rewritten: {len(rewritten_file_names)} of {len(modified_times)} ({sum(os.path.getsize(os.path.join(folder_path, file_name)) for file_name in rewritten_file_names) / 1024:.1f}KB)')
+        output(f'Load: File {_benchmark_load(file_persistence_service):.1f}ms, Sharded {_benchmark_load(sharded_persistence_service):.1f}ms')
+    finally:
+        shutil.rmtree(data_folder_path, ignore_errors=True)
@@ -5,7 +5,7 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import List, Callable, Any, Union
+from typing import List, Callable, Any, Union, Dict, Tuple, Type
 from sims4communitylib.events.event_handling.common_event import CommonEvent
 from sims4communitylib.events.event_handling.common_event_handler import CommonEventHandler
 from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
@@ -21,6 +21,7 @@ class CommonEventRegistry(CommonService):
 
     def __init__(self) -> None:
         self._event_handlers: List[CommonEventHandler] = []
+        self._event_handlers_by_event_type: Dict[Type[CommonEvent], Tuple[CommonEventHandler, ...]] = dict()
 
     @staticmethod
     def handle_events(mod_identifier: Union[str, CommonModIdentity]) -> Callable[[Callable[[CommonEvent], bool]], Callable[[CommonEvent], bool]]:
@@ -43,6 +44,30 @@ class CommonEventRegistry(CommonService):
     def _register_event_handler(self, mod_identifier: Union[str, CommonModIdentity], event_function: Callable[[CommonEvent], bool]):
         event_handler = CommonEventHandler(mod_identifier, event_function)
         self._event_handlers.append(event_handler)
+        self._event_handlers_by_event_type.clear()
+
+    def _get_event_handlers_for_event_type(self, event_type: Type[CommonEvent]) -> Tuple[CommonEventHandler, ...]:
+        # The dispatch table is computed once per concrete event type and reset whenever a new handler is registered.
+        event_handlers = self._event_handlers_by_event_type.get(event_type, None)
+        if event_handlers is None:
+            event_type_mro = set(event_type.__mro__)
+            event_handlers = tuple([event_handler for event_handler in self._event_handlers if event_handler.event_type in event_type_mro])
+            self._event_handlers_by_event_type[event_type] = event_handlers
+        return event_handlers
+
+    def has_listeners(self, event_type: Type[CommonEvent]) -> bool:
+        """has_listeners(event_type)
+
+        Determine if any event handlers are listening for an event type.
+
+        .. note:: Use this to avoid creating an event (and computing its arguments) when nothing will receive it.
+
+        :param event_type: The type of event to check.
+        :type event_type: Type[CommonEvent]
+        :return: True, if at least one event handler will receive events of the specified type. False, if not.
+        :rtype: bool
+        """
+        return len(self._get_event_handlers_for_event_type(event_type)) > 0
 
     def dispatch(self, event: CommonEvent) -> bool:
         """dispatch(event)
@@ -59,12 +84,10 @@ class CommonEventRegistry(CommonService):
         return self._dispatch(event)
 
     def _dispatch(self, event: CommonEvent) -> bool:
-        event_handlers = list(self._event_handlers)
         result = True
         try:
+            event_handlers = self._get_event_handlers_for_event_type(type(event))
             for event_handler in event_handlers:
-                if not event_handler.can_handle_event(event):
-                    continue
                 try:
                     handle_result = event_handler.handle_event(event)
                     if not handle_result:
@@ -36,33 +36,51 @@ class CommonGameObjectEventDispatcherService(CommonService):
     """
 
     def _on_game_object_init(self, game_object: GameObject, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectInitializedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLGameObjectInitializedEvent(game_object))
 
     def _on_game_object_load(self, game_object: GameObject, *_, **__) -> bool:
         from sims4communitylib.events.zone_spin.common_zone_spin_event_dispatcher import CommonZoneSpinEventDispatcher
         if CommonZoneSpinEventDispatcher.get().game_loading:
             return False
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectLoadedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLGameObjectLoadedEvent(game_object))
 
     def _on_game_object_spawned(self, game_object: GameObject, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectSpawnedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLGameObjectSpawnedEvent(game_object))
 
     def _on_game_object_despawned(self, game_object: GameObject, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectPreDespawnedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLGameObjectPreDespawnedEvent(game_object))
 
     def _on_game_object_destroy(self, game_object: GameObject, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectPreDeletedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLGameObjectPreDeletedEvent(game_object))
 
     def _on_game_object_added_to_inventory(self, game_object: GameObject, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectAddedToInventoryEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLGameObjectAddedToInventoryEvent(game_object))
 
     def _on_game_object_pre_removed_from_inventory(self, game_object: GameObject, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectPreRemovedFromInventoryEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLGameObjectPreRemovedFromInventoryEvent(game_object))
 
     def _on_game_object_added_to_game_object_inventory(self, game_object: GameObject, added_object: GameObject) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectAddedToGameObjectInventoryEvent):
+            return
         CommonEventRegistry.get().dispatch(S4CLGameObjectAddedToGameObjectInventoryEvent(game_object, added_object))
 
     def _on_game_object_pre_removed_from_game_object_inventory(self, game_object: GameObject, removed_object: GameObject) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectPreRemovedFromGameObjectInventoryEvent):
+            return
         CommonEventRegistry.get().dispatch(S4CLGameObjectPreRemovedFromGameObjectInventoryEvent(game_object, removed_object))
 
 
@@ -62,6 +62,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
 
     # noinspection PyUnusedLocal
     def _on_interaction_pre_run(self, interaction_queue: InteractionQueue, timeline: Timeline, interaction: Interaction, *_, **__) -> Union[bool, None]:
+        if not CommonEventRegistry().has_listeners(S4CLInteractionPreRunEvent):
+            return None
         if interaction is None or interaction.sim is None:
             return None
         try:
@@ -84,6 +86,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
 
     # noinspection PyUnusedLocal
     def _on_interaction_run(self, interaction_queue: InteractionQueue, timeline: Timeline, interaction: Interaction, run_result: bool, *_, **__) -> None:
+        if not CommonEventRegistry().has_listeners(S4CLInteractionRunEvent):
+            return None
         if interaction is None or interaction.sim is None:
             return None
         try:
@@ -105,6 +109,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
 
     # noinspection PyUnusedLocal
     def _on_interaction_started(self, interaction: Interaction, *_, **__) -> None:
+        if not CommonEventRegistry().has_listeners(S4CLInteractionStartedEvent):
+            return None
         if interaction is None or interaction.sim is None:
             return None
         try:
@@ -126,6 +132,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
         return None
 
     def _on_interaction_queued(self, interaction_queue: InteractionQueue, interaction: Interaction, *_, **__) -> Union[CommonTestResult, None]:
+        if not CommonEventRegistry().has_listeners(S4CLInteractionQueuedEvent):
+            return None
         if interaction is None or interaction.sim is None:
             return None
         try:
@@ -146,6 +154,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
         return None
 
     def _on_interaction_post_queued(self, interaction_queue: InteractionQueue, interaction: Interaction, queue_result: CommonTestResult, *_, **__) -> None:
+        if not CommonEventRegistry().has_listeners(S4CLInteractionPostQueuedEvent):
+            return None
         if interaction is None or interaction.sim is None:
             return None
         try:
@@ -166,6 +176,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
         return None
 
     def _on_interaction_outcome(self, interaction: Interaction, outcome: InteractionOutcome, result: OutcomeResult) -> None:
+        if not CommonEventRegistry().has_listeners(S4CLInteractionOutcomeEvent):
+            return None
         if interaction.sim is None:
             return None
         try:
@@ -185,6 +197,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
         return None
 
     def _on_interaction_cancelled(self, interaction: Interaction, finishing_type: FinishingType, cancel_reason_msg: str, ignore_must_run: bool=False, **__) -> None:
+        if not CommonEventRegistry().has_listeners(S4CLInteractionCancelledEvent):
+            return None
         if finishing_type is None:
             return None
         try:
@@ -206,6 +220,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
         return None
 
     def _on_mixer_interaction_cancelled(self, interaction: MixerInteraction, finishing_type: FinishingType, cancel_reason_msg: str, **__) -> None:
+        if not CommonEventRegistry().has_listeners(S4CLMixerInteractionCancelledEvent):
+            return None
         if finishing_type is None:
             return None
         try:
@@ -226,6 +242,8 @@ class CommonInteractionEventDispatcherService(CommonService, HasLog):
         return None
 
     def _on_super_interaction_cancelled(self, interaction: SuperInteraction, finishing_type: FinishingType, cancel_reason_msg: str, **__) -> None:
+        if not CommonEventRegistry().has_listeners(S4CLSuperInteractionCancelledEvent):
+            return None
         if interaction is None or finishing_type is None:
             return None
         try:
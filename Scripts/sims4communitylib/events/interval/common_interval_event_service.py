@@ -5,7 +5,10 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Callable, Any, List, Union
+import heapq
+import math
+import time
+from typing import Callable, Any, List, Union, Tuple
 from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
 from sims4communitylib.events.zone_update.events.zone_update_event import S4CLZoneUpdateEvent
 from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
@@ -15,7 +18,7 @@ from sims4communitylib.services.common_service import CommonService
 
 
 class CommonIntervalDispatcher:
-    """CommonIntervalDispatcher(mod_identifier, milliseconds, listening_func, run_once=False)
+    """CommonIntervalDispatcher(mod_identifier, milliseconds, listening_func, run_once=False, priority=0)
 
     A dispatcher that invokes a callback based on the amount of time passed.
 
@@ -31,14 +34,24 @@ class CommonIntervalDispatcher:
     :param run_once: If set to True, the dispatcher will only invoke `listening_func` once before it stops listening.\
     If set to False, the dispatcher will invoke `listening_func` every time the specified number of milliseconds has passed.
     :type run_once: bool
+    :param priority: When the registry has an update budget, dispatchers with a higher priority are invoked first. Default is 0.
+    :type priority: int, optional
     """
-    def __init__(self, mod_identifier: Union[str, CommonModIdentity], milliseconds: int, listening_func: Callable[..., Any], run_once: bool=False):
+    def __init__(self, mod_identifier: Union[str, CommonModIdentity], milliseconds: int, listening_func: Callable[..., Any], run_once: bool=False, priority: int=0):
         from sims4communitylib.utils.misc.common_mod_identity_utils import CommonModIdentityUtils
         self._mod_name = CommonModIdentityUtils.determine_mod_name_from_identifier(mod_identifier)
         self._minimum_milliseconds_to_dispatch = milliseconds
         self._listening_func = listening_func
+        self._registry: Union['CommonIntervalEventRegistry', None] = None
+        self._synced_milliseconds = 0.0
+        self._scheduled_sequence = 0
         self.total_milliseconds_passed = 0.0
         self._run_once = run_once
+        self._priority = priority
+        self._dispatch_count = 0
+        self._total_dispatch_milliseconds = 0.0
+        self._max_dispatch_milliseconds = 0.0
+        self._deferred_count = 0
 
     @property
     def total_milliseconds_passed(self) -> float:
@@ -47,11 +60,17 @@ class CommonIntervalDispatcher:
         :return: The amount of time in milliseconds that has passed since the dispatcher started keeping track.
         :rtype: float
         """
-        return self._total_milliseconds_passed
+        if self._registry is None:
+            return self._total_milliseconds_passed
+        return self._total_milliseconds_passed + self._registry.elapsed_milliseconds - self._synced_milliseconds
 
     @total_milliseconds_passed.setter
     def total_milliseconds_passed(self, milliseconds: float):
         self._total_milliseconds_passed = milliseconds
+        if self._registry is not None:
+            self._synced_milliseconds = self._registry.elapsed_milliseconds
+            # noinspection PyProtectedMember
+            self._registry._schedule(self)
 
     @property
     def minimum_milliseconds_to_dispatch(self) -> int:
@@ -65,6 +84,9 @@ class CommonIntervalDispatcher:
     @minimum_milliseconds_to_dispatch.setter
     def minimum_milliseconds_to_dispatch(self, val: int):
         self._minimum_milliseconds_to_dispatch = val
+        if self._registry is not None:
+            # noinspection PyProtectedMember
+            self._registry._schedule(self)
 
     @property
     def mod_name(self) -> str:
@@ -93,6 +115,51 @@ class CommonIntervalDispatcher:
         """
         return self._run_once
 
+    @property
+    def priority(self) -> int:
+        """The priority of the dispatcher. When the registry has an update budget, dispatchers with a higher priority are invoked first.
+
+        :return: The priority of the dispatcher.
+        :rtype: int
+        """
+        return self._priority
+
+    @property
+    def dispatch_count(self) -> int:
+        """The number of times the registry invoked `listening_func`.
+
+        :return: The number of times the registry invoked `listening_func`.
+        :rtype: int
+        """
+        return self._dispatch_count
+
+    @property
+    def total_dispatch_milliseconds(self) -> float:
+        """The total amount of time in milliseconds `listening_func` took to run when invoked by the registry.
+
+        :return: The total amount of time in milliseconds `listening_func` took to run.
+        :rtype: float
+        """
+        return self._total_dispatch_milliseconds
+
+    @property
+    def max_dispatch_milliseconds(self) -> float:
+        """The longest amount of time in milliseconds `listening_func` took to run when invoked by the registry.
+
+        :return: The longest amount of time in milliseconds `listening_func` took to run.
+        :rtype: float
+        """
+        return self._max_dispatch_milliseconds
+
+    @property
+    def deferred_count(self) -> int:
+        """The number of times the dispatcher was due, but was deferred to the next update because the update budget of the registry was used up.
+
+        :return: The number of times the dispatcher was deferred.
+        :rtype: int
+        """
+        return self._deferred_count
+
     def try_dispatch(self, milliseconds_since_last_update: int) -> bool:
         """Attempt to run the dispatcher.
 
@@ -108,6 +175,16 @@ class CommonIntervalDispatcher:
         self._listening_func()
         return True
 
+    def _get_next_dispatch_milliseconds(self) -> float:
+        # The elapsed milliseconds of the registry at which enough time will have passed to dispatch.
+        return self._synced_milliseconds + self._minimum_milliseconds_to_dispatch - self._total_milliseconds_passed
+
+    def _consume_dispatch_time(self) -> None:
+        # Called by the registry once the dispatcher is due. The time passed beyond the minimum carries over, like in try_dispatch.
+        elapsed_milliseconds = self._registry.elapsed_milliseconds
+        self._total_milliseconds_passed = max(0.0, self._total_milliseconds_passed + elapsed_milliseconds - self._synced_milliseconds - self._minimum_milliseconds_to_dispatch)
+        self._synced_milliseconds = elapsed_milliseconds
+
 
 class CommonIntervalEventRegistry(CommonService):
     """A registry that will run functions based on an amount of time.
@@ -131,14 +208,54 @@ class CommonIntervalEventRegistry(CommonService):
             def _example_run_every():
                 pass
 
+    .. note:: Registered dispatchers are kept in a heap ordered by the time they are due next, so each update only visits the dispatchers that are due.
+
+    .. note:: By default, every due dispatcher is invoked within the update it becomes due. When :attr:`update_budget_in_milliseconds` is above zero,\
+        due dispatchers are invoked in order of priority until the budget is used up and the remaining ones are deferred to the next update in the order they became due.\
+        A dispatcher deferred :attr:`MAX_DEFERRED_UPDATES` times is invoked regardless of the budget. The budget can be set with `interval_update_budget_in_milliseconds` in the sims4communitylib.config file.
+
     """
+    MAX_DEFERRED_UPDATES: int = 10
 
     def __init__(self) -> None:
-        self._registered_interval_trackers: List[CommonIntervalDispatcher] = []
+        from sims4communitylib.s4cl_configuration import S4CLConfiguration
+        self._elapsed_milliseconds = 0.0
+        self._update_count = 0
+        self._dispatcher_heap: List[Tuple[float, int, CommonIntervalDispatcher]] = []
+        self._registered_dispatcher_count = 0
+        self._last_scheduled_sequence = 0
+        self._is_dispatching = False
+        self._dispatchers_to_schedule: List[Tuple[float, int, CommonIntervalDispatcher]] = []
+        # Entries that are due, ordered by priority and then by the order they became due. Only used with an update budget.
+        self._due_entries: List[Tuple[int, int, int, Tuple[float, int, CommonIntervalDispatcher]]] = []
+        self._last_due_sequence = 0
+        self.update_budget_in_milliseconds = S4CLConfiguration().interval_update_budget_in_milliseconds
+
+    @property
+    def update_budget_in_milliseconds(self) -> float:
+        """The amount of time in milliseconds dispatchers may take to run within a single update, before the remaining due dispatchers are deferred to the next update. Zero or less means no budget.
+
+        :return: The update budget in milliseconds.
+        :rtype: float
+        """
+        return self._update_budget_in_milliseconds
+
+    @update_budget_in_milliseconds.setter
+    def update_budget_in_milliseconds(self, value: float):
+        self._update_budget_in_milliseconds = value
+
+    @property
+    def elapsed_milliseconds(self) -> float:
+        """The amount of time in milliseconds that has passed while the game was not paused, since the registry started keeping track.
+
+        :return: The amount of time in milliseconds that has passed while the game was not paused.
+        :rtype: float
+        """
+        return self._elapsed_milliseconds
 
     @staticmethod
-    def run_every(mod_identifier: Union[str, CommonModIdentity], milliseconds: int=1500) -> Callable[..., Callable[..., Any]]:
-        """run_every(mod_identifier, milliseconds=1500)
+    def run_every(mod_identifier: Union[str, CommonModIdentity], milliseconds: int=1500, priority: int=0) -> Callable[..., Callable[..., Any]]:
+        """run_every(mod_identifier, milliseconds=1500, priority=0)
 
         Register a function to run in intervals of the specified time.
 
@@ -148,17 +265,19 @@ class CommonIntervalEventRegistry(CommonService):
         :type mod_identifier: Union[str, CommonModIdentity]
         :param milliseconds: The amount of time in milliseconds that must pass before the decorated function will be run.
         :type milliseconds: int
+        :param priority: When the registry has an update budget, functions with a higher priority are run first. Default is 0.
+        :type priority: int, optional
         :return: A callable function wrapped that runs in intervals.
         :rtype: Callable[..., Callable[..., Any]]
         """
         def _wrapper(listening_func) -> Callable[..., Any]:
-            CommonIntervalEventRegistry.get()._add_tracker(mod_identifier, milliseconds, listening_func)
+            CommonIntervalEventRegistry.get()._add_tracker(mod_identifier, milliseconds, listening_func, priority=priority)
             return listening_func
         return _wrapper
 
     @staticmethod
-    def run_once(mod_identifier: Union[str, CommonModIdentity], milliseconds: int=1500) -> Callable[..., Callable[..., Any]]:
-        """run_once(mod_identifier, milliseconds=1500)
+    def run_once(mod_identifier: Union[str, CommonModIdentity], milliseconds: int=1500, priority: int=0) -> Callable[..., Callable[..., Any]]:
+        """run_once(mod_identifier, milliseconds=1500, priority=0)
 
         Register a function to run a single time after a certain amount of time.
 
@@ -168,17 +287,19 @@ class CommonIntervalEventRegistry(CommonService):
         :type mod_identifier: Union[str, CommonModIdentity]
         :param milliseconds: The amount of time in milliseconds that must pass before the decorated function will be run.
         :type milliseconds: int
+        :param priority: When the registry has an update budget, functions with a higher priority are run first. Default is 0.
+        :type priority: int, optional
         :return: A callable function wrapped to run once.
         :rtype: Callable[..., Callable[..., Any]]
         """
 
         def _wrapper(listening_func) -> Any:
-            CommonIntervalEventRegistry.get()._add_tracker(mod_identifier, milliseconds, listening_func, run_once=True)
+            CommonIntervalEventRegistry.get()._add_tracker(mod_identifier, milliseconds, listening_func, run_once=True, priority=priority)
             return listening_func
         return _wrapper
 
-    def register_dispatcher(self, mod_identity: CommonModIdentity, milliseconds: int, listening_func: Callable[..., Any], run_once: bool=False) -> Union[CommonIntervalDispatcher, None]:
-        """register_dispatcher(mod_identity, milliseconds, listening_func, run_once=False)
+    def register_dispatcher(self, mod_identity: CommonModIdentity, milliseconds: int, listening_func: Callable[..., Any], run_once: bool=False, priority: int=0) -> Union[CommonIntervalDispatcher, None]:
+        """register_dispatcher(mod_identity, milliseconds, listening_func, run_once=False, priority=0)
 
         Manually register a new dispatcher to the registry.
 
@@ -190,31 +311,162 @@ class CommonIntervalEventRegistry(CommonService):
         :type listening_func: Callable[..., Any]
         :param run_once: If True, the dispatcher will run a single time, then be removed from the registry. If False, the dispatcher will continue running after the specified milliseconds and will repeat. Default is False.
         :type run_once: bool, optional
+        :param priority: When the registry has an update budget, dispatchers with a higher priority are invoked first. Default is 0.
+        :type priority: int, optional
         :return: A dispatcher that will trigger after a set amount of time or None if an error occurs while registering a dispatcher.
         :rtype: Union[CommonIntervalDispatcher, None]
         """
         if milliseconds <= 0:
             CommonExceptionHandler.log_exception(mod_identity, 'Failed to registry an interval dispatcher. The specified milliseconds must be above zero.')
             return None
-        return self._add_tracker(mod_identity, milliseconds, listening_func, run_once=run_once)
+        return self._add_tracker(mod_identity, milliseconds, listening_func, run_once=run_once, priority=priority)
+
+    def unregister_dispatcher(self, dispatcher: CommonIntervalDispatcher) -> bool:
+        """unregister_dispatcher(dispatcher)
+
+        Manually unregister a dispatcher from the registry, so it is no longer invoked.
 
-    def _add_tracker(self, mod_identifier: Union[str, CommonModIdentity], milliseconds: int, listening_func: Callable[..., Any], run_once: bool=False) -> CommonIntervalDispatcher:
-        dispatcher = CommonIntervalDispatcher(mod_identifier, milliseconds, listening_func, run_once=run_once)
-        self._registered_interval_trackers.append(dispatcher)
+        :param dispatcher: The dispatcher to unregister.
+        :type dispatcher: CommonIntervalDispatcher
+        :return: True, if the dispatcher was unregistered. False, if the dispatcher was not registered.
+        :rtype: bool
+        """
+        # noinspection PyProtectedMember
+        if dispatcher._registry is not self:
+            return False
+        # The entries of the dispatcher are left in the heap and skipped once they are popped.
+        dispatcher._registry = None
+        self._registered_dispatcher_count -= 1
+        return True
+
+    def is_registered(self, dispatcher: CommonIntervalDispatcher) -> bool:
+        """is_registered(dispatcher)
+
+        Determine if a dispatcher is registered to the registry.
+
+        :param dispatcher: The dispatcher to check.
+        :type dispatcher: CommonIntervalDispatcher
+        :return: True, if the dispatcher is registered. False, if not.
+        :rtype: bool
+        """
+        # noinspection PyProtectedMember
+        return dispatcher._registry is self
+
+    def get_registered_dispatchers(self) -> Tuple[CommonIntervalDispatcher, ...]:
+        """get_registered_dispatchers()
+
+        Retrieve the dispatchers registered to the registry.
+
+        :return: The registered dispatchers.
+        :rtype: Tuple[CommonIntervalDispatcher, ...]
+        """
+        dispatchers: List[CommonIntervalDispatcher] = list()
+        for entry in (*self._dispatcher_heap, *(due_entry[3] for due_entry in self._due_entries), *self._dispatchers_to_schedule):
+            if self._is_current_entry(entry):
+                dispatchers.append(entry[2])
+        return tuple(dispatchers)
+
+    def _add_tracker(self, mod_identifier: Union[str, CommonModIdentity], milliseconds: int, listening_func: Callable[..., Any], run_once: bool=False, priority: int=0) -> CommonIntervalDispatcher:
+        dispatcher = CommonIntervalDispatcher(mod_identifier, milliseconds, listening_func, run_once=run_once, priority=priority)
+        # noinspection PyProtectedMember
+        dispatcher._registry = self
+        dispatcher._synced_milliseconds = self._elapsed_milliseconds
+        self._registered_dispatcher_count += 1
+        self._schedule(dispatcher)
         return dispatcher
 
+    # noinspection PyProtectedMember
+    def _schedule(self, dispatcher: CommonIntervalDispatcher) -> None:
+        # Any entry previously pushed for the dispatcher becomes stale, since its sequence no longer matches.
+        self._last_scheduled_sequence += 1
+        dispatcher._scheduled_sequence = self._last_scheduled_sequence
+        entry = (dispatcher._get_next_dispatch_milliseconds(), self._last_scheduled_sequence, dispatcher)
+        if self._is_dispatching:
+            # Pushed once dispatching is done, so a dispatcher does not run more than once per update.
+            self._dispatchers_to_schedule.append(entry)
+            return
+        heapq.heappush(self._dispatcher_heap, entry)
+        if len(self._dispatcher_heap) > 2 * self._registered_dispatcher_count + 64:
+            self._remove_stale_entries()
+
+    def _remove_stale_entries(self) -> None:
+        self._dispatcher_heap = [entry for entry in self._dispatcher_heap if self._is_current_entry(entry)]
+        heapq.heapify(self._dispatcher_heap)
+
+    def _is_current_entry(self, entry: Tuple[float, int, CommonIntervalDispatcher]) -> bool:
+        (_, scheduled_sequence, dispatcher) = entry
+        # noinspection PyProtectedMember
+        return dispatcher._registry is self and dispatcher._scheduled_sequence == scheduled_sequence
+
     def _attempt_to_dispatch(self, milliseconds_since_last_update: int):
-        interval_trackers = list(self._registered_interval_trackers)
-        for interval_tracker in interval_trackers:
-            try:
-                interval_tracker.try_dispatch(milliseconds_since_last_update)
-            except Exception as ex:
-                CommonExceptionHandler.log_exception(interval_tracker.mod_name, 'Error occurred when attempting to dispatch listener \'{}\''.format(interval_tracker.listening_func_name), exception=ex)
-            try:
-                if interval_tracker.run_once:
-                    self._registered_interval_trackers.remove(interval_tracker)
-            except Exception as ex:
-                CommonExceptionHandler.log_exception(interval_tracker.mod_name, 'Error occurred when attempting to unregister listener \'{}\''.format(interval_tracker.listening_func_name), exception=ex)
+        self._elapsed_milliseconds += milliseconds_since_last_update
+        self._update_count += 1
+        dispatcher_heap = self._dispatcher_heap
+        self._is_dispatching = True
+        try:
+            if self._update_budget_in_milliseconds <= 0 and not self._due_entries:
+                while dispatcher_heap and dispatcher_heap[0][0] <= self._elapsed_milliseconds:
+                    entry = heapq.heappop(dispatcher_heap)
+                    if self._is_current_entry(entry):
+                        self._dispatch_entry(entry)
+            else:
+                self._attempt_to_dispatch_within_budget()
+        finally:
+            self._is_dispatching = False
+            dispatchers_to_schedule = self._dispatchers_to_schedule
+            self._dispatchers_to_schedule = []
+            for entry in dispatchers_to_schedule:
+                if self._is_current_entry(entry):
+                    heapq.heappush(dispatcher_heap, entry)
+
+    def _attempt_to_dispatch_within_budget(self) -> None:
+        dispatcher_heap = self._dispatcher_heap
+        due_entries = self._due_entries
+        while dispatcher_heap and dispatcher_heap[0][0] <= self._elapsed_milliseconds:
+            entry = heapq.heappop(dispatcher_heap)
+            if not self._is_current_entry(entry):
+                continue
+            self._last_due_sequence += 1
+            heapq.heappush(due_entries, (-entry[2].priority, self._last_due_sequence, self._update_count, entry))
+        budget_in_milliseconds = self._update_budget_in_milliseconds
+        deadline = time.perf_counter() + budget_in_milliseconds / 1000 if budget_in_milliseconds > 0 else math.inf
+        deferred_entries = list()
+        while due_entries:
+            due_entry = heapq.heappop(due_entries)
+            entry = due_entry[3]
+            if not self._is_current_entry(entry):
+                continue
+            if self._update_count - due_entry[2] < self.MAX_DEFERRED_UPDATES and time.perf_counter() >= deadline:
+                # noinspection PyProtectedMember
+                entry[2]._deferred_count += 1
+                deferred_entries.append(due_entry)
+                continue
+            self._dispatch_entry(entry)
+        # Deferred entries keep their sequence, so they stay ahead of the entries of the same priority that become due later.
+        for due_entry in deferred_entries:
+            heapq.heappush(due_entries, due_entry)
+
+    # noinspection PyProtectedMember
+    def _dispatch_entry(self, entry: Tuple[float, int, CommonIntervalDispatcher]) -> None:
+        interval_tracker = entry[2]
+        try:
+            interval_tracker._consume_dispatch_time()
+            if interval_tracker.run_once:
+                self.unregister_dispatcher(interval_tracker)
+            else:
+                self._schedule(interval_tracker)
+        except Exception as ex:
+            CommonExceptionHandler.log_exception(interval_tracker.mod_name, 'Error occurred when attempting to reschedule listener \'{}\''.format(interval_tracker.listening_func_name), exception=ex)
+        start_time = time.perf_counter()
+        try:
+            interval_tracker._listening_func()
+        except Exception as ex:
+            CommonExceptionHandler.log_exception(interval_tracker.mod_name, 'Error occurred when attempting to dispatch listener \'{}\''.format(interval_tracker.listening_func_name), exception=ex)
+        dispatch_milliseconds = (time.perf_counter() - start_time) * 1000
+        interval_tracker._dispatch_count += 1
+        interval_tracker._total_dispatch_milliseconds += dispatch_milliseconds
+        if dispatch_milliseconds > interval_tracker._max_dispatch_milliseconds:
+            interval_tracker._max_dispatch_milliseconds = dispatch_milliseconds
 
     @staticmethod
     @CommonEventRegistry.handle_events(ModInfo.get_identity())
@@ -83,6 +83,8 @@ class CommonSimEventDispatcherService(CommonService):
     """
 
     def _on_sim_change_gender(self, sim_info: SimInfo) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedGenderEvent):
+            return True
         from sims4communitylib.utils.sims.common_gender_utils import CommonGenderUtils
         new_gender = CommonGender.get_gender(sim_info)
         if CommonGenderUtils.is_male_gender(new_gender):
@@ -94,122 +96,180 @@ class CommonSimEventDispatcherService(CommonService):
         return CommonEventRegistry.get().dispatch(S4CLSimChangedGenderEvent(sim_info, old_gender, new_gender))
 
     def _on_sim_change_gender_options_breasts(self, sim_info: SimInfo) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedGenderOptionsBreastsEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimChangedGenderOptionsBreastsEvent(sim_info))
 
     def _on_sim_change_gender_options_toilet_usage(self, sim_info: SimInfo) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedGenderOptionsToiletUsageEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimChangedGenderOptionsToiletUsageEvent(sim_info))
 
     def _on_sim_change_gender_options_body_frame(self, sim_info: SimInfo) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedGenderOptionsBodyFrameEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimChangedGenderOptionsBodyFrameEvent(sim_info))
 
     def _on_sim_change_gender_options_clothing_preference(self, sim_info: SimInfo) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedGenderOptionsClothingPreferenceEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimChangedGenderOptionsClothingPreferenceEvent(sim_info))
 
     def _on_sim_change_gender_options_can_impregnate(self, sim_info: SimInfo) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedGenderOptionsCanImpregnateEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimChangedGenderOptionsCanImpregnateEvent(sim_info))
 
     def _on_sim_change_gender_options_can_be_impregnated(self, sim_info: SimInfo) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedGenderOptionsCanBeImpregnatedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimChangedGenderOptionsCanBeImpregnatedEvent(sim_info))
 
     def _on_sim_change_gender_options_can_reproduce(self, sim_info: SimInfo) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedGenderOptionsCanReproduceEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimChangedGenderOptionsCanReproduceEvent(sim_info))
 
     def _on_sim_init(self, sim_info: SimInfo, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimInitializedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimInitializedEvent(sim_info))
 
     def _on_sim_load(self, sim_info: SimInfo, *_, **__) -> bool:
         from sims4communitylib.events.zone_spin.common_zone_spin_event_dispatcher import CommonZoneSpinEventDispatcher
         if CommonZoneSpinEventDispatcher.get().game_loading:
             return False
+        if not CommonEventRegistry.get().has_listeners(S4CLSimLoadedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimLoadedEvent(sim_info))
 
     def _on_sim_spawned(self, sim_info: SimInfo, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimSpawnedEvent):
+            return True
         from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
         return CommonEventRegistry.get().dispatch(S4CLSimSpawnedEvent(CommonSimUtils.get_sim_info(sim_info)))
 
     def _on_sim_died(self, sim_info: SimInfo, death_type: CommonDeathType, is_off_lot_death: bool, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimDiedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimDiedEvent(sim_info, death_type, is_off_lot_death))
 
     def _on_sim_revived(self, sim_info: SimInfo, previous_death_type: CommonDeathType, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimRevivedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimRevivedEvent(sim_info, previous_death_type))
 
     def _pre_sim_despawned(self, sim_info: SimInfo, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimPreDespawnedEvent):
+            return True
         return CommonEventRegistry.get().dispatch(S4CLSimPreDespawnedEvent(sim_info))
 
     def _on_sim_changing_age(self, sim_info: SimInfo, new_age: Age, current_age: Age, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangingAgeEvent):
+            return True
         from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
         return CommonEventRegistry.get().dispatch(S4CLSimChangingAgeEvent(CommonSimUtils.get_sim_info(sim_info), CommonAge.convert_from_vanilla(current_age), CommonAge.convert_from_vanilla(new_age)))
 
     def _on_sim_change_age(self, sim_info: SimInfo, new_age: Age, current_age: Age, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedAgeEvent):
+            return True
         from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
         return CommonEventRegistry.get().dispatch(S4CLSimChangedAgeEvent(CommonSimUtils.get_sim_info(sim_info), CommonAge.convert_from_vanilla(current_age), CommonAge.convert_from_vanilla(new_age)))
 
     def _on_sim_add_occult_type(self, occult_tracker: OccultTracker, occult_type: OccultType) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimAddedOccultTypeEvent):
+            return True
         sim_info = occult_tracker._sim_info
         return CommonEventRegistry.get().dispatch(S4CLSimAddedOccultTypeEvent(sim_info, occult_type, occult_tracker))
 
     def _on_sim_changing_occult_type(self, occult_tracker: OccultTracker, occult_type: OccultType, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangingOccultTypeEvent):
+            return True
         sim_info = occult_tracker._sim_info
         return CommonEventRegistry.get().dispatch(S4CLSimChangingOccultTypeEvent(sim_info, occult_type, occult_tracker))
 
     def _on_sim_changed_occult_type(self, occult_tracker: OccultTracker, occult_type: OccultType, *_, **__) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimChangedOccultTypeEvent):
+            return True
         sim_info = occult_tracker._sim_info
         return CommonEventRegistry.get().dispatch(S4CLSimChangedOccultTypeEvent(sim_info, occult_type, occult_tracker))
 
     def _on_sim_remove_occult_type(self, occult_tracker: OccultTracker, occult_type: OccultType) -> bool:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimRemovedOccultTypeEvent):
+            return True
         sim_info = occult_tracker._sim_info
         return CommonEventRegistry.get().dispatch(S4CLSimRemovedOccultTypeEvent(sim_info, occult_type, occult_tracker))
 
     def _on_sim_trait_added(self, trait_tracker: TraitTracker, trait: Trait, *_, **__) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimTraitAddedEvent):
+            return
         sim_info = trait_tracker.get_sim_info_from_provider()
         if sim_info is None:
             return
         CommonEventRegistry.get().dispatch(S4CLSimTraitAddedEvent(sim_info, trait, trait_tracker))
 
     def _on_sim_trait_removed(self, trait_tracker: TraitTracker, trait: Trait, *_, **__) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimTraitRemovedEvent):
+            return
         sim_info = trait_tracker.get_sim_info_from_provider()
         if sim_info is None:
             return
         CommonEventRegistry.get().dispatch(S4CLSimTraitRemovedEvent(sim_info, trait, trait_tracker))
 
     def _on_sim_buff_added(self, buff: Buff, sim_id: int) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimBuffAddedEvent):
+            return
         sim_info = CommonSimUtils.get_sim_info(sim_id)
         if sim_info is None:
             return
         CommonEventRegistry.get().dispatch(S4CLSimBuffAddedEvent(sim_info, buff))
 
     def _on_sim_buff_removed(self, buff: Buff, sim_id: int) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimBuffRemovedEvent):
+            return
         sim_info = CommonSimUtils.get_sim_info(sim_id)
         if sim_info is None:
             return
         CommonEventRegistry.get().dispatch(S4CLSimBuffRemovedEvent(sim_info, buff))
 
     def _on_sim_set_current_outfit(self, sim_info: SimInfo, outfit_category_and_index: Tuple[OutfitCategory, int]) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimSetCurrentOutfitEvent):
+            return
         from sims4communitylib.utils.cas.common_outfit_utils import CommonOutfitUtils
         CommonEventRegistry.get().dispatch(S4CLSimSetCurrentOutfitEvent(sim_info, CommonOutfitUtils.get_current_outfit(sim_info), outfit_category_and_index))
 
     def _after_sim_set_current_outfit(self, sim_info: SimInfo, previous_outfit_category_and_index: Tuple[OutfitCategory, int], outfit_category_and_index: Tuple[OutfitCategory, int]) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimAfterSetCurrentOutfitEvent):
+            return
         CommonEventRegistry.get().dispatch(S4CLSimAfterSetCurrentOutfitEvent(sim_info, previous_outfit_category_and_index, outfit_category_and_index))
 
     def _on_skill_leveled_up(self, skill: Skill, old_skill_level: int, new_skill_level: int) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimSkillLeveledUpEvent):
+            return
         if skill.tracker is None or skill.tracker._owner is None:
             return
         sim_info = CommonSimUtils.get_sim_info(skill.tracker._owner)
         CommonEventRegistry.get().dispatch(S4CLSimSkillLeveledUpEvent(sim_info, skill, old_skill_level, new_skill_level))
 
     def _on_object_added_to_sim_inventory(self, sim: Sim, added_game_object: GameObject) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectAddedToSimInventoryEvent):
+            return
         sim_info = CommonSimUtils.get_sim_info(sim)
         if sim_info is None:
             return
         CommonEventRegistry.get().dispatch(S4CLGameObjectAddedToSimInventoryEvent(sim_info, added_game_object))
 
     def _on_object_removed_from_sim_inventory(self, sim: Sim, removed_game_object: GameObject) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLGameObjectPreRemovedFromSimInventoryEvent):
+            return
         sim_info = CommonSimUtils.get_sim_info(sim)
         if sim_info is None:
             return
         CommonEventRegistry.get().dispatch(S4CLGameObjectPreRemovedFromSimInventoryEvent(sim_info, removed_game_object))
 
     def _on_relationship_bit_added(self, sim_id_a: int, sim_id_b: int, relationship_bit: RelationshipBit) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimRelationshipBitAddedEvent):
+            return
         sim_info_a = CommonSimUtils.get_sim_info(sim_id_a)
         if sim_info_a is None:
             return
@@ -219,6 +279,8 @@ class CommonSimEventDispatcherService(CommonService):
         CommonEventRegistry.get().dispatch(S4CLSimRelationshipBitAddedEvent(sim_info_a, sim_info_b, relationship_bit))
 
     def _on_relationship_bit_removed(self, sim_id_a: int, sim_id_b: int, relationship_bit: RelationshipBit) -> None:
+        if not CommonEventRegistry.get().has_listeners(S4CLSimRelationshipBitRemovedEvent):
+            return
         sim_info_a = CommonSimUtils.get_sim_info(sim_id_a)
         if sim_info_a is None:
             return
@@ -326,7 +388,7 @@ def _common_on_sim_remove_occult_type(original, self, *args, **kwargs) -> Any:
 
 @CommonInjectionUtils.inject_safely_into(ModInfo.get_identity(), SimInfo, SimInfo.set_current_outfit.__name__, handle_exceptions=False)
 def _common_on_sim_set_current_outfit(original, self, *args, **kwargs) -> Any:
-    old_outfit_category_and_index = CommonOutfitUtils.get_current_outfit(self)
+    old_outfit_category_and_index = CommonOutfitUtils.get_current_outfit(self) if CommonEventRegistry.get().has_listeners(S4CLSimAfterSetCurrentOutfitEvent) else None
     CommonSimEventDispatcherService.get()._on_sim_set_current_outfit(self, *args, **kwargs)
     result = original(self, *args, **kwargs)
     CommonSimEventDispatcherService.get()._after_sim_set_current_outfit(self, old_outfit_category_and_index, *args, **kwargs)
@@ -69,6 +69,8 @@ class CommonZoneUpdateEventDispatcherService(CommonService, HasLog):
                     return False
                 self._update_ticks(diff_ticks)
             self._last_absolute_ticks = absolute_ticks
+            if not CommonEventRegistry.get().has_listeners(S4CLZoneUpdateEvent):
+                return True
             return CommonEventRegistry.get().dispatch(S4CLZoneUpdateEvent(zone, is_paused, self.ticks_since_last_zone_update))
         except Exception as ex:
             self.log.error('Failed to run internal method \'{}\' at \'{}\'.'.format(CommonZoneUpdateEventDispatcherService._on_zone_update.__name__, Zone.update.__name__), exception=ex)
@@ -0,0 +1,122 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import threading
+import time
+from typing import Dict, Union, List, Tuple
+
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_teardown import S4CLZoneTeardownEvent
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.common_service import CommonService
+
+
+class _CommonCoalescedException:
+    def __init__(self, mod_name: str, custom_file_path: Union[str, None], description: str, occurred_time: float) -> None:
+        self.mod_name = mod_name
+        self.custom_file_path = custom_file_path
+        self.description = description
+        self.last_occurred_time = occurred_time
+        self.repeat_count = 0
+
+
+class CommonExceptionCoalescer(CommonService):
+    """CommonExceptionCoalescer()
+
+    Coalesces exceptions that occur repeatedly at the same place with the same message, so each occurrence is not written to disk and shown to the player.
+
+    .. note:: The first occurrence of an exception is logged in full. Occurrences with the same stack and description that follow within :attr:`SUMMARY_INTERVAL_IN_SECONDS` of the last one are only counted, and the count is written as a single summary line once per interval. Notifications are shown at most once per :attr:`NOTIFICATION_INTERVAL_IN_SECONDS` for each mod.
+
+    """
+    SUMMARY_INTERVAL_IN_SECONDS: float = 10.0
+    NOTIFICATION_INTERVAL_IN_SECONDS: float = 60.0
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._coalesced_exceptions: Dict[Tuple[str, Union[str, None], int, str], _CommonCoalescedException] = dict()
+        self._last_notification_times: Dict[str, float] = dict()
+        self._summary_timer: Union[threading.Timer, None] = None
+
+    def try_coalesce(self, mod_name: str, stack_signature: int, description: str, custom_file_path: str=None) -> bool:
+        """try_coalesce(mod_name, stack_signature, description, custom_file_path=None)
+
+        Count an exception if it already occurred recently with the same stack and description.
+
+        :param mod_name: The name of the mod logging the exception.
+        :type mod_name: str
+        :param stack_signature: The signature of the stack the exception occurred in. See :func:`~CommonStacktraceUtil.get_stack_signature`.
+        :type stack_signature: int
+        :param description: A short description of the exception, such as the logged message along with the type and message of the exception. Exceptions with different descriptions are never coalesced. It is also used in the summary of its repeated occurrences.
+        :type description: str
+        :param custom_file_path: The custom file path the exception is logged to. Default is None.
+        :type custom_file_path: str, optional
+        :return: True, if the exception was counted and should not be logged. False, if the exception should be logged in full.
+        :rtype: bool
+        """
+        key = (mod_name, custom_file_path, stack_signature, description)
+        occurred_time = time.monotonic()
+        with self._lock:
+            coalesced_exception = self._coalesced_exceptions.get(key, None)
+            if coalesced_exception is None or (coalesced_exception.repeat_count == 0 and occurred_time - coalesced_exception.last_occurred_time >= self.SUMMARY_INTERVAL_IN_SECONDS):
+                self._coalesced_exceptions[key] = _CommonCoalescedException(mod_name, custom_file_path, description, occurred_time)
+                return False
+            coalesced_exception.repeat_count += 1
+            coalesced_exception.last_occurred_time = occurred_time
+            if self._summary_timer is None:
+                self._summary_timer = threading.Timer(self.SUMMARY_INTERVAL_IN_SECONDS, self.write_summaries)
+                self._summary_timer.daemon = True
+                self._summary_timer.start()
+        return True
+
+    def should_notify(self, mod_name: str) -> bool:
+        """should_notify(mod_name)
+
+        Determine if the player should be notified about an exception of a mod, at most once per :attr:`NOTIFICATION_INTERVAL_IN_SECONDS`.
+
+        :param mod_name: The name of the mod the exception occurred in.
+        :type mod_name: str
+        :return: True, if the player should be notified. False, if the player was notified about an exception of the mod recently.
+        :rtype: bool
+        """
+        notification_time = time.monotonic()
+        with self._lock:
+            last_notification_time = self._last_notification_times.get(mod_name, None)
+            if last_notification_time is not None and notification_time - last_notification_time < self.NOTIFICATION_INTERVAL_IN_SECONDS:
+                return False
+            self._last_notification_times[mod_name] = notification_time
+        return True
+
+    def write_summaries(self) -> None:
+        """write_summaries()
+
+        Write a summary line for each exception that repeated since the last summaries were written.
+        """
+        summaries: List[Tuple[str, Union[str, None], str]] = list()
+        current_time = time.monotonic()
+        with self._lock:
+            self._summary_timer = None
+            for (key, coalesced_exception) in tuple(self._coalesced_exceptions.items()):
+                if coalesced_exception.repeat_count == 0:
+                    if current_time - coalesced_exception.last_occurred_time >= self.SUMMARY_INTERVAL_IN_SECONDS:
+                        del self._coalesced_exceptions[key]
+                    continue
+                summaries.append((coalesced_exception.mod_name, coalesced_exception.custom_file_path, f'Exception repeated x{coalesced_exception.repeat_count} in the last {self.SUMMARY_INTERVAL_IN_SECONDS:g}s: {coalesced_exception.description}'))
+                coalesced_exception.repeat_count = 0
+        if not summaries:
+            return
+        from sims4communitylib.logging.common_log_file_writer import CommonLogFileWriter
+        from sims4communitylib.utils.common_date_utils import CommonRealDateUtils
+        from sims4communitylib.utils.common_log_utils import CommonLogUtils
+        for (mod_name, custom_file_path, summary) in summaries:
+            file_path = CommonLogUtils.get_exceptions_file_path(mod_name, custom_file_path=custom_file_path)
+            CommonLogFileWriter().write(file_path, '[{}] {} {}\n'.format(mod_name, CommonRealDateUtils.get_current_date_string(), summary))
+
+
+@CommonEventRegistry.handle_events(ModInfo.get_identity())
+def _common_write_exception_summaries_on_zone_teardown(event_data: S4CLZoneTeardownEvent) -> bool:
+    CommonExceptionCoalescer().write_summaries()
+    return True
@@ -10,7 +10,6 @@ from typing import Any, Callable, Union
 from sims4communitylib.exceptions.common_stacktrace_utils import CommonStacktraceUtil
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 from sims4communitylib.utils.common_date_utils import CommonRealDateUtils
-from sims4communitylib.utils.common_io_utils import CommonIOUtils
 
 
 class CommonExceptionHandler:
@@ -24,6 +23,8 @@ class CommonExceptionHandler:
 
         Manually log an exception with a custom message.
 
+        .. note:: When the same exception occurs again shortly after at the same place, it is only counted and summarized instead. See :class:`.CommonExceptionCoalescer` for more details.
+
         :param mod_identifier: The name or identity of the mod logging the exception.
         :type mod_identifier: Union[str, CommonModIdentity]
         :param exception_message: A message to provide more information about the exception.
@@ -37,6 +38,9 @@ class CommonExceptionHandler:
         """
         from sims4communitylib.utils.misc.common_mod_identity_utils import CommonModIdentityUtils
         mod_identifier = CommonModIdentityUtils.determine_mod_name_from_identifier(mod_identifier)
+        from sims4communitylib.exceptions.common_exception_coalescer import CommonExceptionCoalescer
+        if CommonExceptionCoalescer().try_coalesce(mod_identifier, CommonStacktraceUtil.get_stack_signature(exception=exception), '{} -> {}: {}'.format(exception_message, type(exception).__name__, exception), custom_file_path=custom_file_path):
+            return True
         exceptions = CommonStacktraceUtil.get_full_stack_trace()
         stack_trace = '{}{} -> {}: {}\n'.format(''.join(exceptions), exception_message, type(exception).__name__, exception)
         from sims4communitylib.utils.common_log_registry import CommonLogUtils
@@ -80,7 +84,8 @@ class CommonExceptionHandler:
         from sims4communitylib.utils.misc.common_mod_identity_utils import CommonModIdentityUtils
         mod_identifier = CommonModIdentityUtils.determine_mod_name_from_identifier(mod_identifier)
         exception_traceback_text = '[{}] {} {}\n'.format(mod_identifier, CommonRealDateUtils.get_current_date_string(), _traceback)
-        return CommonIOUtils.write_to_file(file_path, exception_traceback_text, ignore_errors=True)
+        from sims4communitylib.logging.common_log_file_writer import CommonLogFileWriter
+        return CommonLogFileWriter().write(file_path, exception_traceback_text, flush_immediately=True)
 
     @staticmethod
     def _notify_exception_occurred(file_path: str, mod_identifier: Union[str, CommonModIdentity]=None):
@@ -92,6 +97,9 @@ class CommonExceptionHandler:
             return
         from sims4communitylib.utils.misc.common_mod_identity_utils import CommonModIdentityUtils
         mod_identifier = CommonModIdentityUtils.determine_mod_name_from_identifier(mod_identifier)
+        from sims4communitylib.exceptions.common_exception_coalescer import CommonExceptionCoalescer
+        if not CommonExceptionCoalescer().should_notify(mod_identifier):
+            return
         basic_notification = CommonBasicNotification(
             CommonStringId.EXCEPTION_OCCURRED_TITLE_FOR_MOD,
             CommonStringId.EXCEPTION_OCCURRED_TEXT,
@@ -71,3 +71,28 @@ class CommonStacktraceUtil:
         else:
             exceptions = traceback.format_stack()
         return exceptions
+
+    @staticmethod
+    def get_stack_signature(exception: BaseException=None) -> int:
+        """get_stack_signature(exception=None)
+
+        Retrieve a signature of the current stack and the traceback of an exception, without formatting them.
+
+        .. note:: The signature is the same each time an exception occurs at the same place through the same calls.
+
+        :param exception: The exception to include the traceback of. If not specified, the traceback of the exception currently being handled is included. Default is None.
+        :type exception: BaseException, optional
+        :return: A signature of the stack.
+        :rtype: int
+        """
+        signature = list()
+        exception_traceback = getattr(exception, '__traceback__', None) or sys.exc_info()[2]
+        while exception_traceback is not None:
+            code = exception_traceback.tb_frame.f_code
+            signature.append((code.co_filename, code.co_name, exception_traceback.tb_lineno))
+            exception_traceback = exception_traceback.tb_next
+        frame = sys._getframe(1)
+        while frame is not None:
+            signature.append((frame.f_code.co_filename, frame.f_code.co_name, frame.f_lineno))
+            frame = frame.f_back
+        return hash((type(exception).__name__, tuple(signature)))
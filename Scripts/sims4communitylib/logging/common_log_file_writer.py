@@ -0,0 +1,220 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import atexit
+import os
+import threading
+from collections import deque
+from typing import Dict, Deque, List, Tuple, Union, TextIO
+
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_teardown import S4CLZoneTeardownEvent
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_io_utils import CommonIOUtils
+from sims4communitylib.utils.common_log_utils import CommonLogUtils
+
+
+class CommonLogFileWriter(CommonService):
+    """CommonLogFileWriter()
+
+    Buffers text written to log files and writes it to disk on a background thread.
+
+    .. note:: Text is flushed once per :attr:`FLUSH_INTERVAL_IN_SECONDS` or as soon as :attr:`FLUSH_THRESHOLD_IN_CHARACTERS` characters are waiting, whichever comes first. Files are kept open between flushes and are rolled over once they grow past the `max_output_file_size_in_bytes` configuration value.
+
+    .. note:: Buffering can be turned off via the `enable_buffered_log_writing` configuration value, in which case text is written to disk as it is received.
+
+    :Example usage:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        # Queue a line of text to be written to a file.
+        CommonLogFileWriter().write(file_path, 'A line of text.\\n')
+        # Write a line of text to a file immediately, along with anything queued for that file before it.
+        CommonLogFileWriter().write(file_path, 'An important line of text.\\n', flush_immediately=True)
+
+    """
+    FLUSH_INTERVAL_IN_SECONDS: float = 1.0
+    FLUSH_THRESHOLD_IN_CHARACTERS: int = 65536
+    MAX_QUEUED_WRITES_PER_FILE: int = 10000
+
+    def __init__(self) -> None:
+        self._buffer_lock = threading.Lock()
+        self._file_lock = threading.RLock()
+        self._flush_requested = threading.Event()
+        self._flush_thread: Union[threading.Thread, None] = None
+        self._queued_writes: Dict[str, Deque[str]] = dict()
+        self._queued_character_count = 0
+        self._open_files: Dict[str, TextIO] = dict()
+        self._buffering_enabled: Union[bool, None] = None
+        self._max_file_size_in_bytes: Union[int, None] = None
+        atexit.register(self.close)
+
+    @property
+    def buffering_enabled(self) -> bool:
+        """Determine if text is buffered before being written to disk.
+
+        :return: True, if text is buffered and written on a background thread. False, if text is written to disk as it is received.
+        :rtype: bool
+        """
+        if self._buffering_enabled is None:
+            # Writes made while the configuration is loading go straight to disk.
+            self._buffering_enabled = False
+            from sims4communitylib.s4cl_configuration import S4CLConfiguration
+            self._max_file_size_in_bytes = S4CLConfiguration().max_output_file_size_in_bytes
+            self._buffering_enabled = S4CLConfiguration().enable_buffered_log_writing
+        return self._buffering_enabled
+
+    def write(self, file_path: str, text: str, flush_immediately: bool = False) -> bool:
+        """write(file_path, text, flush_immediately=False)
+
+        Queue text to be appended to a file.
+
+        :param file_path: The file to append the text to.
+        :type file_path: str
+        :param text: The text to append.
+        :type text: str
+        :param flush_immediately: If True, the text and anything queued for the file before it will be written before this function returns. Default is False.
+        :type flush_immediately: bool, optional
+        :return: True, if the text was queued or written successfully. False, if not.
+        :rtype: bool
+        """
+        if file_path is None or text is None:
+            return False
+        if not self.buffering_enabled:
+            with self._file_lock:
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                if not CommonIOUtils.write_to_file(file_path, text, ignore_errors=True):
+                    return False
+                self._roll_over_file_if_too_big(file_path)
+                return True
+        with self._buffer_lock:
+            queued_writes = self._queued_writes.get(file_path, None)
+            if queued_writes is None:
+                queued_writes = deque()
+                self._queued_writes[file_path] = queued_writes
+            queued_writes.append(text)
+            self._queued_character_count += len(text)
+            queue_is_full = len(queued_writes) >= self.MAX_QUEUED_WRITES_PER_FILE
+            flush_threshold_reached = self._queued_character_count >= self.FLUSH_THRESHOLD_IN_CHARACTERS
+        if flush_immediately or queue_is_full:
+            # A full queue is written by the caller rather than dropping text.
+            return self.flush(file_path=file_path)
+        self._start_flush_thread()
+        if flush_threshold_reached:
+            self._flush_requested.set()
+        return True
+
+    def flush(self, file_path: str = None) -> bool:
+        """flush(file_path=None)
+
+        Write queued text to disk.
+
+        :param file_path: If specified, only text queued for this file will be written. If not specified, text queued for all files will be written. Default is None.
+        :type file_path: str, optional
+        :return: True, if all queued text was written successfully. False, if not.
+        :rtype: bool
+        """
+        result = True
+        with self._file_lock:
+            for (queued_file_path, queued_writes) in self._take_queued_writes(file_path=file_path):
+                if not self._write_to_file(queued_file_path, ''.join(queued_writes)):
+                    result = False
+        return result
+
+    def close(self) -> None:
+        """close()
+
+        Write all queued text to disk and close any files kept open by the writer.
+        """
+        with self._file_lock:
+            self.flush()
+            for file_path in tuple(self._open_files.keys()):
+                self._close_file(file_path)
+
+    def reload(self) -> None:
+        """reload()
+
+        Write all queued text to disk, close any files kept open by the writer, and read the configuration values of the writer again the next time text is written.
+        """
+        with self._file_lock:
+            self.close()
+            self._buffering_enabled = None
+            self._max_file_size_in_bytes = None
+
+    def _take_queued_writes(self, file_path: str = None) -> List[Tuple[str, Deque[str]]]:
+        with self._buffer_lock:
+            if file_path is not None:
+                queued_writes = self._queued_writes.pop(file_path, None)
+                if not queued_writes:
+                    return list()
+                self._queued_character_count -= sum([len(text) for text in queued_writes])
+                return [(file_path, queued_writes)]
+            all_queued_writes = list(self._queued_writes.items())
+            self._queued_writes = dict()
+            self._queued_character_count = 0
+            return all_queued_writes
+
+    def _write_to_file(self, file_path: str, text: str) -> bool:
+        try:
+            opened_file = self._open_files.get(file_path, None)
+            if opened_file is None:
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                opened_file = open(file_path, mode='a', encoding='utf-8')
+                self._open_files[file_path] = opened_file
+            opened_file.write(text)
+            opened_file.flush()
+            if self._max_file_size_in_bytes and opened_file.tell() > self._max_file_size_in_bytes:
+                self._close_file(file_path)
+                CommonLogUtils._roll_over_file(file_path)
+        except Exception:
+            self._close_file(file_path)
+            return False
+        return True
+
+    def _roll_over_file_if_too_big(self, file_path: str) -> None:
+        if not self._max_file_size_in_bytes:
+            return
+        # noinspection PyBroadException
+        try:
+            if os.path.getsize(file_path) > self._max_file_size_in_bytes:
+                CommonLogUtils._roll_over_file(file_path)
+        except:
+            pass
+
+    def _close_file(self, file_path: str) -> None:
+        opened_file = self._open_files.pop(file_path, None)
+        if opened_file is None:
+            return
+        # noinspection PyBroadException
+        try:
+            opened_file.close()
+        except:
+            pass
+
+    def _start_flush_thread(self) -> None:
+        if self._flush_thread is not None and self._flush_thread.is_alive():
+            return
+        self._flush_thread = threading.Thread(target=self._run_flush_thread, name='S4CLLogFileWriter', daemon=True)
+        self._flush_thread.start()
+
+    def _run_flush_thread(self) -> None:
+        while True:
+            self._flush_requested.wait(self.FLUSH_INTERVAL_IN_SECONDS)
+            self._flush_requested.clear()
+            # noinspection PyBroadException
+            try:
+                self.flush()
+            except:
+                continue
+
+
+@CommonEventRegistry.handle_events(ModInfo.get_identity())
+def _common_flush_log_files_on_zone_teardown(event_data: S4CLZoneTeardownEvent) -> bool:
+    CommonLogFileWriter().flush()
+    return True
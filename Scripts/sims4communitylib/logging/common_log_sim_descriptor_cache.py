@@ -0,0 +1,115 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from collections import OrderedDict
+from typing import Any, Tuple, Union
+
+from sims.sim_info import SimInfo
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.sim.events.sim_added_occult_type import S4CLSimAddedOccultTypeEvent
+from sims4communitylib.events.sim.events.sim_changed_age import S4CLSimChangedAgeEvent
+from sims4communitylib.events.sim.events.sim_changed_occult_type import S4CLSimChangedOccultTypeEvent
+from sims4communitylib.events.sim.events.sim_removed_occult_type import S4CLSimRemovedOccultTypeEvent
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.common_type_utils import CommonTypeUtils
+from sims4communitylib.utils.sims.common_sim_name_utils import CommonSimNameUtils
+from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
+
+
+class CommonLogSimDescriptorCache(CommonService):
+    """CommonLogSimDescriptorCache()
+
+    Caches the text used to describe Sims within log messages.
+
+    .. note:: Descriptors are kept for the most recently logged :attr:`MAX_CACHED_DESCRIPTORS` Sims. The cached Sim Types of a Sim are discarded when that Sim changes age or occult type. Names are read each time, so renamed Sims are logged with their new name.
+
+    """
+    MAX_CACHED_DESCRIPTORS: int = 256
+    _NON_SIM_TYPES = frozenset((str, int, float, bool, bytes, type(None), tuple, list, dict, set, frozenset))
+
+    def __init__(self) -> None:
+        self._sim_type_descriptors: 'OrderedDict[int, str]' = OrderedDict()
+
+    def get_descriptor(self, value: Any, include_sim_types: bool = False) -> Union[str, None]:
+        """get_descriptor(value, include_sim_types=False)
+
+        Retrieve the text used to describe a Sim within a log message.
+
+        :param value: The value being logged.
+        :type value: Any
+        :param include_sim_types: If True, the Sim Types and Current Sim Type of the Sim will be included. Default is False.
+        :type include_sim_types: bool, optional
+        :return: The text describing the Sim or None if the value is not a Sim, SimInfo, or SimInfoBaseWrapper.
+        :rtype: Union[str, None]
+        """
+        if type(value) in self._NON_SIM_TYPES:
+            return None
+        if CommonTypeUtils.is_sim_info(value):
+            obj_type_acronym = 'SI'
+        elif CommonTypeUtils.is_sim_instance(value):
+            obj_type_acronym = 'S'
+        elif CommonTypeUtils.is_sim_info_base_wrapper(value):
+            obj_type_acronym = 'SIBW'
+        else:
+            return None
+        sim_id = CommonSimUtils.get_sim_id(value)
+        if include_sim_types:
+            return '{} ({}, {}) [{}]'.format(CommonSimNameUtils.get_full_name(value), str(sim_id), self._get_sim_type_descriptor(sim_id, value), obj_type_acronym)
+        return '{} ({}) [{}]'.format(CommonSimNameUtils.get_full_name(value), str(sim_id), obj_type_acronym)
+
+    def clear(self, sim_info: SimInfo = None) -> None:
+        """clear(sim_info=None)
+
+        Discard cached descriptors.
+
+        :param sim_info: If specified, only the descriptor of this Sim will be discarded. If not specified, all descriptors will be discarded. Default is None.
+        :type sim_info: SimInfo, optional
+        """
+        if sim_info is None:
+            self._sim_type_descriptors.clear()
+            return
+        self._sim_type_descriptors.pop(CommonSimUtils.get_sim_id(sim_info), None)
+
+    def _get_sim_type_descriptor(self, sim_id: int, value: Any) -> str:
+        sim_type_descriptor = self._sim_type_descriptors.get(sim_id, None)
+        if sim_type_descriptor is not None:
+            self._sim_type_descriptors.move_to_end(sim_id)
+            return sim_type_descriptor
+        from sims4communitylib.utils.sims.common_sim_type_utils import CommonSimTypeUtils
+        sim_info = CommonSimUtils.get_sim_info(value)
+        sim_types: Tuple = tuple(CommonSimTypeUtils.get_all_sim_types_gen(sim_info, combine_teen_young_adult_and_elder_age=False, combine_child_dog_types=False))
+        current_sim_type = CommonSimTypeUtils.determine_sim_type(sim_info, combine_teen_young_adult_and_elder_age=False, combine_child_dog_types=False, use_current_occult_type=True)
+        sim_type_descriptor = '({}), C:{}'.format(', '.join([sim_type.name for sim_type in sim_types]), current_sim_type.name)
+        self._sim_type_descriptors[sim_id] = sim_type_descriptor
+        if len(self._sim_type_descriptors) > self.MAX_CACHED_DESCRIPTORS:
+            self._sim_type_descriptors.popitem(last=False)
+        return sim_type_descriptor
+
+
+@CommonEventRegistry.handle_events(ModInfo.get_identity())
+def _common_clear_log_sim_descriptor_on_sim_changed_age(event_data: S4CLSimChangedAgeEvent) -> bool:
+    CommonLogSimDescriptorCache().clear(sim_info=event_data.sim_info)
+    return True
+
+
+@CommonEventRegistry.handle_events(ModInfo.get_identity())
+def _common_clear_log_sim_descriptor_on_sim_added_occult_type(event_data: S4CLSimAddedOccultTypeEvent) -> bool:
+    CommonLogSimDescriptorCache().clear(sim_info=event_data.sim_info)
+    return True
+
+
+@CommonEventRegistry.handle_events(ModInfo.get_identity())
+def _common_clear_log_sim_descriptor_on_sim_changed_occult_type(event_data: S4CLSimChangedOccultTypeEvent) -> bool:
+    CommonLogSimDescriptorCache().clear(sim_info=event_data.sim_info)
+    return True
+
+
+@CommonEventRegistry.handle_events(ModInfo.get_identity())
+def _common_clear_log_sim_descriptor_on_sim_removed_occult_type(event_data: S4CLSimRemovedOccultTypeEvent) -> bool:
+    CommonLogSimDescriptorCache().clear(sim_info=event_data.sim_info)
+    return True
@@ -11,8 +11,12 @@ from typing import Dict, Any, Callable
 from typing import Union
 from objects.game_object import GameObject
 from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.game_object.events.game_object_pre_deleted import S4CLGameObjectPreDeletedEvent
 from sims4communitylib.logging.has_class_log import HasClassLog
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.persistence.data_stores.common_data_store import CommonDataStore
 from sims4communitylib.utils.common_type_utils import CommonTypeUtils
 from sims4communitylib.utils.objects.common_object_utils import CommonObjectUtils
 
@@ -20,36 +24,83 @@ from sims4communitylib.utils.objects.common_object_utils import CommonObjectUtil
 class _CommonGameObjectDataStorageMetaclass(type):
     _game_object_storage_instances: Dict[str, Dict[int, '_CommonGameObjectDataStorageMetaclass']] = dict()
 
+    def __init__(cls, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Located the first time the storage is created, the mod identity may not be available while the class is being created.
+        cls._storage_instances_by_game_object_id: Union[Dict[int, '_CommonGameObjectDataStorageMetaclass'], None] = None
+        cls._max_storage_instance_count: Union[int, None] = None
+
     def __call__(cls, game_object: GameObject):
-        mod_identity = cls.get_mod_identity()
+        storage_instances = cls._storage_instances_by_game_object_id
+        if storage_instances is None:
+            storage_instances = cls._locate_storage_instances()
+            if storage_instances is None:
+                return None
         game_object_id = CommonObjectUtils.get_object_id(game_object)
-        mod_name = mod_identity.name
+        stored_obj = storage_instances.get(game_object_id, None)
+        if stored_obj is None or stored_obj.__class__ is not cls:
+            stored_obj = super(_CommonGameObjectDataStorageMetaclass, cls).__call__(game_object)
+            storage_instances[game_object_id] = stored_obj
+            if cls._max_storage_instance_count is not None:
+                while len(storage_instances) > cls._max_storage_instance_count:
+                    _CommonGameObjectDataStorageMetaclass._evict_instance(storage_instances, next(iter(storage_instances)))
+        elif cls._max_storage_instance_count is not None:
+            # Moved to the end, so the least recently used storages are evicted first.
+            del storage_instances[game_object_id]
+            storage_instances[game_object_id] = stored_obj
+        return stored_obj
+
+    def _locate_storage_instances(cls) -> Union[Dict[int, '_CommonGameObjectDataStorageMetaclass'], None]:
+        mod_name = cls.get_mod_identity().name
         if mod_name is None:
             return None
         identifier = f'{mod_name}_{cls.__name__}'
-        if identifier not in cls._game_object_storage_instances:
-            cls._game_object_storage_instances[identifier] = dict()
-        if game_object_id not in cls._game_object_storage_instances[identifier]:
-            cls._game_object_storage_instances[identifier][game_object_id] = super(_CommonGameObjectDataStorageMetaclass, cls).__call__(game_object)
-        stored_obj = cls._game_object_storage_instances[identifier][game_object_id]
-        if stored_obj.__class__.__name__ != cls.__name__:
-            cls._game_object_storage_instances[identifier][game_object_id] = super(_CommonGameObjectDataStorageMetaclass, cls).__call__(game_object)
-        return cls._game_object_storage_instances[identifier][game_object_id]
+        if identifier not in _CommonGameObjectDataStorageMetaclass._game_object_storage_instances:
+            _CommonGameObjectDataStorageMetaclass._game_object_storage_instances[identifier] = dict()
+        cls._storage_instances_by_game_object_id = _CommonGameObjectDataStorageMetaclass._game_object_storage_instances[identifier]
+        cls._max_storage_instance_count = cls.get_max_storage_instance_count()
+        return cls._storage_instances_by_game_object_id
 
     # noinspection PyMissingOrEmptyDocstring
     @classmethod
     def get_mod_identity(mcs) -> CommonModIdentity:
         raise NotImplementedError()
 
+    # noinspection PyMissingOrEmptyDocstring
     @classmethod
-    def clear_instances(mcs, mod_identity: CommonModIdentity) -> None:
+    def get_max_storage_instance_count(mcs) -> Union[int, None]:
+        raise NotImplementedError()
+
+    def clear_instances(cls, mod_identity: CommonModIdentity) -> None:
         """Clear the cached instances of this type of Object Storage."""
         mod_name = mod_identity.name
         if mod_name is None:
             return
-        identifier = f'{mod_name}_{mcs.__name__}'
+        identifier = f'{mod_name}_{cls.__name__}'
         if identifier in _CommonGameObjectDataStorageMetaclass._game_object_storage_instances:
-            del _CommonGameObjectDataStorageMetaclass._game_object_storage_instances[identifier]
+            # Cleared in place, since the type of Object Storage keeps the instances it located.
+            _CommonGameObjectDataStorageMetaclass._game_object_storage_instances[identifier].clear()
+
+    @classmethod
+    def _clear_all_instances(mcs) -> None:
+        for storage_instances in _CommonGameObjectDataStorageMetaclass._game_object_storage_instances.values():
+            storage_instances.clear()
+
+    @classmethod
+    def _evict_instances(mcs, game_object_id: int, persisted_only: bool=False) -> None:
+        for storage_instances in _CommonGameObjectDataStorageMetaclass._game_object_storage_instances.values():
+            if game_object_id not in storage_instances:
+                continue
+            if persisted_only and not hasattr(storage_instances[game_object_id], '_save_persisted_data'):
+                continue
+            mcs._evict_instance(storage_instances, game_object_id)
+
+    @staticmethod
+    def _evict_instance(storage_instances: Dict[int, '_CommonGameObjectDataStorageMetaclass'], game_object_id: int) -> None:
+        data_storage = storage_instances.pop(game_object_id)
+        if hasattr(data_storage, '_save_persisted_data'):
+            # Flushed to the data store, so the data is loaded again the next time the storage is created.
+            data_storage._save_persisted_data()
 
 
 class _CommonGameObjectDataStorage(HasClassLog, metaclass=_CommonGameObjectDataStorageMetaclass):
@@ -60,6 +111,7 @@ class _CommonGameObjectDataStorage(HasClassLog, metaclass=_CommonGameObjectDataS
         self._game_object_id = CommonObjectUtils.get_object_id(game_object)
         self._game_object = game_object
         self._data: Dict[str, Any] = dict()
+        self._has_unsaved_changes = False
 
     # noinspection PyMissingOrEmptyDocstring
     @classmethod
@@ -71,6 +123,19 @@ class _CommonGameObjectDataStorage(HasClassLog, metaclass=_CommonGameObjectDataS
     def get_log_identifier(cls) -> str:
         return '{}_game_object_data_storage'.format(cls.get_mod_identity().base_namespace)
 
+    @classmethod
+    def get_max_storage_instance_count(cls) -> Union[int, None]:
+        """get_max_storage_instance_count()
+
+        The maximum number of Game Objects to keep instances of this storage for. When exceeded, the instance used the least recently is removed.
+
+        .. warning:: Data stored within a storage that does not persist its data is lost when its instance is removed!
+
+        :return: The maximum number of instances to keep or None to keep an instance for every Game Object. Default is None.
+        :rtype: Union[int, None]
+        """
+        return None
+
     @property
     def game_object(self) -> GameObject:
         """The GameObject the storage applies to.
@@ -89,6 +154,17 @@ class _CommonGameObjectDataStorage(HasClassLog, metaclass=_CommonGameObjectDataS
         """
         return self._game_object_id
 
+    @property
+    def _mark_unsaved_changes_on_mutable_read(self) -> bool:
+        """Determine if retrieving data that can be modified in place, such as a list or a dictionary, is treated as a change.
+
+        .. note:: Override this to return False when all data modified in place is followed by invoking :func:`~mark_dirty`, so reading data alone does not cause the storage to be saved again.
+
+        :return: True, if retrieving data that can be modified in place is treated as a change. False, if not. Default is True.
+        :rtype: bool
+        """
+        return True
+
     def get_data(self, default: Any=None, key: str=None, encode: Callable[[Any], Any]=None, decode: Callable[[Any], Any]=None) -> Union[Any, None]:
         """get_data(default=None, key=None, encode=None, decode=None)
 
@@ -106,7 +182,7 @@ class _CommonGameObjectDataStorage(HasClassLog, metaclass=_CommonGameObjectDataS
         :rtype: Union[Any, None]
         """
         # noinspection PyUnresolvedReferences
-        key = key or str(sys._getframe(1).f_code.co_name)
+        key = key or sys._getframe(1).f_code.co_name
         if key not in self._data:
             self.log.format_with_message('Key not found in data.', key=key, data=self._data)
             if default is not None:
@@ -114,12 +190,20 @@ class _CommonGameObjectDataStorage(HasClassLog, metaclass=_CommonGameObjectDataS
                     self._data[key] = encode(default)
                 else:
                     self._data[key] = default
+                self._has_unsaved_changes = True
             return default
         data = self._data.get(key)
+        # noinspection PyProtectedMember
+        if self._mark_unsaved_changes_on_mutable_read and not CommonDataStore._is_immutable_value(data):
+            # The value may be modified without setting it again.
+            self._has_unsaved_changes = True
         if decode is not None and not isinstance(data, CommonSerializable):
             decoded = decode(data)
-            if isinstance(data, CommonSerializable):
+            if isinstance(decoded, CommonSerializable):
+                # Stored in place of the data, it is serialized again when saving.
                 self._data[key] = decoded
+                if self._mark_unsaved_changes_on_mutable_read:
+                    self._has_unsaved_changes = True
             return decoded
         return data
 
@@ -136,10 +220,11 @@ class _CommonGameObjectDataStorage(HasClassLog, metaclass=_CommonGameObjectDataS
         :type encode: Callable[[Any], Any], optional
         """
         # noinspection PyUnresolvedReferences
-        key = key or str(sys._getframe(1).f_code.co_name)
+        key = key or sys._getframe(1).f_code.co_name
         if encode is not None:
             value = encode(value)
         self._data[key] = value
+        self._has_unsaved_changes = True
 
     def remove_data(self, key: str=None):
         """remove_data(key=None)
@@ -150,11 +235,26 @@ class _CommonGameObjectDataStorage(HasClassLog, metaclass=_CommonGameObjectDataS
         :type key: str, optional
         """
         # noinspection PyUnresolvedReferences
-        key = key or str(sys._getframe(1).f_code.co_name)
+        key = key or sys._getframe(1).f_code.co_name
         if key not in self._data:
             self.log.format_with_message('Key not found in data.', key=key, data=self._data)
             return
         del self._data[key]
+        self._has_unsaved_changes = True
+
+    def mark_dirty(self, key: str=None):
+        """mark_dirty(key=None)
+
+        Mark stored data as changed, so it is saved. Invoke this after modifying data in place, such as appending to a list retrieved using :func:`~get_data`.
+
+        :param key: The key for the data. If None, the name of the calling function will be used.
+        :type key: str, optional
+        """
+        # noinspection PyUnresolvedReferences
+        key = key or sys._getframe(1).f_code.co_name
+        if key not in self._data:
+            return
+        self._has_unsaved_changes = True
 
     def __repr__(self) -> str:
         return ''.join(['{}: {}\n'.format(pformat(key), pformat(value)) for (key, value) in self._data.items()])
@@ -228,3 +328,9 @@ class _ExampleGameObjectDataStorage(CommonGameObjectDataStorage):
     def example_property_one(self, value: bool):
         # Could also be written self.set_data(value, key='example_property_one') and it would do the same thing.
         self.set_data(value)
+
+
+@CommonEventRegistry.handle_events(ModInfo.get_identity())
+def _common_evict_game_object_data_storages_on_game_object_pre_deleted(event_data: S4CLGameObjectPreDeletedEvent) -> bool:
+    _CommonGameObjectDataStorageMetaclass._evict_instances(CommonObjectUtils.get_object_id(event_data.game_object))
+    return True
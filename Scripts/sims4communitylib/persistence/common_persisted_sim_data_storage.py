@@ -63,7 +63,9 @@ class CommonPersistedSimDataStorage(CommonSimDataStorage):
         from sims4communitylib.persistence.data_management.common_data_manager_registry import CommonDataManagerRegistry
         self._data_manager_registry = CommonDataManagerRegistry()
         self.__data_manager: CommonDataManager = None
+        self._saved_data_store: CommonDataStore = None
         self._data = self._load_persisted_data()
+        self._has_unsaved_changes = False
 
     # noinspection PyMissingOrEmptyDocstring
     @classmethod
@@ -130,9 +132,14 @@ class CommonPersistedSimDataStorage(CommonSimDataStorage):
         return data
 
     def _save_persisted_data(self) -> None:
+        data_store = self._data_manager.get_data_store_by_type(self.data_store_type)
+        if not self._has_unsaved_changes and data_store is self._saved_data_store:
+            return
         data_to_save = dict()
+        whitelist_property_names = set(self.whitelist_property_names)
+        blacklist_property_names = set(self.blacklist_property_names)
         for data_property_name in self._data.keys():
-            if data_property_name not in self.whitelist_property_names or data_property_name in self.blacklist_property_names:
+            if data_property_name not in whitelist_property_names or data_property_name in blacklist_property_names:
                 continue
             data = self._data[data_property_name]
             if self._persist_empty_values:
@@ -145,13 +152,21 @@ class CommonPersistedSimDataStorage(CommonSimDataStorage):
                     continue
                 data_to_save[data_property_name] = serialized_data
         data_to_save = self.customize_data_pre_save(data_to_save)
+        self._has_unsaved_changes = False
+        self._saved_data_store = data_store
         if data_to_save is None:
             return
         if not self._persist_empty_values:
             if not data_to_save:
-                self._data_manager.get_data_store_by_type(self.data_store_type).remove_data_by_key(str(self.sim_id))
+                data_store.remove_data_by_key(str(self.sim_id))
                 return
-        self._data_manager.get_data_store_by_type(self.data_store_type).set_value_by_key(str(self.sim_id), data_to_save)
+        data_store.set_value_by_key(str(self.sim_id), data_to_save)
 
     def _load_persisted_data(self) -> Dict[str, Any]:
-        return self._data_manager.get_data_store_by_type(self.data_store_type).get_value_by_key(str(self.sim_id))
+        data_store = self._data_manager.get_data_store_by_type(self.data_store_type)
+        self._saved_data_store = data_store
+        # Changes to the loaded data are tracked by this storage, not by the data store.
+        has_unsaved_changes = data_store.has_unsaved_changes
+        data = data_store.get_value_by_key(str(self.sim_id))
+        data_store.has_unsaved_changes = has_unsaved_changes
+        return data
@@ -5,7 +5,7 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Dict, Any, Type, Tuple
+from typing import Dict, Any, Type, Tuple, Union
 
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 from sims4communitylib.logging.has_log import HasLog
@@ -37,6 +37,8 @@ class CommonDataManager(HasLog):
         self._loaded = False
         self._can_be_saved = True
         self._persistence_service = None
+        self._has_unsaved_changes = False
+        self._saved_save_slot_key: Union[Tuple[int, int], None] = None
 
     @property
     def _can_be_saved(self) -> bool:
@@ -106,7 +108,12 @@ class CommonDataManager(HasLog):
 
         default_data_store.update_data(self._data_store_data[name])
         self.log.format_with_message('Created data store', name=default_data_store.get_identifier())
-        self._data_store_data[name] = default_data_store.get_store_data_for_persistence()
+        data_store_data = default_data_store.get_store_data_for_persistence()
+        if data_store_data != self._data_store_data[name]:
+            # Defaults or a new version were applied to the loaded data.
+            self._has_unsaved_changes = True
+        self._data_store_data[name] = data_store_data
+        default_data_store.has_unsaved_changes = False
         self._data_stores[name] = default_data_store
         return self._data_stores[name]
 
@@ -125,6 +132,8 @@ class CommonDataManager(HasLog):
             self.log.error('Error occurred while loading data \'{}\'.'.format(self.__repr__()), exception=ex)
             self.__data_store_data = dict()
             self._loaded = True
+        self._has_unsaved_changes = False
+        self._saved_save_slot_key = self._get_save_slot_key()
 
     def reload(self) -> None:
         """reload()
@@ -139,16 +148,32 @@ class CommonDataManager(HasLog):
 
         Save data from the data manager.
 
-        :return: True, if save was successful. False, if not.
+        .. note:: Only data stores with unsaved changes are serialized. When nothing has changed since the last save or load of the current save slot, the persistence services are not used at all. Retrieving a value that can be modified in place from a data store counts as a change, see :func:`~CommonDataStore.has_unsaved_changes`.
+
+        :return: True, if save was successful or there was nothing to save. False, if not.
         :rtype: bool
         """
         try:
             self.log.debug('Saving data.')
-            # Update global data with data from the data stores.
+            data_store_data = self._data_store_data
+            save_slot_key = self._get_save_slot_key()
+            has_unsaved_changes = self._has_unsaved_changes or save_slot_key != self._saved_save_slot_key
+            # Update global data with data from the changed data stores.
             for (name, data_store) in self._data_stores.items():
                 data_store: CommonDataStore = data_store
-                self._data_store_data[name] = data_store.get_store_data_for_persistence()
-            return self._save()
+                if not data_store.has_unsaved_changes:
+                    continue
+                data_store_data[name] = data_store.get_store_data_for_persistence()
+                data_store.has_unsaved_changes = False
+                has_unsaved_changes = True
+            if not has_unsaved_changes:
+                self.log.debug('No changes to save.')
+                return True
+            result = self._save()
+            self._has_unsaved_changes = not result
+            if result:
+                self._saved_save_slot_key = save_slot_key
+            return result
         except Exception as ex:
             self.log.error('Error occurred while saving data \'{}\'.'.format(self.__repr__()), exception=ex)
         return False
@@ -175,6 +200,7 @@ class CommonDataManager(HasLog):
         try:
             self.__data_store_data = dict()
             self.__data_stores = dict()
+            self._has_unsaved_changes = True
             if prevent_save:
                 self._can_be_saved = False
             return self._remove()
@@ -196,8 +222,14 @@ class CommonDataManager(HasLog):
             del self._data_stores[name]
         if name in self._data_store_data:
             del self._data_store_data[name]
+            self._has_unsaved_changes = True
         return True
 
+    @staticmethod
+    def _get_save_slot_key() -> Tuple[int, int]:
+        from sims4communitylib.utils.save_load.common_save_utils import CommonSaveUtils
+        return CommonSaveUtils.get_save_slot_id(), CommonSaveUtils.get_save_slot_guid()
+
     def _load(self) -> Dict[str, Dict[str, Any]]:
         data = dict()
         for persistence_service in self.persistence_services:
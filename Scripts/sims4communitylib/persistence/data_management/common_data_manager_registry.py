@@ -137,9 +137,9 @@ class CommonDataManagerRegistry(CommonService, HasClassLog):
         """
         self.log.debug('Clearing data managers.')
         from sims4communitylib.persistence.common_game_object_data_storage import _CommonGameObjectDataStorageMetaclass
-        _CommonGameObjectDataStorageMetaclass._game_object_storage_instances = dict()
+        _CommonGameObjectDataStorageMetaclass._clear_all_instances()
         from sims4communitylib.persistence.common_sim_data_storage import _CommonSimDataStorageMetaclass
-        _CommonSimDataStorageMetaclass._sim_storage_instances = dict()
+        _CommonSimDataStorageMetaclass._clear_all_instances()
         for data_manager in self._data_managers.values():
             try:
                 self.log.format_with_message('Saving data manager', data_manager=data_manager)
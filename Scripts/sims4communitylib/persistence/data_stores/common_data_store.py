@@ -5,6 +5,7 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
+from collections import OrderedDict
 from typing import Dict, Any, Callable, Tuple
 
 from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
@@ -16,9 +17,13 @@ class CommonDataStore:
     Manage a subset of data.
     """
     _VERSION = 'version'
+    _IMMUTABLE_VALUE_TYPES = (str, int, float, bool, type(None), tuple, frozenset)
 
     def __init__(self) -> None:
         self._storage = dict(self._default_data)
+        self._has_unsaved_changes = False
+        self._value_versions: Dict[str, int] = dict()
+        self._decoded_values: Dict[str, Tuple[Any, int, Callable[[Any], Any], Any]] = OrderedDict()
 
     @classmethod
     def get_identifier(cls) -> str:
@@ -51,6 +56,47 @@ class CommonDataStore:
     def _persist_empty_values(self) -> bool:
         return False
 
+    @property
+    def _decoded_value_cache_size(self) -> int:
+        """The maximum number of decoded values to keep, the least recently retrieved values are decoded again when retrieved.
+
+        .. note:: Values decoded into a :class:`.CommonSerializable` are stored in place of their data instead and are not limited. Values decoded into something that can be modified in place, such as a list or a dictionary, are not cached.
+
+        :return: The maximum number of decoded values to keep.
+        :rtype: int
+        """
+        return 256
+
+    @property
+    def has_unsaved_changes(self) -> bool:
+        """Determine if the data within the data store has changed since it was last saved.
+
+        .. note:: Retrieving a value that can be modified in place, such as a list or a dictionary, is treated as a change unless :func:`~_mark_unsaved_changes_on_mutable_read` is overridden to return False.
+
+        :return: True, if the data has changed since it was last saved. False, if not.
+        :rtype: bool
+        """
+        return self._has_unsaved_changes
+
+    @has_unsaved_changes.setter
+    def has_unsaved_changes(self, value: bool):
+        self._has_unsaved_changes = value
+
+    @property
+    def _mark_unsaved_changes_on_mutable_read(self) -> bool:
+        """Determine if retrieving a value that can be modified in place, such as a list or a dictionary, is treated as a change.
+
+        .. note:: Override this to return False when every value modified in place is followed by invoking :func:`~mark_dirty`, so reading values alone does not cause the data store to be saved again.
+
+        :return: True, if retrieving a value that can be modified in place is treated as a change. False, if not. Default is True.
+        :rtype: bool
+        """
+        return True
+
+    @classmethod
+    def _is_immutable_value(cls, value: Any) -> bool:
+        return isinstance(value, cls._IMMUTABLE_VALUE_TYPES)
+
     @property
     def whitelist_property_names(self) -> Tuple[str]:
         """
@@ -86,6 +132,8 @@ class CommonDataStore:
         if encode is not None:
             value = encode(value)
         self._storage[key] = value
+        self._invalidate_decoded_value(key)
+        self._has_unsaved_changes = True
 
     def get_value_by_key(self, key: str, encode: Callable[[Any], Any]=None, decode: Callable[[Any], Any]=None) -> Any:
         """get_value_by_key(key, encode=None, decode=None)
@@ -96,7 +144,7 @@ class CommonDataStore:
         :type key: str
         :param encode: If specified, the data will be encoded using this function and the result will be the new data stored. Default is None.
         :type encode: Callable[[Any], Any], optional
-        :param decode: If specified, the data will be decoded using this function and the result will be the new result of "get_data". Default is None.
+        :param decode: If specified, the data will be decoded using this function and the result will be the new result of "get_data". A result that is a :class:`.CommonSerializable` is stored in place of the data and serialized again when saving. Other results that cannot be modified in place are cached until the value is set, removed, or marked dirty. Default is None.
         :type decode: Callable[[Any], Any], optional
         :return: The value assigned to the key or the default value if not found.
         :rtype: Any
@@ -108,15 +156,58 @@ class CommonDataStore:
                     self._storage[key] = encode(default_val)
                 else:
                     self._storage[key] = default_val
+                self._has_unsaved_changes = True
             return default_val
         data = self._storage.get(key)
+        if self._mark_unsaved_changes_on_mutable_read and not self._is_immutable_value(data):
+            # The value may be modified without setting it again.
+            self._has_unsaved_changes = True
         if decode is not None and not isinstance(data, CommonSerializable):
+            version = self._value_versions.get(key, 0)
+            decoded_value = self._decoded_values.get(key, None)
+            # The data is also compared by identity, so data replaced without setting it is decoded again.
+            if decoded_value is not None and decoded_value[0] is data and decoded_value[1] == version and self._is_same_decode(decoded_value[2], decode):
+                self._decoded_values.move_to_end(key)
+                return decoded_value[3]
             decoded = decode(data)
-            if isinstance(data, CommonSerializable):
+            if isinstance(decoded, CommonSerializable):
                 self._storage[key] = decoded
+                self._decoded_values.pop(key, None)
+                if self._mark_unsaved_changes_on_mutable_read:
+                    self._has_unsaved_changes = True
+            elif self._is_immutable_value(decoded):
+                # Results that can be modified in place are not cached, otherwise changes made to them would be returned to every caller without being stored.
+                self._decoded_values[key] = (data, version, decode, decoded)
+                self._decoded_values.move_to_end(key)
+                while len(self._decoded_values) > self._decoded_value_cache_size:
+                    self._decoded_values.popitem(last=False)
             return decoded
         return data
 
+    def mark_dirty(self, key: str):
+        """mark_dirty(key)
+
+        Mark the data of a key as changed, so it is saved. Invoke this after modifying a value in place, such as appending to a list retrieved from the data store.
+
+        :param key: An identifier.
+        :type key: str
+        """
+        self._invalidate_decoded_value(key)
+        self._has_unsaved_changes = True
+
+    def _invalidate_decoded_value(self, key: str):
+        # The data of a key may be modified in place, so its version changes whenever it is set, removed, or marked dirty.
+        self._value_versions[key] = self._value_versions.get(key, 0) + 1
+        self._decoded_values.pop(key, None)
+
+    @staticmethod
+    def _is_same_decode(decode: Callable[[Any], Any], other_decode: Callable[[Any], Any]) -> bool:
+        if decode == other_decode:
+            return True
+        # A lambda is a new function each time it is created, but those created in the same place without captured variables decode the same way.
+        code = getattr(decode, '__code__', None)
+        return code is not None and code is getattr(other_decode, '__code__', None) and decode.__closure__ is None and other_decode.__closure__ is None and decode.__defaults__ == other_decode.__defaults__
+
     def get_default_value_by_key(self, key: str) -> Any:
         """get_default_value_by_key(key)
 
@@ -144,6 +235,8 @@ class CommonDataStore:
         if key not in self._storage:
             return False
         del self._storage[key]
+        self._invalidate_decoded_value(key)
+        self._has_unsaved_changes = True
         return True
 
     def update_data(self, data: Dict[str, Any]):
@@ -156,6 +249,9 @@ class CommonDataStore:
         """
 
         version_name = self.__class__._VERSION
+        self._has_unsaved_changes = True
+        for key in tuple(self._decoded_values.keys()):
+            self._invalidate_decoded_value(key)
 
         if data is None or not data:
             self._storage = dict(self._default_data)
@@ -195,8 +291,10 @@ class CommonDataStore:
         :rtype: Dict[str, Any]
         """
         data_to_save = dict()
+        whitelist_property_names = set(self.whitelist_property_names)
+        blacklist_property_names = set(self.blacklist_property_names)
         for data_property_name in self._storage.keys():
-            if data_property_name not in self.whitelist_property_names or data_property_name in self.blacklist_property_names:
+            if data_property_name not in whitelist_property_names or data_property_name in blacklist_property_names:
                 continue
             data = self._storage[data_property_name]
             if self._persist_empty_values:
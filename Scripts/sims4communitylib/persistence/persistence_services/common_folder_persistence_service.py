@@ -92,14 +92,15 @@ class CommonFolderPersistenceService(CommonPersistenceService):
         )
         if loaded_data is None:
             return dict()
+        # The loaded data is not used anywhere else, so it is merged in place instead of copying the complete data for each file.
         complete_data = dict()
         for (key, val) in loaded_data.items():
             file_names.append(key)
-            complete_data = CommonCollectionUtils.merge_dict(complete_data, val, prefer_source_values=True, allow_duplicates_in_collections=self._allow_duplicates_in_collections)
+            CommonCollectionUtils.merge_dict_in_place(complete_data, val, prefer_source_values=True, allow_duplicates_in_collections=self._allow_duplicates_in_collections)
         if self._create_combined_file:
             if loaded_combined_data is not None:
-                complete_data = CommonCollectionUtils.merge_dict(loaded_combined_data, complete_data, prefer_source_values=True, allow_duplicates_in_collections=self._allow_duplicates_in_collections)
-        complete_data = CommonCollectionUtils.merge_dict(complete_data, loaded_main_data, prefer_source_values=True, allow_duplicates_in_collections=self._allow_duplicates_in_collections)
+                complete_data = CommonCollectionUtils.merge_dict_in_place(loaded_combined_data, complete_data, prefer_source_values=True, allow_duplicates_in_collections=self._allow_duplicates_in_collections)
+        CommonCollectionUtils.merge_dict_in_place(complete_data, loaded_main_data, prefer_source_values=True, allow_duplicates_in_collections=self._allow_duplicates_in_collections)
         log.format_with_message('Done loading data.', mod=mod_identity, folder_path=folder_path, complete_data=complete_data, file_names=file_names)
         complete_data['loaded_file_names'] = file_names
         return complete_data
@@ -5,20 +5,33 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
+import base64
 import json
+import zlib
 from typing import Dict, Any
 
 from sims.household import Household
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 from sims4communitylib.persistence.persistence_services.common_persistence_service import CommonPersistenceService
+from sims4communitylib.services.sim.common_household_name_index_service import CommonHouseholdNameIndexService
 from sims4communitylib.utils.sims.common_household_utils import CommonHouseholdUtils
 
 
 class CommonHiddenHouseholdPersistenceService(CommonPersistenceService):
-    """CommonHiddenHouseholdPersistenceService()
+    """CommonHiddenHouseholdPersistenceService(compress_data=False)
 
     A service that persists data into a hidden household. (This data is per save file, it won't carry to other Saves)
+
+    .. note:: Compressed and uncompressed data are both loaded regardless of the value of compress_data, so it can be changed without losing data.
+
+    :param compress_data: If True, the data will be compressed before being stored in the hidden household, making Save files smaller. Default is False.
+    :type compress_data: bool, optional
     """
+    _COMPRESSED_DATA_PREFIX = 'S4CLZ1:'
+
+    def __init__(self, compress_data: bool=False) -> None:
+        super().__init__()
+        self._compress_data = compress_data
 
     # noinspection PyMissingOrEmptyDocstring
     def load(self, mod_identity: CommonModIdentity, identifier: str=None) -> Dict[str, Any]:
@@ -42,10 +55,11 @@ class CommonHiddenHouseholdPersistenceService(CommonPersistenceService):
                 self.log.format_with_message('No raw data found, returning default data.', data=household)
                 return dict()
             self.log.debug('Data found, attempting to parse data.')
-            return json.loads(raw_data)
+            return self._decode_data(raw_data)
 
+        household_name_index = CommonHouseholdNameIndexService()
         self.log.format_with_message('Attempting to locate data by exact name', data_name=data_name)
-        located_household = CommonHouseholdUtils.locate_household_by_name(data_name)
+        located_household = household_name_index.locate_household_by_name(data_name)
         if located_household is not None:
             self.log.format_with_message('Located data with exact name.', data_name=data_name)
             loaded_data = _load_data_from_household(located_household)
@@ -53,7 +67,7 @@ class CommonHiddenHouseholdPersistenceService(CommonPersistenceService):
                 loaded_household = located_household
 
         self.log.format_with_message('Attempting to locate data containing name.', data_name=data_name)
-        for persisted_household in CommonHouseholdUtils.locate_households_by_name_generator(data_name, allow_partial_match=True):
+        for persisted_household in tuple(household_name_index.locate_households_containing_name_gen(data_name)):
             if persisted_household is None or (loaded_household is not None and persisted_household is loaded_household):
                 self.log.debug('Household does not match.')
                 continue
@@ -80,7 +94,8 @@ class CommonHiddenHouseholdPersistenceService(CommonPersistenceService):
         data_name = self._format_data_name(mod_identity, identifier=identifier)
         self.log.format_with_message('Saving data.', data_name=data_name)
         self.log.format_with_message('Attempting to locate data.', data_name=data_name)
-        persisted_data_storage = CommonHouseholdUtils.locate_household_by_name(data_name)
+        household_name_index = CommonHouseholdNameIndexService()
+        persisted_data_storage = household_name_index.locate_household_by_name(data_name)
         if persisted_data_storage is None:
             self.log.debug('No persisted data found, creating new persisted data.')
             persisted_data_storage = CommonHouseholdUtils.create_empty_household(as_hidden_household=True)
@@ -92,19 +107,32 @@ class CommonHiddenHouseholdPersistenceService(CommonPersistenceService):
             persisted_data_storage.creator_id = 0
             persisted_data_storage.creator_name = data_name
             persisted_data_storage.creator_uuid = b''
+            # The Household was named after it was added.
+            household_name_index.add_household(persisted_data_storage)
         else:
             self.log.format_with_message('Found persisted data. Attempting to save data.', data=persisted_data_storage)
         self.log.format_with_message('Attempting to save data.', data=persisted_data_storage)
         try:
             self.log.format(data_being_saved=data)
-            json_save_data = json.dumps(data)
-            persisted_data_storage.description = json_save_data
+            persisted_data_storage.description = self._encode_data(data)
         except Exception as ex:
             self.log.format_error_with_message('Failed to save data.', data_name=data_name, exception=ex)
             raise ex
         self.log.format_with_message('Done saving data.', data_name=data_name)
         return True
 
+    def _encode_data(self, data: Dict[str, Any]) -> str:
+        json_save_data = json.dumps(data)
+        if not self._compress_data:
+            return json_save_data
+        return self.__class__._COMPRESSED_DATA_PREFIX + base64.b85encode(zlib.compress(json_save_data.encode('utf-8'))).decode('ascii')
+
+    def _decode_data(self, raw_data: str) -> Dict[str, Any]:
+        compressed_data_prefix = self.__class__._COMPRESSED_DATA_PREFIX
+        if raw_data.startswith(compressed_data_prefix):
+            return json.loads(zlib.decompress(base64.b85decode(raw_data[len(compressed_data_prefix):])).decode('utf-8'))
+        return json.loads(raw_data)
+
     # noinspection PyMissingOrEmptyDocstring
     def remove(self, mod_identity: CommonModIdentity, identifier: str=None) -> bool:
         data_name = self._format_data_name(mod_identity, identifier=identifier)
@@ -0,0 +1,238 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import os
+from typing import Dict, Any, Union, List
+
+from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
+from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.persistence.persistence_services.common_file_persistence_service import CommonFilePersistenceService
+
+
+class CommonJournalFilePersistenceService(CommonFilePersistenceService):
+    """CommonJournalFilePersistenceService(per_save=True, per_save_slot=False, folder_name=None, custom_file_name=None, data_folder_path=None, compaction_ratio=0.5)
+
+    A service that persists data as a snapshot file plus a journal file of the changes made since the snapshot was written.
+
+    When saving, only the keys of a data store that were set or removed since the last save are appended to the journal. When loading, the changes in the journal are replayed over the snapshot.
+    Once the journal grows past a size relative to the snapshot, the data is written to a new snapshot and the journal is removed.
+
+    .. note:: The changes of each save are appended together and only replayed once all of them were written, so a save interrupted by a crash never loads partially.
+
+    .. note:: The snapshot file is the file :class:`.CommonFilePersistenceService` would save to, so this service can replace a :class:`.CommonFilePersistenceService` without losing data.
+
+    :param per_save: If True, the data will persist for each Game Save file (Set "per_save_slot" to True to persist per save SLOT as well!). If False, the data will persist for all Game Save files. Default is True.
+    :type per_save: bool, optional
+    :param per_save_slot: If True, the data will persist for each Save slot. If False, the data will persist for each Game file only. Default is False. (This argument requires "per_save" to be True as well!)
+    :type per_save_slot: bool, optional
+    :param folder_name: Use to specify a custom file path after the normal file path, example: "The Sims 4/Mods/mod_data/<mod_name>/<folder_name>". Default is None.
+    :type folder_name: str, optional
+    :param custom_file_name: Use to specify a custom name for the loaded and saved snapshot file. example: "The Sims 4/Mods/mod_data/<mod_name>/<custom_file_name>" and if "folder_name" is specified: "The Sims 4/Mods/mod_data/<mod_name>/<folder_name>/<custom_file_name>". Default is None.
+    :type custom_file_name; str, optional
+    :param data_folder_path: Use to specify a custom folder path at the top level for which to save/load data to/from. Default is "Mods/mod_data".
+    :type data_folder_path: str, optional
+    :param compaction_ratio: When the size of the journal exceeds the size of the snapshot multiplied by this ratio, a new snapshot is written when saving. Default is 0.5.
+    :type compaction_ratio: float, optional
+    """
+    _JOURNAL_FILE_EXTENSION = 'journal'
+    _SET_VALUE = 'v'
+    _DELETE_VALUE = 'd'
+    _SET_KEY = 's'
+    _REMOVE_KEY = 'r'
+    _COMMIT = 'c'
+
+    # The serialized values last saved to or loaded from each snapshot file, organized by the path of the snapshot file.
+    _saved_values_by_file_path: Dict[str, Dict[str, Union[str, Dict[str, str]]]] = dict()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 'common_journal_file_persistence_service'
+
+    def __init__(self, per_save: bool=True, per_save_slot: bool=False, folder_name: str=None, custom_file_name: str=None, data_folder_path: str=None, compaction_ratio: float=0.5) -> None:
+        super().__init__(per_save=per_save, per_save_slot=per_save_slot, folder_name=folder_name, custom_file_name=custom_file_name, data_folder_path=data_folder_path)
+        self._compaction_ratio = compaction_ratio
+
+    # noinspection PyMissingOrEmptyDocstring
+    def load(self, mod_identity: CommonModIdentity, identifier: str=None) -> Dict[str, Any]:
+        file_path = self._file_path(mod_identity, identifier=identifier)
+        if not file_path:
+            return dict()
+
+        self.log.format_with_message('Loading data.', mod=mod_identity, file_path=file_path)
+        loaded_data = self._load_data(file_path)
+        if loaded_data is None:
+            self.log.format_with_message('No data was found at path.', mod=mod_identity, file_path=file_path)
+            return dict()
+        self.__class__._saved_values_by_file_path[file_path] = self._serialize_values(loaded_data)
+        self.log.format_with_message('Done loading data.', mod=mod_identity, file_path=file_path)
+        return loaded_data
+
+    # noinspection PyMissingOrEmptyDocstring
+    def save(self, mod_identity: CommonModIdentity, data: Dict[str, Any], identifier: str=None) -> bool:
+        if not data:
+            return False
+        file_path = self._file_path(mod_identity, identifier=identifier)
+        if not file_path:
+            return False
+
+        self.log.format_with_message('Saving data.', mod=mod_identity, file_path=file_path)
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            saved_values = self.__class__._saved_values_by_file_path.get(file_path, None)
+            if saved_values is None:
+                # Nothing was loaded for the file yet, compare against what is on disk.
+                loaded_data = self._load_data(file_path)
+                saved_values = self._serialize_values(loaded_data) if loaded_data is not None else None
+            values = self._serialize_values(data)
+            journal_file_path = self._journal_file_path(file_path)
+            if saved_values is None or not os.path.exists(file_path):
+                self._write_snapshot(file_path, values)
+            else:
+                journal_lines = self._create_journal_lines(saved_values, values)
+                if journal_lines:
+                    journal_lines.append(json.dumps([self.__class__._COMMIT]))
+                    with open(journal_file_path, mode='a', encoding='utf-8') as file:
+                        file.write('\n'.join(journal_lines) + '\n')
+                        file.flush()
+                        os.fsync(file.fileno())
+                if os.path.exists(journal_file_path) and os.path.getsize(journal_file_path) > os.path.getsize(file_path) * self._compaction_ratio:
+                    self.log.format_with_message('Compacting journal.', journal_file_path=journal_file_path)
+                    self._write_snapshot(file_path, values)
+            self.__class__._saved_values_by_file_path[file_path] = values
+        except Exception as ex:
+            CommonExceptionHandler.log_exception(mod_identity, 'Failed to save data', exception=ex)
+            # The journal may contain uncommitted changes, the next save will compare against what is on disk.
+            self.__class__._saved_values_by_file_path.pop(file_path, None)
+            return False
+        self.log.format_with_message('Done saving data.', file_path=file_path)
+        return True
+
+    # noinspection PyMissingOrEmptyDocstring
+    def remove(self, mod_identity: CommonModIdentity, identifier: str=None) -> bool:
+        file_path = self._file_path(mod_identity, identifier=identifier)
+        if not file_path:
+            return False
+
+        self.log.format_with_message('Removing data.', mod=mod_identity, file_path=file_path)
+        self.__class__._saved_values_by_file_path.pop(file_path, None)
+        for path in (file_path, self._journal_file_path(file_path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+        self.log.format_with_message('Data deleted successfully.', file_path=file_path)
+        return not os.path.exists(file_path)
+
+    def _journal_file_path(self, file_path: str) -> str:
+        return f'{os.path.splitext(file_path)[0]}.{self.__class__._JOURNAL_FILE_EXTENSION}'
+
+    def _load_data(self, file_path: str) -> Union[Dict[str, Any], None]:
+        journal_file_path = self._journal_file_path(file_path)
+        if not os.path.exists(file_path) and not os.path.exists(journal_file_path):
+            return None
+        data: Dict[str, Any] = dict()
+        if os.path.exists(file_path):
+            with open(file_path, mode='r', encoding='utf-8') as file:
+                data = json.loads(file.read())
+        if os.path.exists(journal_file_path):
+            self._replay_journal(journal_file_path, data)
+        return data
+
+    def _replay_journal(self, journal_file_path: str, data: Dict[str, Any]) -> None:
+        cls = self.__class__
+        operations: List[List[Any]] = list()
+        offset = 0
+        committed_offset = 0
+        with open(journal_file_path, mode='rb') as file:
+            for line in file:
+                offset += len(line)
+                try:
+                    operation = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    # The save that wrote this line was interrupted, so it was never committed.
+                    break
+                if operation[0] != cls._COMMIT:
+                    operations.append(operation)
+                    continue
+                committed_offset = offset
+                for operation_to_apply in operations:
+                    operation_type = operation_to_apply[0]
+                    if operation_type == cls._SET_KEY or operation_type == cls._REMOVE_KEY:
+                        value = data.get(operation_to_apply[1], None)
+                        if not isinstance(value, dict):
+                            value = dict()
+                            data[operation_to_apply[1]] = value
+                        if operation_type == cls._SET_KEY:
+                            value[operation_to_apply[2]] = operation_to_apply[3]
+                        else:
+                            value.pop(operation_to_apply[2], None)
+                    elif operation_type == cls._SET_VALUE:
+                        data[operation_to_apply[1]] = operation_to_apply[2]
+                    elif operation_type == cls._DELETE_VALUE:
+                        data.pop(operation_to_apply[1], None)
+                operations.clear()
+        if committed_offset != os.path.getsize(journal_file_path):
+            # Changes appended by later saves would be ignored if they followed the uncommitted changes.
+            self.log.format_with_message('Found uncommitted changes in the journal, removing them.', journal_file_path=journal_file_path)
+            with open(journal_file_path, mode='r+b') as file:
+                file.truncate(committed_offset)
+
+    def _create_journal_lines(self, saved_values: Dict[str, Union[str, Dict[str, str]]], values: Dict[str, Union[str, Dict[str, str]]]) -> List[str]:
+        cls = self.__class__
+        journal_lines: List[str] = list()
+        for (name, value) in values.items():
+            saved_value = saved_values.get(name, None)
+            encoded_name = json.dumps(name)
+            if not isinstance(value, dict) or not isinstance(saved_value, dict):
+                if value != saved_value:
+                    journal_lines.append(f'["{cls._SET_VALUE}",{encoded_name},{self._join_value(value)}]')
+                continue
+            for (key, key_value) in value.items():
+                if saved_value.get(key, None) != key_value:
+                    journal_lines.append(f'["{cls._SET_KEY}",{encoded_name},{json.dumps(key)},{key_value}]')
+            for key in saved_value.keys():
+                if key not in value:
+                    journal_lines.append(f'["{cls._REMOVE_KEY}",{encoded_name},{json.dumps(key)}]')
+        for name in saved_values.keys():
+            if name not in values:
+                journal_lines.append(f'["{cls._DELETE_VALUE}",{json.dumps(name)}]')
+        return journal_lines
+
+    def _write_snapshot(self, file_path: str, values: Dict[str, Union[str, Dict[str, str]]]) -> None:
+        # Written to a temporary file first, so an interrupted save never leaves a partially written snapshot behind.
+        temp_file_path = f'{file_path}.tmp'
+        with open(temp_file_path, mode='w', encoding='utf-8') as file:
+            file.write('{' + ','.join([f'{json.dumps(name)}:{self._join_value(value)}' for (name, value) in values.items()]) + '}')
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_file_path, file_path)
+        # The snapshot contains every change in the journal.
+        journal_file_path = self._journal_file_path(file_path)
+        if os.path.exists(journal_file_path):
+            os.remove(journal_file_path)
+
+    def _serialize_values(self, data: Dict[str, Any]) -> Dict[str, Union[str, Dict[str, str]]]:
+        # Each key of a data store is serialized separately, so changed keys can be found by comparing text.
+        values: Dict[str, Union[str, Dict[str, str]]] = dict()
+        for (name, value) in data.items():
+            if isinstance(value, dict):
+                values[name] = {str(key): self._serialize_value(key_value) for (key, key_value) in value.items()}
+            else:
+                values[name] = self._serialize_value(value)
+        return values
+
+    @staticmethod
+    def _join_value(value: Union[str, Dict[str, str]]) -> str:
+        if isinstance(value, dict):
+            return '{' + ','.join([f'{json.dumps(key)}:{key_value}' for (key, key_value) in value.items()]) + '}'
+        return value
+
+    @staticmethod
+    def _serialize_value(value: Any) -> str:
+        return json.dumps(value, default=lambda o: o.serialize() if isinstance(o, CommonSerializable) else o.__dict__ if hasattr(o, '__dict__') else o, separators=(',', ':'))
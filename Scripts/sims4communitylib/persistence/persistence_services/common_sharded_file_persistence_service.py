@@ -0,0 +1,200 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import os
+import shutil
+import zlib
+from typing import Dict, Any, Union, List
+
+from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
+from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.persistence.persistence_services.common_file_persistence_service import CommonFilePersistenceService
+
+
+class CommonShardedFilePersistenceService(CommonFilePersistenceService):
+    """CommonShardedFilePersistenceService(per_save=True, per_save_slot=False, folder_name=None, custom_file_name=None, data_folder_path=None, bucket_count=256)
+
+    A service that persists data into a folder of bucket files and loads data from that folder on the system.
+
+    The top level keys of each data store, such as the Sim ids of a :class:`.CommonSimDataStore`, are spread across bucket files. When saving, only the bucket files whose contents changed are rewritten.
+
+    .. note:: The folder is named after the file :class:`.CommonFilePersistenceService` would save to, without the extension. When the folder does not exist yet, data is loaded from that file instead, so this service can replace a :class:`.CommonFilePersistenceService` without losing data.
+
+    :param per_save: If True, the data will persist for each Game Save file (Set "per_save_slot" to True to persist per save SLOT as well!). If False, the data will persist for all Game Save files. Default is True.
+    :type per_save: bool, optional
+    :param per_save_slot: If True, the data will persist for each Save slot. If False, the data will persist for each Game file only. Default is False. (This argument requires "per_save" to be True as well!)
+    :type per_save_slot: bool, optional
+    :param folder_name: Use to specify a custom file path after the normal file path, example: "The Sims 4/Mods/mod_data/<mod_name>/<folder_name>". Default is None.
+    :type folder_name: str, optional
+    :param custom_file_name: Use to specify a custom name for the loaded and saved folder. example: "The Sims 4/Mods/mod_data/<mod_name>/<custom_file_name>" and if "folder_name" is specified: "The Sims 4/Mods/mod_data/<mod_name>/<folder_name>/<custom_file_name>". Default is None.
+    :type custom_file_name; str, optional
+    :param data_folder_path: Use to specify a custom folder path at the top level for which to save/load data to/from. Default is "Mods/mod_data".
+    :type data_folder_path: str, optional
+    :param bucket_count: The number of bucket files the keys of each data store are spread across. More buckets mean less data is rewritten when a few keys change, but more files. Default is 256.
+    :type bucket_count: int, optional
+    """
+    _MANIFEST_FILE_NAME = 'manifest.json'
+    _MANIFEST_VERSION = 1
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 'common_sharded_file_persistence_service'
+
+    def __init__(self, per_save: bool=True, per_save_slot: bool=False, folder_name: str=None, custom_file_name: str=None, data_folder_path: str=None, bucket_count: int=256) -> None:
+        super().__init__(per_save=per_save, per_save_slot=per_save_slot, folder_name=folder_name, custom_file_name=custom_file_name, data_folder_path=data_folder_path)
+        self._bucket_count = max(1, bucket_count)
+
+    # noinspection PyMissingOrEmptyDocstring
+    def load(self, mod_identity: CommonModIdentity, identifier: str=None) -> Dict[str, Any]:
+        folder_path = self._folder_path(mod_identity, identifier=identifier)
+        if not folder_path:
+            return dict()
+
+        self.log.format_with_message('Loading data.', mod=mod_identity, folder_path=folder_path)
+        manifest = self._load_manifest(folder_path)
+        if manifest is None:
+            self.log.format_with_message('No manifest was found in folder, loading the unsharded file instead.', mod=mod_identity, folder_path=folder_path)
+            return super().load(mod_identity, identifier=identifier)
+
+        loaded_data: Dict[str, Any] = dict(manifest.get('values', dict()))
+        for (data_store_name, bucket_checksums) in manifest.get('data_stores', dict()).items():
+            data_store_data: Dict[str, Any] = dict()
+            for bucket_index in bucket_checksums.keys():
+                bucket_file_path = os.path.join(folder_path, self._bucket_file_name(data_store_name, bucket_index))
+                try:
+                    with open(bucket_file_path, mode='rb') as file:
+                        data_store_data.update(json.loads(file.read().decode('utf-8')))
+                except Exception as ex:
+                    self.log.error(f'Failed to read bucket file \'{bucket_file_path}\'.', exception=ex)
+            loaded_data[data_store_name] = data_store_data
+        self.log.format_with_message('Done loading data.', mod=mod_identity, folder_path=folder_path)
+        return loaded_data
+
+    # noinspection PyMissingOrEmptyDocstring
+    def save(self, mod_identity: CommonModIdentity, data: Dict[str, Any], identifier: str=None) -> bool:
+        if not data:
+            return False
+        folder_path = self._folder_path(mod_identity, identifier=identifier)
+        if not folder_path:
+            return False
+
+        self.log.format_with_message('Saving data.', mod=mod_identity, folder_path=folder_path)
+        try:
+            os.makedirs(folder_path, exist_ok=True)
+            previous_manifest = self._load_manifest(folder_path) or dict()
+            if previous_manifest.get('bucket_count') != self._bucket_count:
+                # Keys would be in different buckets, so every bucket is rewritten.
+                previous_data_stores: Dict[str, Dict[str, int]] = dict()
+            else:
+                previous_data_stores: Dict[str, Dict[str, int]] = previous_manifest.get('data_stores', dict())
+            values: Dict[str, Any] = dict()
+            data_stores: Dict[str, Dict[str, int]] = dict()
+            written_bucket_count = 0
+            for (data_store_name, data_store_data) in data.items():
+                if not isinstance(data_store_data, dict):
+                    values[data_store_name] = data_store_data
+                    continue
+                previous_bucket_checksums = previous_data_stores.get(data_store_name, dict())
+                bucket_checksums: Dict[str, int] = dict()
+                for (bucket_index, bucket_data) in self._split_into_buckets(data_store_data).items():
+                    bucket_bytes = json.dumps(bucket_data, default=self._serialize_object, separators=(',', ':')).encode('utf-8')
+                    checksum = zlib.crc32(bucket_bytes)
+                    bucket_checksums[bucket_index] = checksum
+                    if previous_bucket_checksums.get(bucket_index) == checksum:
+                        continue
+                    self._write_file(os.path.join(folder_path, self._bucket_file_name(data_store_name, bucket_index)), bucket_bytes)
+                    written_bucket_count += 1
+                data_stores[data_store_name] = bucket_checksums
+
+            manifest = {
+                'version': self.__class__._MANIFEST_VERSION,
+                'bucket_count': self._bucket_count,
+                'data_stores': data_stores,
+                'values': values
+            }
+            self._write_file(os.path.join(folder_path, self.__class__._MANIFEST_FILE_NAME), json.dumps(manifest, default=self._serialize_object, separators=(',', ':')).encode('utf-8'))
+            # Buckets are only removed after the manifest no longer references them.
+            for (data_store_name, previous_bucket_checksums) in previous_manifest.get('data_stores', dict()).items():
+                bucket_checksums = data_stores.get(data_store_name, dict())
+                for bucket_index in previous_bucket_checksums.keys():
+                    if bucket_index in bucket_checksums:
+                        continue
+                    bucket_file_path = os.path.join(folder_path, self._bucket_file_name(data_store_name, bucket_index))
+                    if os.path.exists(bucket_file_path):
+                        os.remove(bucket_file_path)
+        except Exception as ex:
+            CommonExceptionHandler.log_exception(mod_identity, 'Failed to save data', exception=ex)
+            return False
+        self.log.format_with_message('Done saving data.', folder_path=folder_path, written_bucket_count=written_bucket_count)
+        return True
+
+    # noinspection PyMissingOrEmptyDocstring
+    def remove(self, mod_identity: CommonModIdentity, identifier: str=None) -> bool:
+        folder_path = self._folder_path(mod_identity, identifier=identifier)
+        if not folder_path:
+            return False
+
+        self.log.format_with_message('Removing data.', mod=mod_identity, folder_path=folder_path)
+        if os.path.exists(folder_path):
+            shutil.rmtree(folder_path, ignore_errors=True)
+
+        self.log.format_with_message('Data deleted successfully.', folder_path=folder_path)
+        return not os.path.exists(folder_path)
+
+    def _folder_path(self, mod_identity: CommonModIdentity, identifier: str=None) -> str:
+        file_path = self._file_path(mod_identity, identifier=identifier)
+        if not file_path:
+            return ''
+        return os.path.splitext(file_path)[0]
+
+    def _split_into_buckets(self, data_store_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        bucket_keys: Dict[str, List[str]] = dict()
+        for key in data_store_data.keys():
+            bucket_index = str(zlib.crc32(str(key).encode('utf-8')) % self._bucket_count)
+            if bucket_index not in bucket_keys:
+                bucket_keys[bucket_index] = list()
+            bucket_keys[bucket_index].append(key)
+        # Sorted keys keep the checksum of a bucket the same when the order of its keys changes.
+        return {bucket_index: {key: data_store_data[key] for key in sorted(keys, key=str)} for (bucket_index, keys) in bucket_keys.items()}
+
+    @staticmethod
+    def _bucket_file_name(data_store_name: str, bucket_index: str) -> str:
+        return f'{data_store_name}_{bucket_index}.json'
+
+    def _load_manifest(self, folder_path: str) -> Union[Dict[str, Any], None]:
+        manifest_file_path = os.path.join(folder_path, self.__class__._MANIFEST_FILE_NAME)
+        if not os.path.exists(manifest_file_path):
+            return None
+        try:
+            with open(manifest_file_path, mode='rb') as file:
+                manifest = json.loads(file.read().decode('utf-8'))
+        except Exception as ex:
+            self.log.error(f'Failed to read manifest file \'{manifest_file_path}\'.', exception=ex)
+            return None
+        if manifest.get('version') != self.__class__._MANIFEST_VERSION:
+            return None
+        return manifest
+
+    @staticmethod
+    def _write_file(file_path: str, file_bytes: bytes) -> None:
+        # Written to a temporary file first, so an interrupted save never leaves a partially written file behind.
+        temp_file_path = f'{file_path}.tmp'
+        with open(temp_file_path, mode='wb') as file:
+            file.write(file_bytes)
+            file.flush()
+        os.replace(temp_file_path, file_path)
+
+    @staticmethod
+    def _serialize_object(obj: Any) -> Any:
+        if isinstance(obj, CommonSerializable):
+            return obj.serialize()
+        if hasattr(obj, '__dict__'):
+            return obj.__dict__
+        return obj
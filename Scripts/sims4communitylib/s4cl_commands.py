@@ -13,10 +13,14 @@ from server_commands.argument_helpers import TunableInstanceParam
 from sims.sim_info import SimInfo
 from sims4.resources import Types
 from sims4communitylib.enums.statistics_enum import CommonStatisticId
+from sims4communitylib.events.interval.common_interval_event_service import CommonIntervalEventRegistry
+from sims4communitylib.logging.common_log_file_writer import CommonLogFileWriter
 from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.s4cl_configuration import S4CLConfiguration
 from sims4communitylib.services.commands.common_console_command import CommonConsoleCommand, \
     CommonConsoleCommandArgument
 from sims4communitylib.services.commands.common_console_command_output import CommonConsoleCommandOutput
+from sims4communitylib.utils.common_environment import CommonEnvironment
 from sims4communitylib.utils.common_log_registry import CommonLogRegistry
 from sims4communitylib.utils.common_resource_utils import CommonResourceUtils
 from sims4communitylib.utils.misc.common_fire_utils import CommonFireUtils
@@ -32,6 +36,37 @@ log = CommonLogRegistry().register_log(ModInfo.get_identity(), 's4cl_commands')
 log.enable()
 
 
+@CommonConsoleCommand(ModInfo.get_identity(), 's4clib.reload_environment', 'Read the sims4communitylib.config file again and resolve the folders S4CL reads files from and writes files to again.', show_with_help_command=False)
+def _common_reload_environment(output: CommonConsoleCommandOutput):
+    S4CLConfiguration().reload()
+    CommonLogFileWriter().reload()
+    environment = CommonEnvironment.reload()
+    CommonLogRegistry().reset_log_file_paths()
+    CommonIntervalEventRegistry().update_budget_in_milliseconds = S4CLConfiguration().interval_update_budget_in_milliseconds
+    output(f'Mods: {environment.mods_location_path}')
+    output(f'Mod Data: {environment.mod_data_location_path}')
+    output(f'Mod Logs: {environment.mod_logs_location_path}')
+    output('Done reloading the environment.')
+
+
+@CommonConsoleCommand(
+    ModInfo.get_identity(),
+    's4clib.show_interval_stats',
+    'Show how long the listeners registered to the interval registry take to run, slowest first.',
+    command_arguments=(
+        CommonConsoleCommandArgument('max_count', 'Number', 'The maximum number of listeners to show.', is_optional=True, default_value='20'),
+    ),
+    show_with_help_command=False
+)
+def _common_show_interval_stats(output: CommonConsoleCommandOutput, max_count: int=20):
+    interval_registry = CommonIntervalEventRegistry()
+    dispatchers = sorted(interval_registry.get_registered_dispatchers(), key=lambda _dispatcher: _dispatcher.total_dispatch_milliseconds, reverse=True)
+    output(f'{len(dispatchers)} interval listener(s) registered. Update budget: {interval_registry.update_budget_in_milliseconds}ms.')
+    for dispatcher in dispatchers[:max_count]:
+        average_milliseconds = dispatcher.total_dispatch_milliseconds / dispatcher.dispatch_count if dispatcher.dispatch_count > 0 else 0.0
+        output(f'{dispatcher.mod_name} {dispatcher.listening_func_name} (Every {dispatcher.minimum_milliseconds_to_dispatch}ms, Priority {dispatcher.priority}): Ran {dispatcher.dispatch_count} time(s), Total {dispatcher.total_dispatch_milliseconds:.3f}ms, Average {average_milliseconds:.3f}ms, Max {dispatcher.max_dispatch_milliseconds:.3f}ms, Deferred {dispatcher.deferred_count} time(s)')
+
+
 @CommonConsoleCommand(ModInfo.get_identity(), 's4clib.the_mother_calls', 'Invokes the mothers call.', show_with_help_command=False)
 def _common_the_mother_calls(output: CommonConsoleCommandOutput):
     output('She calls and you must listen! Who shall answer the call?')
@@ -30,6 +30,8 @@ class S4CLConfiguration(HasLog, CommonService):
             'persist_mod_data_per_save_slot': False,
             'create_combined_json': False,
             'max_output_file_size_in_bytes': 524288000,
+            'enable_buffered_log_writing': True,
+            'interval_update_budget_in_milliseconds': 0,
             'enable_logs': {
                 'example_log_that_is_enabled': ['DEBUG', 'WARN']
             }
@@ -45,6 +47,13 @@ class S4CLConfiguration(HasLog, CommonService):
     def __init__(self) -> None:
         self._config_data = dict()
         super().__init__()
+        self.reload()
+
+    def reload(self) -> None:
+        """reload()
+
+        Read the configuration from the sims4communitylib.config file again.
+        """
         self._config_data: Dict[str, Any] = S4CLConfiguration._DEFAULT_CONFIG_DATA.copy()
         try:
             file_path = os.path.dirname(os.path.dirname(os.path.dirname(self.mod_identity.file_path.rstrip('/').rstrip('\\'))))
@@ -90,6 +99,20 @@ class S4CLConfiguration(HasLog, CommonService):
             return False
         return self._config_data.get('max_output_file_size_in_bytes', 524288000)
 
+    @property
+    def enable_buffered_log_writing(self) -> bool:
+        """ Whether or not log messages should be buffered in memory and written to their files on a background thread. If False, each message is written to its file as it is logged. """
+        if self._config_data is None or not self._config_data:
+            return False
+        return self._config_data.get('enable_buffered_log_writing', True)
+
+    @property
+    def interval_update_budget_in_milliseconds(self) -> float:
+        """ The amount of time in milliseconds interval listeners may take to run within a single game update, before the remaining listeners are deferred to the next update. If zero or less, every due listener is run within the update it becomes due. """
+        if self._config_data is None or not self._config_data:
+            return 0
+        return self._config_data.get('interval_update_budget_in_milliseconds', 0)
+
     @property
     def enable_extra_shift_click_menus(self) -> bool:
         """ Whether or not to enable the SHIFT+CLICK menu in places that normally do not have a SHIFT+CLICK menu due to the ignorance of the SHIFT key. i.e. Relationship Panel, Phone, and Inventory. """
@@ -0,0 +1,143 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Tuple, Union
+
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_update.events.zone_update_event import S4CLZoneUpdateEvent
+from sims4communitylib.logging.has_log import HasLog
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.common_service import CommonService
+
+
+class _CommonMainThreadCall:
+    def __init__(self, func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Any, wait_for_result: bool):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.result: Any = None
+        self.exception: Union[BaseException, None] = None
+        self.finished: Union[threading.Event, None] = threading.Event() if wait_for_result else None
+
+    def run(self) -> None:
+        try:
+            self.result = self.func(*self.args, **self.kwargs)
+        except Exception as ex:
+            self.exception = ex
+        finally:
+            if self.finished is not None:
+                self.finished.set()
+
+
+class CommonMainThreadService(CommonService, HasLog):
+    """CommonMainThreadService()
+
+    Runs functions requested by background threads on the main thread of the game.
+
+    .. note:: Queued functions are run during each zone update, including while the game is paused. Functions queued while a zone is loading will not run until the zone has finished loading.
+
+    .. warning:: Game objects and tuning managers are not thread safe. Background threads should only interact with them through this service.
+
+    :Example usage:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        # On a background thread, retrieve snippets on the main thread and wait for the result.
+        snippets = CommonMainThreadService().run_on_main_thread(CommonResourceUtils.load_instances_with_any_tags, Types.SNIPPET, ('example_tag',))
+        # On a background thread, show a notification on the main thread without waiting for it to be shown.
+        CommonMainThreadService().call_soon(CommonBasicNotification('Title', 'Description').show)
+
+    """
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 'common_main_thread_service'
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._queued_calls: Deque[_CommonMainThreadCall] = deque()
+
+    @property
+    def is_main_thread(self) -> bool:
+        """Determine if the current thread is the main thread of the game.
+
+        :return: True, if the current thread is the main thread. False, if not.
+        :rtype: bool
+        """
+        return threading.current_thread() is threading.main_thread()
+
+    def run_on_main_thread(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """run_on_main_thread(func, *args, **kwargs)
+
+        Run a function on the main thread and wait for it to finish.
+
+        .. note:: When called from the main thread, the function is run immediately.
+
+        :param func: The function to run.
+        :type func: Callable[..., Any]
+        :return: The result of the function. If the function raises an exception, it is raised again on the calling thread.
+        :rtype: Any
+        """
+        if self.is_main_thread:
+            return func(*args, **kwargs)
+        call = _CommonMainThreadCall(func, args, kwargs, True)
+        self._queued_calls.append(call)
+        call.finished.wait()
+        if call.exception is not None:
+            raise call.exception
+        return call.result
+
+    def call_soon(self, func: Callable[..., Any], *args, **kwargs) -> None:
+        """call_soon(func, *args, **kwargs)
+
+        Queue a function to run on the main thread, without waiting for it to finish.
+
+        .. note:: When called from the main thread, the function is still queued and will run during the next zone update.
+
+        :param func: The function to run.
+        :type func: Callable[..., Any]
+        """
+        self._queued_calls.append(_CommonMainThreadCall(func, args, kwargs, False))
+
+    def process_queued_calls(self) -> int:
+        """process_queued_calls()
+
+        Run the functions queued for the main thread.
+
+        .. note:: Only the functions queued before processing started are run, functions they queue run during the next processing.
+
+        :return: The number of functions that were run.
+        :rtype: int
+        """
+        if not self.is_main_thread:
+            return 0
+        call_count = len(self._queued_calls)
+        for _ in range(call_count):
+            call = self._queued_calls.popleft()
+            call.run()
+            if call.finished is None and call.exception is not None:
+                self.log.error(f'Error occurred while running \'{getattr(call.func, "__name__", call.func)}\' on the main thread.', exception=call.exception)
+        return call_count
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity())
+    def _process_queued_calls_on_zone_update(event_data: S4CLZoneUpdateEvent) -> bool:
+        service = CommonMainThreadService()
+        if not service._queued_calls:
+            return False
+        service.process_queued_calls()
+        return True
@@ -50,3 +50,16 @@ class CommonService(metaclass=_Singleton):
         :rtype: The type of the inheriting class
         """
         return cls(*_, **__)
+
+    @classmethod
+    def create_standalone_instance(cls: Any, *args, **kwargs) -> 'CommonService':
+        """create_standalone_instance(*args, **kwargs)
+
+        Create a new instance of the service that is not the shared instance returned by :func:`~get`.
+
+        .. note:: Useful for tests and benchmarks, so anything they register or cache never reaches the shared instance.
+
+        :return: A new instance of the service
+        :rtype: The type of the inheriting class
+        """
+        return type.__call__(cls, *args, **kwargs)
@@ -5,7 +5,7 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Tuple, Iterator, Callable, Any
+from typing import Tuple, Iterator, Callable, Any, Dict
 from interactions.base.interaction import Interaction
 from objects.script_object import ScriptObject
 from services.terrain_service import TerrainService
@@ -46,6 +46,17 @@ class CommonInteractionHandler:
         """
         raise NotImplementedError()
 
+    @property
+    def should_add_depends_only_on_object_type(self) -> bool:
+        """Whether or not `should_add` returns the same result for every script object of the same type.
+
+        .. note:: If True for every handler, the interactions added to the first script object of a type are remembered and script objects of the same type added afterwards skip the handlers.
+
+        :return: True, if `should_add` only depends on the type of the script object. False, if it depends on the script object itself. Default is False.
+        :rtype: bool
+        """
+        return False
+
     def _interactions_to_add_gen(self) -> Iterator[Interaction]:
         if self._cached_interactions_to_add is not None:
             yield from self._cached_interactions_to_add
@@ -88,6 +99,11 @@ class CommonScriptObjectInteractionHandler(CommonInteractionHandler):
                from sims.sim import Sim
                return isinstance(script_object, Sim)
 
+           @property
+           def should_add_depends_only_on_object_type(self) -> bool:
+               # The check above only looks at the type of the script object, so the result can be remembered for each type.
+               return True
+
     """
     @property
     def interactions_to_add(self) -> Tuple[int]:
@@ -133,6 +149,19 @@ class CommonInteractionRegistry(CommonService, _HasS4CLLog):
             CommonInteractionType.ADD_TO_SIM_RELATIONSHIP_PANEL_INTERACTIONS: list(),
             CommonInteractionType.ADD_TO_SIM_PHONE_INTERACTIONS: list()
         }
+        self._interaction_handlers_generation = 0
+        self._merged_affordances_by_object_type: Dict[Tuple[type, str], Tuple[int, Tuple[Interaction, ...]]] = dict()
+
+    def _has_merged_affordances(self, object_type: type, affordance_list_name: str) -> bool:
+        # The handlers have nothing left to add, if the list was not changed since the handlers were merged into it.
+        merged_affordances = self._merged_affordances_by_object_type.get((object_type, affordance_list_name), None)
+        return merged_affordances is not None and merged_affordances[0] == self._interaction_handlers_generation and merged_affordances[1] is getattr(object_type, affordance_list_name)
+
+    def _remember_merged_affordances(self, object_type: type, affordance_list_name: str, interaction_type: CommonInteractionType) -> None:
+        for interaction_handler in self._interaction_handlers[interaction_type]:
+            if hasattr(interaction_handler, 'should_add') and not getattr(interaction_handler, 'should_add_depends_only_on_object_type', False):
+                return
+        self._merged_affordances_by_object_type[(object_type, affordance_list_name)] = (self._interaction_handlers_generation, getattr(object_type, affordance_list_name))
 
     def on_script_object_add(self, script_object: ScriptObject, *args, **kwargs):
         """on_script_object_add(script_object, *args, **kwargs)
@@ -147,6 +176,10 @@ class CommonInteractionRegistry(CommonService, _HasS4CLLog):
         if not hasattr(script_object_type, '_super_affordances'):
             self.verbose_log.format_with_message('Object did not have super affordances.', script_object=script_object_type)
             return
+        if self._has_merged_affordances(script_object_type, '_super_affordances'):
+            # Nothing is added, but the object is still given its own list, as it would be by the merge.
+            script_object._super_affordances += tuple()
+            return
         new_super_affordances = list()
         for interaction_handler in self._interaction_handlers[CommonInteractionType.ON_SCRIPT_OBJECT_LOAD]:
             if hasattr(interaction_handler, 'should_add') and not interaction_handler.should_add(script_object, *args, **kwargs):
@@ -164,6 +197,7 @@ class CommonInteractionRegistry(CommonService, _HasS4CLLog):
                 continue
             new_script_object_super_affordances.append(new_super_affordance)
         script_object._super_affordances += tuple(new_script_object_super_affordances)
+        self._remember_merged_affordances(script_object_type, '_super_affordances', CommonInteractionType.ON_SCRIPT_OBJECT_LOAD)
 
     def register_pre_roll_super_interactions_on_script_object_add(self, script_object: ScriptObject, *args, **kwargs):
         """register_pre_roll_super_interactions_on_script_object_add(script_object, *args, **kwargs)
@@ -178,6 +212,10 @@ class CommonInteractionRegistry(CommonService, _HasS4CLLog):
         if not hasattr(script_object_type, '_preroll_super_affordances'):
             self.verbose_log.format_with_message('Object did not have super affordances.', script_object=script_object_type)
             return
+        if self._has_merged_affordances(script_object_type, '_preroll_super_affordances'):
+            # Nothing is added, but the object is still given its own list, as it would be by the merge.
+            script_object._preroll_super_affordances += tuple()
+            return
         new_preroll_super_affordances = list()
         for interaction_handler in self._interaction_handlers[CommonInteractionType.ADD_PRE_ROLL_SUPER_INTERACTION_ON_SCRIPT_OBJECT_LOAD]:
             if hasattr(interaction_handler, 'should_add') and not interaction_handler.should_add(script_object, *args, **kwargs):
@@ -195,10 +233,11 @@ class CommonInteractionRegistry(CommonService, _HasS4CLLog):
                 continue
             new_script_object_preroll_super_affordances.append(new_super_affordance)
         script_object._preroll_super_affordances += tuple(new_script_object_preroll_super_affordances)
+        self._remember_merged_affordances(script_object_type, '_preroll_super_affordances', CommonInteractionType.ADD_PRE_ROLL_SUPER_INTERACTION_ON_SCRIPT_OBJECT_LOAD)
 
     def _on_sim_relationship_panel_load(self, sim: Sim, *args, **kwargs):
         sim_class = type(sim)
-        if not hasattr(sim_class, '_relation_panel_affordances'):
+        if not hasattr(sim_class, '_relation_panel_affordances') or self._has_merged_affordances(sim_class, '_relation_panel_affordances'):
             return
         new_relationship_panel_affordances = list()
         for interaction_handler in self._interaction_handlers[CommonInteractionType.ADD_TO_SIM_RELATIONSHIP_PANEL_INTERACTIONS]:
@@ -209,10 +248,11 @@ class CommonInteractionRegistry(CommonService, _HasS4CLLog):
                     continue
                 new_relationship_panel_affordances.append(interaction_instance)
         sim_class._relation_panel_affordances += tuple(new_relationship_panel_affordances)
+        self._remember_merged_affordances(sim_class, '_relation_panel_affordances', CommonInteractionType.ADD_TO_SIM_RELATIONSHIP_PANEL_INTERACTIONS)
 
     def _on_sim_phone_load(self, sim: Sim, *args, **kwargs):
         sim_class = type(sim)
-        if not hasattr(sim_class, '_phone_affordances'):
+        if not hasattr(sim_class, '_phone_affordances') or self._has_merged_affordances(sim_class, '_phone_affordances'):
             return
         new_phone_affordances_affordances = list()
         for interaction_handler in self._interaction_handlers[CommonInteractionType.ADD_TO_SIM_PHONE_INTERACTIONS]:
@@ -223,6 +263,7 @@ class CommonInteractionRegistry(CommonService, _HasS4CLLog):
                     continue
                 new_phone_affordances_affordances.append(interaction_instance)
         sim_class._phone_affordances += tuple(new_phone_affordances_affordances)
+        self._remember_merged_affordances(sim_class, '_phone_affordances', CommonInteractionType.ADD_TO_SIM_PHONE_INTERACTIONS)
 
     def on_terrain_load(self, terrain_service: TerrainService, *_, **__):
         """on_terrain_load(terrain_service, *_, **__)
@@ -274,6 +315,27 @@ class CommonInteractionRegistry(CommonService, _HasS4CLLog):
         :type interaction_type: CommonInteractionType
         """
         self._interaction_handlers[interaction_type].append(handler)
+        self._interaction_handlers_generation += 1
+
+    def unregister_handler(self, handler: CommonInteractionHandler, interaction_type: CommonInteractionType) -> bool:
+        """unregister_handler(handler, interaction_type)
+
+        Manually unregister an interaction handler.
+
+        .. note:: Interactions the handler already added are not removed.
+
+        :param handler: The interaction handler being unregistered.
+        :type handler: CommonInteractionHandler
+        :param interaction_type: The type of place the interactions were registered to show up.
+        :type interaction_type: CommonInteractionType
+        :return: True, if the handler was unregistered. False, if the handler was not registered.
+        :rtype: bool
+        """
+        if handler not in self._interaction_handlers[interaction_type]:
+            return False
+        self._interaction_handlers[interaction_type].remove(handler)
+        self._interaction_handlers_generation += 1
+        return True
 
     @staticmethod
     def register_interaction_handler(interaction_type: CommonInteractionType) -> Callable[..., Any]:
@@ -335,3 +397,7 @@ class ExampleInteractionHandler(CommonScriptObjectInteractionHandler):
         # In this case we are adding these interactions to Sims.
         from sims.sim import Sim
         return isinstance(script_object, Sim)
+
+    @property
+    def should_add_depends_only_on_object_type(self) -> bool:
+        return True
@@ -11,6 +11,10 @@ from sims4.tuning.instance_manager import InstanceManager
 from sims4communitylib.logging._has_s4cl_log import _HasS4CLLog
 from sims4communitylib.modinfo import ModInfo
 from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.services.resources.modification_handlers.common_add_interactions_to_affordance_lists_handler import \
+    CommonAddInteractionsToAffordanceListsModificationHandler
+from sims4communitylib.services.resources.modification_handlers.common_affordance_list_additions import \
+    CommonAffordanceListAdditions
 from sims4communitylib.services.resources.modification_handlers.common_instance_manager_modification_handler import \
     CommonInstanceManagerModificationHandler
 from sims4communitylib.utils.common_injection_utils import CommonInjectionUtils
@@ -31,12 +35,32 @@ class CommonInstanceManagerModificationRegistry(CommonService, _HasS4CLLog):
         self._handlers: List[CommonInstanceManagerModificationHandler] = list()
 
     def _try_modify(self, instance_manager: InstanceManager):
+        # Interactions added to affordance lists are gathered across handlers, so each affordance list is rebuilt once.
+        affordance_list_additions = CommonAffordanceListAdditions()
         for handler in self._handlers:
             try:
-                if handler.should_apply_modifications(instance_manager):
-                    handler.apply_modifications(instance_manager)
+                if not handler.should_apply_modifications(instance_manager):
+                    continue
+                if self._can_gather_affordance_list_additions(handler):
+                    handler.gather_affordance_list_additions(instance_manager, affordance_list_additions)
+                    continue
+                # Other handlers may read the affordance lists, so they see the interactions gathered before them.
+                self._apply_affordance_list_additions(affordance_list_additions)
+                handler.apply_modifications(instance_manager)
             except Exception as ex:
                 self.log.format_error_with_message('An error occurred while applying modification.', handler=handler, exception=ex)
+        self._apply_affordance_list_additions(affordance_list_additions)
+
+    @staticmethod
+    def _can_gather_affordance_list_additions(handler: CommonInstanceManagerModificationHandler) -> bool:
+        # Handlers that override apply_modifications are applied as they are.
+        return isinstance(handler, CommonAddInteractionsToAffordanceListsModificationHandler) and type(handler).apply_modifications is CommonAddInteractionsToAffordanceListsModificationHandler.apply_modifications
+
+    def _apply_affordance_list_additions(self, affordance_list_additions: CommonAffordanceListAdditions) -> None:
+        try:
+            affordance_list_additions.apply()
+        except Exception as ex:
+            self.log.format_error_with_message('An error occurred while adding interactions to affordance lists.', exception=ex)
 
     def register_handler(self, handler: CommonInstanceManagerModificationHandler):
         """register_handler(handler)
@@ -13,6 +13,8 @@ from sims4communitylib.classes.mixins.common_affordance_lists_mixin import \
     CommonAffordanceListsMixin
 from sims4communitylib.classes.mixins.common_interactions_mixin import \
     CommonInteractionsMixin
+from sims4communitylib.services.resources.modification_handlers.common_affordance_list_additions import \
+    CommonAffordanceListAdditions
 from sims4communitylib.services.resources.modification_handlers.common_instance_manager_modification_handler import \
     CommonInstanceManagerModificationHandler
 
@@ -42,13 +44,20 @@ class CommonAddInteractionsToAffordanceListsModificationHandler(CommonInstanceMa
 
     # noinspection PyMissingOrEmptyDocstring
     def apply_modifications(self, instance_manager: InstanceManager):
-        instances = self._load_instances_from_manager(instance_manager, self.affordance_list_ids)
-        for instance in instances:
-            new_interactions = list()
-            for interaction_instance_to_add in self._interaction_instances_gen():
-                if interaction_instance_to_add in instance.value:
-                    continue
-                new_interactions.append(interaction_instance_to_add)
-            if not new_interactions:
-                continue
-            instance.value += tuple(new_interactions)
+        affordance_list_additions = CommonAffordanceListAdditions()
+        self.gather_affordance_list_additions(instance_manager, affordance_list_additions)
+        affordance_list_additions.apply()
+
+    def gather_affordance_list_additions(self, instance_manager: InstanceManager, affordance_list_additions: CommonAffordanceListAdditions):
+        """gather_affordance_list_additions(instance_manager, affordance_list_additions)
+
+        Gather the interactions of this handler for each of its affordance lists, without modifying the affordance lists yet.
+
+        :param instance_manager: The instance manager containing the affordance lists.
+        :type instance_manager: InstanceManager
+        :param affordance_list_additions: The additions to gather the interactions into.
+        :type affordance_list_additions: CommonAffordanceListAdditions
+        """
+        interaction_instances = tuple(self._interaction_instances_gen())
+        for instance in self._load_instances_from_manager(instance_manager, self.affordance_list_ids):
+            affordance_list_additions.add_interactions(instance, interaction_instances)
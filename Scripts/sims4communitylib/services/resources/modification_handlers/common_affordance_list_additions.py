@@ -0,0 +1,60 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Any, Dict, Iterable
+
+from interactions.base.interaction import Interaction
+
+
+class CommonAffordanceListAdditions:
+    """CommonAffordanceListAdditions()
+
+    Interactions waiting to be added to affordance lists, gathered across modification handlers so each affordance list is rebuilt only once.
+
+    .. note:: Interactions are added in the order they were gathered, skipping those already in the affordance list or gathered before.
+
+    """
+    def __init__(self) -> None:
+        # Dictionaries keep the order interactions were gathered in and are used as ordered sets.
+        self._interactions_by_affordance_list: Dict[Any, Dict[Interaction, None]] = dict()
+
+    def add_interactions(self, affordance_list: Any, interactions: Iterable[Interaction]) -> None:
+        """add_interactions(affordance_list, interactions)
+
+        Gather interactions to add to an affordance list.
+
+        :param affordance_list: The affordance list to add the interactions to.
+        :type affordance_list: Any
+        :param interactions: The interactions to add.
+        :type interactions: Iterable[Interaction]
+        """
+        pending_interactions = self._interactions_by_affordance_list.get(affordance_list, None)
+        if pending_interactions is None:
+            pending_interactions = dict()
+            self._interactions_by_affordance_list[affordance_list] = pending_interactions
+        for interaction in interactions:
+            pending_interactions[interaction] = None
+
+    def apply(self) -> int:
+        """apply()
+
+        Add the gathered interactions to their affordance lists and forget them.
+
+        :return: The number of affordance lists that were modified.
+        :rtype: int
+        """
+        interactions_by_affordance_list = self._interactions_by_affordance_list
+        self._interactions_by_affordance_list = dict()
+        modified_count = 0
+        for (affordance_list, pending_interactions) in interactions_by_affordance_list.items():
+            existing_interactions = set(affordance_list.value)
+            new_interactions = tuple(interaction for interaction in pending_interactions if interaction not in existing_interactions)
+            if not new_interactions:
+                continue
+            affordance_list.value += new_interactions
+            modified_count += 1
+        return modified_count
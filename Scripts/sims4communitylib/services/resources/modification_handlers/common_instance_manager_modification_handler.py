@@ -44,6 +44,7 @@ class CommonInstanceManagerModificationHandler:
 
     def _load_instances_from_manager(self, instance_manager: InstanceManager, instance_ids: Tuple[int]) -> Tuple[Any]:
         instances = list()
+        instance_ids = set(instance_ids)
         for (key, cls) in tuple(instance_manager._tuned_classes.items()):
             if key.instance in instance_ids:
                 instances.append(cls)
@@ -0,0 +1,167 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+from typing import Dict, List, Iterator, Union
+
+import services
+from indexed_manager import CallbackTypes
+from sims.household import Household
+from sims4communitylib.events.event_handling.common_event_registry import CommonEventRegistry
+from sims4communitylib.events.zone_spin.events.zone_teardown import S4CLZoneTeardownEvent
+from sims4communitylib.logging.has_log import HasLog
+from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.modinfo import ModInfo
+from sims4communitylib.services.common_service import CommonService
+from sims4communitylib.utils.sims.common_household_utils import CommonHouseholdUtils
+
+
+class CommonHouseholdNameIndexService(CommonService, HasLog):
+    """CommonHouseholdNameIndexService()
+
+    Locate Households by name without checking every Household.
+
+    .. note:: The index is built the first time it is used while a zone is loaded and is kept up to date as Households are added and removed. Households renamed after being added are only found after calling :func:`add_household` with them.
+
+    :Example usage:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        household = CommonHouseholdNameIndexService().locate_household_by_name('example_household_name')
+
+    """
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def mod_identity(self) -> CommonModIdentity:
+        return ModInfo.get_identity()
+
+    # noinspection PyMissingOrEmptyDocstring
+    @property
+    def log_identifier(self) -> str:
+        return 'common_household_name_index_service'
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._household_ids_by_name: Union[Dict[str, List[int]], None] = None
+
+    def locate_household_by_name(self, name: str) -> Union[Household, None]:
+        """locate_household_by_name(name)
+
+        Locate a Household with the specified name.
+
+        :param name: The name of a Household to locate.
+        :type name: str
+        :return: A Household with the specified name or None if no Household is found.
+        :rtype: Union[Household, None]
+        """
+        for household in self._locate_households_gen(name):
+            return household
+        return None
+
+    def locate_households_containing_name_gen(self, name: str) -> Iterator[Household]:
+        """locate_households_containing_name_gen(name)
+
+        Locate all Households with a name containing the specified name.
+
+        :param name: The name the Households contain.
+        :type name: str
+        :return: An iterator of Households with a name containing the specified name.
+        :rtype: Iterator[Household]
+        """
+        household_ids_by_name = self._get_household_ids_by_name()
+        for household_name in tuple(household_ids_by_name.keys()):
+            if name not in household_name:
+                continue
+            yield from self._locate_households_gen(household_name)
+
+    def add_household(self, household: Household) -> None:
+        """add_household(household)
+
+        Add a Household to the index using its current name.
+
+        :param household: The Household to add.
+        :type household: Household
+        """
+        if self._household_ids_by_name is None or household is None:
+            return
+        # noinspection PyPropertyAccess
+        household_name = household.name
+        if not household_name:
+            return
+        household_ids = self._household_ids_by_name.setdefault(household_name, list())
+        if household.id not in household_ids:
+            household_ids.append(household.id)
+
+    def remove_household(self, household: Household) -> None:
+        """remove_household(household)
+
+        Remove a Household from the index.
+
+        :param household: The Household to remove.
+        :type household: Household
+        """
+        if self._household_ids_by_name is None or household is None:
+            return
+        # noinspection PyPropertyAccess
+        household_ids = self._household_ids_by_name.get(household.name, None)
+        if household_ids is None or household.id not in household_ids:
+            return
+        household_ids.remove(household.id)
+        if not household_ids:
+            # noinspection PyPropertyAccess
+            del self._household_ids_by_name[household.name]
+
+    def clear(self) -> None:
+        """clear()
+
+        Clear the index, it will be built again the next time it is used.
+        """
+        if self._household_ids_by_name is None:
+            return
+        self._household_ids_by_name = None
+        household_manager = services.household_manager()
+        if household_manager is None:
+            return
+        household_manager.unregister_callback(CallbackTypes.ON_OBJECT_ADD, self.add_household)
+        household_manager.unregister_callback(CallbackTypes.ON_OBJECT_REMOVE, self.remove_household)
+
+    def _locate_households_gen(self, name: str) -> Iterator[Household]:
+        household_ids = self._get_household_ids_by_name().get(name, None)
+        if not household_ids:
+            return
+        for household_id in tuple(household_ids):
+            household = CommonHouseholdUtils.locate_household_by_id(household_id)
+            # noinspection PyPropertyAccess
+            if household is None or household.name != name:
+                self.log.format_with_message('Removing outdated Household from the index.', name=name, household_id=household_id)
+                household_ids.remove(household_id)
+                if household is not None:
+                    self.add_household(household)
+                continue
+            yield household
+        if not household_ids and name in self._household_ids_by_name:
+            del self._household_ids_by_name[name]
+
+    def _get_household_ids_by_name(self) -> Dict[str, List[int]]:
+        if self._household_ids_by_name is not None:
+            return self._household_ids_by_name
+        self._household_ids_by_name = dict()
+        for household in CommonHouseholdUtils.get_all_households_generator():
+            self.add_household(household)
+        self.log.format_with_message('Built Household name index.', name_count=len(self._household_ids_by_name))
+        household_manager = services.household_manager()
+        if household_manager is not None:
+            household_manager.register_callback(CallbackTypes.ON_OBJECT_ADD, self.add_household)
+            household_manager.register_callback(CallbackTypes.ON_OBJECT_REMOVE, self.remove_household)
+        return self._household_ids_by_name
+
+    @staticmethod
+    @CommonEventRegistry.handle_events(ModInfo.get_identity())
+    def _clear_household_name_index_on_zone_teardown(event_data: S4CLZoneTeardownEvent) -> bool:
+        CommonHouseholdNameIndexService().clear()
+        return True
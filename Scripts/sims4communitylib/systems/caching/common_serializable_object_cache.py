@@ -5,9 +5,11 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Union, Dict, Any, Type, Tuple, TypeVar, Generic, List
+from typing import Union, Dict, Any, Type, Tuple, TypeVar, Generic, List, Set
 
 from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
+from sims4communitylib.systems.caching.common_serializable_object_cache_file import CommonSerializableObjectCacheFile, \
+    CommonLazyCachedObjects
 
 CommonSerializableObjectCacheType = TypeVar('CommonSerializableObjectCacheType', bound=CommonSerializable)
 
@@ -18,10 +20,14 @@ class CommonSerializableObjectCache(CommonSerializable, Generic[CommonSerializab
     def __init__(self, cached_objects: Tuple[CommonSerializableObjectCacheType], checksums: Dict[str, int]):
         self._cached_objects = cached_objects
         self._checksums = checksums
+        self._partitions: Union[Dict[str, int], None] = None
 
     @property
     def cached_objects(self) -> Tuple[CommonSerializableObjectCacheType]:
-        """Cached objects"""
+        """Cached objects
+
+        .. note:: When loaded from a binary cache file, each object is deserialized the first time it is accessed.
+        """
         return self._cached_objects
 
     @property
@@ -29,10 +35,41 @@ class CommonSerializableObjectCache(CommonSerializable, Generic[CommonSerializab
         """Cached checksums, these are used to check if the cache needs updating."""
         return self._checksums
 
+    @property
+    def cached_partitions(self) -> Union[Dict[str, int], None]:
+        """The number of cached objects belonging to each checksum, in the order the objects are cached or None if the objects are not partitioned by checksum."""
+        return self._partitions
+
+    @cached_partitions.setter
+    def cached_partitions(self, value: Union[Dict[str, int], None]):
+        self._partitions = value
+
+    def get_cached_objects_by_partition(self) -> Union[Dict[str, Tuple[CommonSerializableObjectCacheType, ...]], None]:
+        """get_cached_objects_by_partition()
+
+        Retrieve the cached objects belonging to each checksum.
+
+        :return: A library of cached objects organized by the key of their checksum or None if the objects are not partitioned by checksum.
+        :rtype: Union[Dict[str, Tuple[CommonSerializableObjectCacheType, ...]], None]
+        """
+        if self._partitions is None:
+            return None
+        cached_objects = self.cached_objects
+        cached_objects_by_partition: Dict[str, Tuple[CommonSerializableObjectCacheType, ...]] = dict()
+        start_index = 0
+        for (checksum_key, object_count) in self._partitions.items():
+            end_index = start_index + object_count
+            # Objects that failed to deserialize from a binary cache file are None.
+            cached_objects_by_partition[checksum_key] = tuple([cached_objects[index] for index in range(start_index, end_index) if cached_objects[index] is not None])
+            start_index = end_index
+        return cached_objects_by_partition
+
     # noinspection PyMissingOrEmptyDocstring
     def serialize(self: 'CommonSerializableObjectCache') -> Union[str, Dict[str, Any]]:
         data = dict()
         data['cached_checksums'] = self._checksums
+        if self._partitions is not None:
+            data['cached_partitions'] = self._partitions
         data['cached_objects'] = [cached_object.serialize() for cached_object in self.cached_objects]
         return data
 
@@ -50,19 +87,45 @@ class CommonSerializableObjectCache(CommonSerializable, Generic[CommonSerializab
         if not cached_objects_data:
             return None
 
+        partitions: Union[Dict[str, int], None] = data.get('cached_partitions', None)
+        if partitions is not None and sum(partitions.values()) != len(cached_objects_data):
+            partitions = None
+
+        if isinstance(cached_objects_data, CommonSerializableObjectCacheFile):
+            # The records of a binary cache file are deserialized as they are accessed.
+            # noinspection PyTypeChecker
+            cache = cls(
+                CommonLazyCachedObjects(cached_objects_data, cls._deserialize_object),
+                checksums
+            )
+            cache.cached_partitions = partitions
+            return cache
+
         cached_objects: List[CommonSerializableObjectCacheType] = list()
-        for object_data in cached_objects_data:
+        deserialized_indexes: Set[int] = set()
+        for (object_index, object_data) in enumerate(cached_objects_data):
             cached_object = cls._deserialize_object(object_data)
             if cached_object is None:
                 continue
             cached_objects.append(cached_object)
+            deserialized_indexes.add(object_index)
         if not cached_objects:
             return None
 
-        return cls(
+        cache = cls(
             tuple(cached_objects),
             checksums
         )
+        if partitions is not None and len(cached_objects) != len(cached_objects_data):
+            # Objects that failed to deserialize are no longer counted within their partition.
+            adjusted_partitions: Dict[str, int] = dict()
+            start_index = 0
+            for (checksum_key, object_count) in partitions.items():
+                adjusted_partitions[checksum_key] = len([index for index in range(start_index, start_index + object_count) if index in deserialized_indexes])
+                start_index += object_count
+            partitions = adjusted_partitions
+        cache.cached_partitions = partitions
+        return cache
 
     @classmethod
     def _deserialize_object(cls, data: Union[str, Dict[str, Any]]) -> Union[CommonSerializableObjectCacheType, None]:
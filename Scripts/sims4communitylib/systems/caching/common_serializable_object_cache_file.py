@@ -0,0 +1,328 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import json
+import os
+import struct
+from typing import Any, Dict, List, Tuple, Union, Iterator, Callable
+
+from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
+
+_UINT32 = struct.Struct('<I')
+_INT64 = struct.Struct('<q')
+_FLOAT64 = struct.Struct('<d')
+_INT64_MIN = -(2 ** 63)
+_INT64_MAX = 2 ** 63 - 1
+
+# Value type markers, one byte each.
+_NONE = ord('N')
+_TRUE = ord('T')
+_FALSE = ord('F')
+_INT = ord('i')
+_BIG_INT = ord('I')
+_FLOAT = ord('d')
+_STRING = ord('s')
+_STRING_LIST = ord('S')
+_LIST = ord('l')
+_DICT = ord('m')
+
+
+class CommonSerializableObjectCacheFile:
+    """CommonSerializableObjectCacheFile(header, strings, record_offsets, records)
+
+    A compact binary file holding the serialized objects of a cache.
+
+    .. note:: The file consists of a header holding the checksums and any other data of the cache, a table of every string used by the records, a table of the key sets of every dictionary used by the records, an index of record offsets, and length prefixed records. Strings such as tags and dictionary keys are only stored once within the tables.
+
+    .. note:: Opening a file only reads the header and record index. The tables and records are decoded the first time a record is requested.
+
+    :param header: The data of the cache, other than its objects.
+    :type header: Dict[str, Any]
+    :param strings: The encoded string and key set tables.
+    :type strings: bytes
+    :param record_offsets: The offset of each record within the records.
+    :type record_offsets: Tuple[int, ...]
+    :param records: The encoded records.
+    :type records: bytes
+    """
+    MAGIC: bytes = b'S4CLOC'
+    FORMAT_VERSION: int = 1
+    FILE_EXTENSION: str = 'bin'
+
+    def __init__(self, header: Dict[str, Any], strings: bytes, record_offsets: Tuple[int, ...], records: bytes):
+        self._header = header
+        self._encoded_strings = strings
+        self._strings: Union[List[str], None] = None
+        self._key_sets: Union[List[Tuple[str, ...]], None] = None
+        self._record_offsets = record_offsets
+        self._records = records
+
+    @property
+    def header(self) -> Dict[str, Any]:
+        """The data of the cache, other than its objects."""
+        return self._header
+
+    def __len__(self) -> int:
+        return len(self._record_offsets)
+
+    def get_record(self, index: int) -> Any:
+        """get_record(index)
+
+        Decode a record.
+
+        :param index: The index of the record.
+        :type index: int
+        :return: The serialized data of an object, as it was before being written.
+        :rtype: Any
+        """
+        if self._strings is None:
+            (self._strings, key_sets) = json.loads(self._encoded_strings.decode('utf-8'))
+            self._key_sets = [tuple([self._strings[key_index] for key_index in key_set]) for key_set in key_sets]
+            self._encoded_strings = None
+        offset = self._record_offsets[index]
+        record_length = _UINT32.unpack_from(self._records, offset)[0]
+        (value, end_offset) = self._decode_value(self._records, offset + _UINT32.size, self._strings, self._key_sets)
+        if end_offset != offset + _UINT32.size + record_length:
+            raise ValueError(f'Record {index} is corrupted.')
+        return value
+
+    def get_records_gen(self) -> Iterator[Any]:
+        """get_records_gen()
+
+        Decode all records.
+
+        :return: An iterator of the serialized data of each object.
+        :rtype: Iterator[Any]
+        """
+        for index in range(len(self)):
+            yield self.get_record(index)
+
+    @classmethod
+    def write_to_file(cls, file_path: str, header: Dict[str, Any], records: Iterator[Any]) -> bool:
+        """write_to_file(file_path, header, records)
+
+        Write the data of a cache and the serialized data of its objects to a file.
+
+        :param file_path: The file to write to.
+        :type file_path: str
+        :param header: The data of the cache, other than its objects. It must be JSON serializable.
+        :type header: Dict[str, Any]
+        :param records: The serialized data of each object.
+        :type records: Iterator[Any]
+        :return: True, if the file was written successfully. False, if not.
+        :rtype: bool
+        """
+        if file_path is None or header is None or records is None:
+            return False
+        string_indexes: Dict[str, int] = dict()
+        key_set_indexes: Dict[Tuple[int, ...], int] = dict()
+        encoded_records: List[bytes] = list()
+        record_offsets: List[int] = list()
+        records_length = 0
+        for record in records:
+            encoded_record: List[bytes] = list()
+            cls._encode_value(record, encoded_record, string_indexes, key_set_indexes)
+            encoded_record = b''.join(encoded_record)
+            record_offsets.append(records_length)
+            encoded_records.append(_UINT32.pack(len(encoded_record)))
+            encoded_records.append(encoded_record)
+            records_length += _UINT32.size + len(encoded_record)
+        encoded_header = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        encoded_strings = json.dumps((list(string_indexes.keys()), list(key_set_indexes.keys())), separators=(',', ':')).encode('utf-8')
+        temp_file_path = os.path.join(os.path.dirname(file_path), 'temp' + os.path.basename(file_path))
+        with open(temp_file_path, mode='wb') as file:
+            file.write(cls.MAGIC)
+            file.write(_UINT32.pack(cls.FORMAT_VERSION))
+            file.write(_UINT32.pack(len(encoded_header)))
+            file.write(encoded_header)
+            file.write(_UINT32.pack(len(encoded_strings)))
+            file.write(encoded_strings)
+            file.write(_UINT32.pack(len(record_offsets)))
+            file.write(struct.pack(f'<{len(record_offsets)}I', *record_offsets))
+            file.write(b''.join(encoded_records))
+            file.flush()
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(temp_file_path, file_path)
+        return True
+
+    @classmethod
+    def load_from_file(cls, file_path: str) -> Union['CommonSerializableObjectCacheFile', None]:
+        """load_from_file(file_path)
+
+        Read the header and record index of a file. Records are not decoded until requested.
+
+        :param file_path: The file to read from.
+        :type file_path: str
+        :return: The cache file or None if the file does not exist or was written in a different format version.
+        :rtype: Union[CommonSerializableObjectCacheFile, None]
+        """
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, mode='rb') as file:
+                contents = file.read()
+            if contents[:len(cls.MAGIC)] != cls.MAGIC:
+                return None
+            offset = len(cls.MAGIC)
+            format_version = _UINT32.unpack_from(contents, offset)[0]
+            if format_version != cls.FORMAT_VERSION:
+                return None
+            offset += _UINT32.size
+            header_length = _UINT32.unpack_from(contents, offset)[0]
+            offset += _UINT32.size
+            header = json.loads(contents[offset:offset + header_length].decode('utf-8'))
+            offset += header_length
+            strings_length = _UINT32.unpack_from(contents, offset)[0]
+            offset += _UINT32.size
+            strings = contents[offset:offset + strings_length]
+            offset += strings_length
+            record_count = _UINT32.unpack_from(contents, offset)[0]
+            offset += _UINT32.size
+            record_offsets = struct.unpack_from(f'<{record_count}I', contents, offset)
+            offset += _UINT32.size * record_count
+            return cls(header, strings, record_offsets, contents[offset:])
+        except Exception as ex:
+            raise Exception(f'Failed to read file {file_path}, it is either corrupted, or happened to be locked at the time of trying to read it.') from ex
+
+    @classmethod
+    def _encode_value(cls, value: Any, encoded_value: List[bytes], string_indexes: Dict[str, int], key_set_indexes: Dict[Tuple[int, ...], int]) -> None:
+        # Values are encoded the same way the JSON cache would store them.
+        if value is None:
+            encoded_value.append(b'N')
+        elif value is True:
+            encoded_value.append(b'T')
+        elif value is False:
+            encoded_value.append(b'F')
+        elif isinstance(value, str):
+            encoded_value.append(b's')
+            encoded_value.append(_UINT32.pack(cls._get_string_index(value, string_indexes)))
+        elif isinstance(value, int):
+            if _INT64_MIN <= value <= _INT64_MAX:
+                encoded_value.append(b'i')
+                encoded_value.append(_INT64.pack(value))
+            else:
+                encoded_value.append(b'I')
+                encoded_value.append(_UINT32.pack(cls._get_string_index(str(int(value)), string_indexes)))
+        elif isinstance(value, float):
+            encoded_value.append(b'd')
+            encoded_value.append(_FLOAT64.pack(value))
+        elif isinstance(value, (list, tuple)):
+            if value and all([isinstance(item, str) for item in value]):
+                encoded_value.append(b'S')
+                encoded_value.append(_UINT32.pack(len(value)))
+                encoded_value.append(struct.pack(f'<{len(value)}I', *[cls._get_string_index(item, string_indexes) for item in value]))
+                return
+            encoded_value.append(b'l')
+            encoded_value.append(_UINT32.pack(len(value)))
+            for item in value:
+                cls._encode_value(item, encoded_value, string_indexes, key_set_indexes)
+        elif isinstance(value, dict):
+            # JSON converts keys that are not strings into strings, so they are converted the same way here.
+            key_set = tuple([cls._get_string_index(key if isinstance(key, str) else json.dumps(key), string_indexes) for key in value.keys()])
+            encoded_value.append(b'm')
+            encoded_value.append(_UINT32.pack(cls._get_string_index(key_set, key_set_indexes)))
+            for item in value.values():
+                cls._encode_value(item, encoded_value, string_indexes, key_set_indexes)
+        elif isinstance(value, CommonSerializable):
+            cls._encode_value(value.serialize(), encoded_value, string_indexes, key_set_indexes)
+        elif hasattr(value, '__dict__'):
+            cls._encode_value(value.__dict__, encoded_value, string_indexes, key_set_indexes)
+        else:
+            raise TypeError(f'Object of type {type(value).__name__} cannot be written to a cache file.')
+
+    @staticmethod
+    def _get_string_index(value: Any, string_indexes: Dict[Any, int]) -> int:
+        string_index = string_indexes.get(value, None)
+        if string_index is None:
+            string_index = len(string_indexes)
+            string_indexes[value] = string_index
+        return string_index
+
+    @classmethod
+    def _decode_value(cls, records: bytes, offset: int, strings: List[str], key_sets: List[Tuple[str, ...]]) -> Tuple[Any, int]:
+        value_type = records[offset]
+        offset += 1
+        if value_type == _STRING:
+            return strings[_UINT32.unpack_from(records, offset)[0]], offset + _UINT32.size
+        if value_type == _INT:
+            return _INT64.unpack_from(records, offset)[0], offset + _INT64.size
+        if value_type == _DICT:
+            keys = key_sets[_UINT32.unpack_from(records, offset)[0]]
+            offset += _UINT32.size
+            values = list()
+            for _ in keys:
+                # Strings and integers are the most common values, so they are decoded without recursing.
+                item_type = records[offset]
+                if item_type == _STRING:
+                    values.append(strings[_UINT32.unpack_from(records, offset + 1)[0]])
+                    offset += 1 + _UINT32.size
+                elif item_type == _INT:
+                    values.append(_INT64.unpack_from(records, offset + 1)[0])
+                    offset += 1 + _INT64.size
+                else:
+                    (item, offset) = cls._decode_value(records, offset, strings, key_sets)
+                    values.append(item)
+            return dict(zip(keys, values)), offset
+        if value_type == _STRING_LIST:
+            item_count = _UINT32.unpack_from(records, offset)[0]
+            offset += _UINT32.size
+            return [strings[string_index] for string_index in struct.unpack_from(f'<{item_count}I', records, offset)], offset + _UINT32.size * item_count
+        if value_type == _LIST:
+            item_count = _UINT32.unpack_from(records, offset)[0]
+            offset += _UINT32.size
+            value = list()
+            for _ in range(item_count):
+                (item, offset) = cls._decode_value(records, offset, strings, key_sets)
+                value.append(item)
+            return value, offset
+        if value_type == _FLOAT:
+            return _FLOAT64.unpack_from(records, offset)[0], offset + _FLOAT64.size
+        if value_type == _NONE:
+            return None, offset
+        if value_type == _TRUE:
+            return True, offset
+        if value_type == _FALSE:
+            return False, offset
+        if value_type == _BIG_INT:
+            return int(strings[_UINT32.unpack_from(records, offset)[0]]), offset + _UINT32.size
+        raise ValueError(f'Unknown value type {value_type} at offset {offset - 1}.')
+
+
+class CommonLazyCachedObjects:
+    """CommonLazyCachedObjects(cache_file, deserialize_object)
+
+    The objects of a cache file, deserialized the first time each one is accessed.
+
+    .. note:: Records that fail to deserialize are skipped while iterating, the same as when loading a JSON cache. The length is the number of records within the file.
+
+    :param cache_file: The file containing the records.
+    :type cache_file: CommonSerializableObjectCacheFile
+    :param deserialize_object: A function that converts the data of a record into an object.
+    :type deserialize_object: Callable[[Any], Any]
+    """
+    def __init__(self, cache_file: CommonSerializableObjectCacheFile, deserialize_object: Callable[[Any], Any]):
+        self._cache_file = cache_file
+        self._deserialize_object = deserialize_object
+        self._deserialized_objects: List[Any] = [None] * len(cache_file)
+        self._deserialized: List[bool] = [False] * len(cache_file)
+
+    def __len__(self) -> int:
+        return len(self._deserialized_objects)
+
+    def __getitem__(self, index: int) -> Any:
+        if not self._deserialized[index]:
+            self._deserialized_objects[index] = self._deserialize_object(self._cache_file.get_record(index))
+            self._deserialized[index] = True
+        return self._deserialized_objects[index]
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            cached_object = self[index]
+            if cached_object is None:
+                continue
+            yield cached_object
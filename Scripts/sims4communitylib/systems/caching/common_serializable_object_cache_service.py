@@ -9,6 +9,7 @@ import os
 from typing import Union, Generic, TypeVar, Tuple, Dict, Any
 
 from sims4communitylib.systems.caching.common_serializable_object_cache import CommonSerializableObjectCache
+from sims4communitylib.systems.caching.common_serializable_object_cache_file import CommonSerializableObjectCacheFile
 from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
 from sims4communitylib.logging.has_log import HasLog
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
@@ -38,6 +39,17 @@ class CommonSerializableObjectCacheService(CommonService, HasLog, Generic[Common
     def _cache_file_name(self) -> str:
         raise NotImplementedError()
 
+    @property
+    def _use_binary_cache_file(self) -> bool:
+        """Determine if the cache is saved to and loaded from a binary cache file.
+
+        .. note:: Loading a binary cache file only reads its checksums, each object is read the first time it is accessed. When no binary cache file exists, the JSON cache file is loaded instead.
+
+        :return: True, if a binary cache file is used. False, if a JSON cache file is used. Default is False.
+        :rtype: bool
+        """
+        return False
+
     def __init__(self) -> None:
         super().__init__()
         self._cache = None
@@ -49,28 +61,53 @@ class CommonSerializableObjectCacheService(CommonService, HasLog, Generic[Common
             return False
         (snippet_name, snippet_id, new_checksum) = new_checksum_data
         checksums = cache.cached_checksums
-        key = f'{snippet_name}-{snippet_id}'
+        key = self.get_checksum_key(snippet_name, snippet_id)
         if checksums.get(key, -1) != new_checksum:
             return True
         return False
 
+    @staticmethod
+    def get_checksum_key(snippet_name: str, snippet_id: int) -> str:
+        """get_checksum_key(snippet_name, snippet_id)
+
+        Retrieve the key a checksum is cached with.
+
+        :param snippet_name: The name of the snippet the checksum was created for.
+        :type snippet_name: str
+        :param snippet_id: The id of the snippet the checksum was created for.
+        :type snippet_id: int
+        :return: The key of the checksum within the cached checksums.
+        :rtype: str
+        """
+        return f'{snippet_name}-{snippet_id}'
+
     def save_to_cache(self, cache: CommonSerializableObjectCacheType) -> None:
         """Save a cache of data."""
-        file_path = self._get_cache_file_path()
         folder_path = self._get_cache_folder_path()
-        if os.path.exists(file_path):
-            CommonIOUtils.delete_file(file_path)
+        self._delete_cache_files()
 
         if not os.path.exists(folder_path):
             os.makedirs(folder_path, exist_ok=True)
 
-        CommonJSONIOUtils.write_to_file(file_path, cache.serialize())
+        if self._use_binary_cache_file:
+            cache_data = dict(cache.serialize())
+            cached_objects_data = cache_data.pop('cached_objects', tuple())
+            CommonSerializableObjectCacheFile.write_to_file(self._get_binary_cache_file_path(), cache_data, cached_objects_data)
+        else:
+            CommonJSONIOUtils.write_to_file(self._get_cache_file_path(), cache.serialize(), stream=True, compact=True)
         self._cache = cache
 
     def load_from_cache(self) -> Union[CommonSerializableObjectCacheType, None]:
         """Load the cached data."""
         if self._cache is not None:
             return self._cache
+        if self._use_binary_cache_file:
+            cache_file = CommonSerializableObjectCacheFile.load_from_file(self._get_binary_cache_file_path())
+            if cache_file is not None:
+                cache_data = dict(cache_file.header)
+                cache_data['cached_objects'] = cache_file
+                self._cache = self._deserialize_cache(cache_data)
+                return self._cache
         file_path = self._get_cache_file_path()
         if os.path.exists(file_path):
             self._cache = self._deserialize_cache(CommonJSONIOUtils.load_from_file(file_path))
@@ -80,17 +117,23 @@ class CommonSerializableObjectCacheService(CommonService, HasLog, Generic[Common
 
     def clear_cache(self) -> None:
         """Clear the cached data"""
-        file_path = self._get_cache_file_path()
-        if os.path.exists(file_path):
-            CommonIOUtils.delete_file(file_path)
+        self._delete_cache_files()
         self._cache = None
 
+    def _delete_cache_files(self) -> None:
+        for file_path in (self._get_cache_file_path(), self._get_binary_cache_file_path()):
+            if os.path.exists(file_path):
+                CommonIOUtils.delete_file(file_path)
+
     def _get_cache_folder_path(self) -> str:
         return os.path.join(CommonLogUtils.get_mod_data_location_path(), self.mod_identity.base_namespace.lower(), 'caches')
 
     def _get_cache_file_path(self) -> str:
         return os.path.join(self._get_cache_folder_path(), f'{self._cache_file_name}_cache.json')
 
+    def _get_binary_cache_file_path(self) -> str:
+        return os.path.join(self._get_cache_folder_path(), f'{self._cache_file_name}_cache.{CommonSerializableObjectCacheFile.FILE_EXTENSION}')
+
     def _deserialize_cache(self, data: Union[str, Dict[str, Any]]) -> CommonSerializableObjectCacheType:
         return CommonSerializableObjectCacheType[CommonSerializable].deserialize(data)
 
@@ -100,5 +143,5 @@ class CommonSerializableObjectCacheService(CommonService, HasLog, Generic[Common
         """
         checksum_data = dict()
         for (snippet_name, snippet_id, checksum_value) in checksums:
-            checksum_data[f'{snippet_name}-{snippet_id}'] = checksum_value
+            checksum_data[self.get_checksum_key(snippet_name, snippet_id)] = checksum_value
         return CommonSerializableObjectCache[CommonSerializable](objects, checksum_data)
@@ -5,8 +5,10 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-import collections
-from typing import List, Dict, Any, Tuple, Set, Callable, Union, Iterator, TypeVar, Generic
+import time
+from collections import OrderedDict
+from threading import Thread
+from typing import List, Dict, Any, Tuple, Set, Callable, Union, Iterator, TypeVar, Generic, Iterable
 
 from sims4communitylib.classes.testing.common_test_result import CommonTestResult
 from sims4communitylib.systems.item_query.item_tests.common_loaded_item_test import CommonLoadedItemTest
@@ -20,6 +22,7 @@ from sims4communitylib.events.zone_spin.events.zone_late_load import S4CLZoneLat
 from sims4communitylib.logging.has_log import HasLog
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 from sims4communitylib.notifications.common_basic_notification import CommonBasicNotification
+from sims4communitylib.services.common_main_thread_service import CommonMainThreadService
 from sims4communitylib.services.common_service import CommonService
 from sims4communitylib.systems.item_query.enums.common_query_method_type import CommonQueryMethodType
 from sims4communitylib.utils.misc.common_text_utils import CommonTextUtils
@@ -43,7 +46,16 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
     def __init__(self) -> None:
         super().__init__()
         self._collecting = False
-        self.item_library = collections.defaultdict(set)
+        self._item_library: Union[Dict[Tuple[Any, Any], Set[str]], None] = None
+        self._item_key_masks: Dict[Tuple[Any, Any], int] = dict()
+        self._item_key_counts: Dict[Tuple[Any, Any], int] = dict()
+        self._items_by_ordinal: List[CommonLoadedItemType] = list()
+        self._generation = 0
+        self._max_cached_queries = 0
+        self._cached_queries: 'OrderedDict[Tuple[Any, ...], Tuple[CommonLoadedItemType, ...]]' = OrderedDict()
+        self._cached_queries_generation: Union[Tuple[int, int], None] = None
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
         self.__item_organizers: List[CommonLoadedItemOrganizer] = list()
         self._all: List[CommonLoadedItemType] = list()
         self._total = 0
@@ -70,12 +82,33 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
 
     @property
     def item_library(self) -> Dict[Tuple[Any, Any], Set[str]]:
-        """ A library of items organized by filter keys. """
+        """ A library of item identifiers organized by filter keys.
+
+        .. note:: Queries do not use this library. Items are stored by key as bitmasks of item ordinals and this library is built from them the first time it is requested after the items are organized.
+        """
+        if self._item_library is None:
+            self._item_library = {item_key: set([item.identifier for item in self._get_items_from_mask(items_mask)]) for (item_key, items_mask) in self._item_key_masks.items()}
         return self._item_library
 
     @item_library.setter
     def item_library(self, value: Dict[Tuple[Any, Any], Set[str]]):
-        self._item_library = value
+        item_ordinals_by_identifier: Dict[str, int] = dict()
+        items_by_ordinal: List[CommonLoadedItemType] = list()
+        item_key_masks: Dict[Tuple[Any, Any], int] = dict()
+        for (item_key, item_identifiers) in value.items():
+            item_ordinals = list()
+            for item_identifier in item_identifiers:
+                item_ordinal = item_ordinals_by_identifier.get(item_identifier, None)
+                if item_ordinal is None:
+                    item = self._registry.locate_by_identifier(item_identifier)
+                    if item is None:
+                        continue
+                    item_ordinal = len(items_by_ordinal)
+                    item_ordinals_by_identifier[item_identifier] = item_ordinal
+                    items_by_ordinal.append(item)
+                item_ordinals.append(item_ordinal)
+            item_key_masks[item_key] = self._to_items_mask(item_ordinals)
+        self._set_item_key_masks(items_by_ordinal, item_key_masks)
 
     @property
     def total(self) -> int:
@@ -97,6 +130,39 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
         """The total number of items that were valid."""
         return self._duplicates
 
+    @property
+    def max_cached_queries(self) -> int:
+        """The maximum number of queries to keep the results of. Default is 0, which disables the query cache.
+
+        .. note:: The query cache keeps the items matching the keys of a request, so requests with the same keys and query type skip filtering. Item tests still run each time items are queried. Cached results are discarded whenever items are organized or added to the registry.
+        """
+        return self._max_cached_queries
+
+    @max_cached_queries.setter
+    def max_cached_queries(self, value: int):
+        self._max_cached_queries = max(0, value)
+        while len(self._cached_queries) > self._max_cached_queries:
+            self._cached_queries.popitem(last=False)
+
+    @property
+    def query_cache_hits(self) -> int:
+        """The number of queries that used cached results."""
+        return self._query_cache_hits
+
+    @property
+    def query_cache_misses(self) -> int:
+        """The number of queries that were not cached while the query cache was enabled."""
+        return self._query_cache_misses
+
+    def clear_query_cache(self) -> None:
+        """clear_query_cache()
+
+        Discard all cached query results and reset the query cache hit and miss counts.
+        """
+        self._cached_queries.clear()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+
     def add_item_organizer(
         self,
         item_organizer_init: Callable[[Any], CommonLoadedItemOrganizer],
@@ -106,7 +172,10 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
         self._item_organizers.append(item_organizer_init(key_type))
 
     def has_items(self, requests: Tuple[CommonLoadedItemFilterRequest]) -> bool:
-        """ Determine if items exist for queries. """
+        """ Determine if items exist for queries.
+
+        .. note:: While items are being collected, no items will be found unless the registry waits for items while loading.
+        """
         if self.log.enabled:
             self.log.format_with_message(f'Checking if has {self._item_name}s', queries=requests)
         for _ in self.get_items_gen(requests):
@@ -114,16 +183,56 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
         return False
 
     def get_items_gen(self, requests: Tuple[CommonLoadedItemFilterRequest]) -> Iterator[CommonLoadedItemType]:
-        """ Retrieve items matching the requests. """
+        """ Retrieve items matching the requests.
+
+        .. note:: While items are being collected, no items will be found unless the registry waits for items while loading.
+        """
         if self.log.enabled:
             self.log.format_with_message(f'Getting {self._item_name}s', requests=requests)
-        if self._collecting:
+        if not self._wait_until_items_can_be_queried():
             return tuple()
         for request in requests:
             yield from self._query_items(request, request.item_tests)
         if self.verbose_log.enabled:
             self.verbose_log.debug(f'Finished locating {self._item_name}s')
 
+    @property
+    def _wait_for_items_while_loading(self) -> bool:
+        """Determine if queries made while items are loading or being collected wait for them to finish.
+
+        .. note:: When False, queries made while the registry is loading use the items collected previously and queries made while items are being collected find nothing.
+
+        :return: True, if queries wait for items to finish loading. False, if queries do not wait. Default is False.
+        :rtype: bool
+        """
+        return False
+
+    def wait_until_collected(self) -> bool:
+        """wait_until_collected()
+
+        Wait for items to finish loading and being collected.
+
+        .. note:: When called from the main thread, functions the background threads need run on the main thread are run while waiting.
+
+        :return: True, if items can be queried. False, if not.
+        :rtype: bool
+        """
+        main_thread_service = CommonMainThreadService()
+        while self._registry.loading or self._collecting:
+            if not self._registry.loads_asynchronously:
+                # Items loaded on the main thread cannot finish while the main thread is waiting for them.
+                break
+            main_thread_service.process_queued_calls()
+            time.sleep(0.005)
+        return not self._collecting
+
+    def _wait_until_items_can_be_queried(self) -> bool:
+        if not self._collecting and not self._registry.loading:
+            return True
+        if self._wait_for_items_while_loading:
+            return self.wait_until_collected()
+        return not self._collecting
+
     def _run_tests(self, item: CommonLoadedItemType, item_tests: Iterator[CommonLoadedItemTest]) -> CommonTestResult:
         for _item_test in item_tests:
             _result = _item_test.test_item(item)
@@ -135,246 +244,223 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
         if self.log.enabled:
             self.log.format_with_message(f'Querying for {self._item_name}s using query', query=request, item_tests=item_tests)
         item_tests = tuple(item_tests)
-        all_keys = request.include_all_keys
-        any_keys = request.include_any_keys
-        exclude_keys = request.exclude_keys
-        match_at_least_one_key_sets = request.must_match_at_least_one_key_sets
-        found_item_identifiers = None
-
-        def _convert_found_items(_found_identifiers: Set[str]) -> Iterator[CommonLoadedItemType]:
-            count = 0
-            for _item_identifier in _found_identifiers:
-                _item = self._registry.locate_by_identifier(_item_identifier)
-                if _item is None:
-                    continue
-                _passes_tests = self._run_tests(_item, item_tests)
-                if not _passes_tests:
-                    if self.log.is_enabled:
-                        self.log.format_with_message(f'{self._item_name} failed item test', item=_item.short_name, reason=_passes_tests.reason)
-                    continue
-                count += 1
-                yield _item
-
+        found_items = self._get_found_items(request)
+        if not found_items:
             if self.log.enabled:
-                self.log.debug(f'After item tests keys {count}')
-
-        if self.log.enabled:
-            self.log.format_with_message('Using match_at_least_one_sets', match_at_least_one_sets=match_at_least_one_key_sets)
-        if match_at_least_one_key_sets:
-            self.verbose_log.format_with_message('Has match at least one sets.', match_at_least_one_sets=match_at_least_one_key_sets)
-            found_all_matching = False
-            for match_at_least_one_key_set in match_at_least_one_key_sets:
-                if self.log.enabled:
-                    self.log.format_with_message('Attempting to locate a match for set.', match_at_least_one_set=match_at_least_one_key_set)
-                found_matching = False
-                total_matching_items = None
-                for match_at_least_one_key in match_at_least_one_key_set:
-                    if match_at_least_one_key is None:
-                        continue
-                    if match_at_least_one_key.key not in self.item_library:
-                        # One of the Match At Least One keys is not within the Item library! This means no Items pass the Match At Least One keys.
-                        if self.log.enabled:
-                            self.log.format_with_message(f'Match At Least One Key not found within the {self._item_name} library, meaning there are no {self._item_name}s available for it! Skipping this key.', key=match_at_least_one_key.key)
-                        continue
-                    new_found_items = self.item_library[match_at_least_one_key.key]
-                    if total_matching_items is not None:
-                        if self.log.enabled:
-                            self.log.debug(f'Looking for key {match_at_least_one_key}')
-                            before_intersect_match_at_least_one_count = len(total_matching_items)
-                            self.log.format_with_message(f'Before intersect for match_at_least_one_keys {before_intersect_match_at_least_one_count}', match=match_at_least_one_key)
-                        if len(new_found_items) != 0:
-                            found_matching = True
-                        new_found_items = total_matching_items | new_found_items
-                        if self.log.enabled:
-                            after_intersect_match_at_least_one_count = len(new_found_items)
-                            self.log.format_with_message(f'After intersect for match_at_least_one_keys {after_intersect_match_at_least_one_count}', match=match_at_least_one_key)
-                        total_matching_items = new_found_items
-                    else:
-                        if self.log.enabled:
-                            new_found_match_at_least_one_count = len(new_found_items)
-                            self.log.format_with_message(f'Found with match_at_least_one_keys {new_found_match_at_least_one_count}', match=match_at_least_one_key)
-                        if new_found_items is not None and len(new_found_items) != 0:
-                            found_matching = True
-                        total_matching_items = new_found_items
-
-                if not found_matching or not total_matching_items:
-                    if self.log.enabled:
-                        self.log.format_with_message(f'No {self._item_name}s found for match_at_least_one_set.', match_at_least_one_set=match_at_least_one_key_set)
-                    return tuple()
-                self.verbose_log.format_with_message('Located a match for set, combining it with what currently exists.', match_at_least_one_set=match_at_least_one_key_set)
-                if found_item_identifiers is not None:
-                    if self.log.enabled:
-                        self.log.debug(f'Connecting set {match_at_least_one_key_set}')
-                        total_count_before = len(total_matching_items)
-                        self.log.debug(f'Before intersect for match_at_least_one_set {total_count_before}')
-                    if len(total_matching_items) != 0:
-                        found_all_matching = True
-                    total_matching_items = found_item_identifiers & total_matching_items
-                    if self.log.enabled:
-                        total_count_after = len(total_matching_items)
-                        self.log.debug(f'After intersect for match_at_least_one_set {total_count_after}')
-                    found_item_identifiers = total_matching_items
-                else:
-                    if self.log.enabled:
-                        total_count_after = len(total_matching_items)
-                        self.log.debug(f'Found with match_at_least_ones {total_count_after}')
-                    if total_matching_items is not None and len(total_matching_items) != 0:
-                        found_all_matching = True
-                    found_item_identifiers = total_matching_items
-            if not found_all_matching:
-                if self.log.enabled:
-                    self.log.format_with_message(f'No {self._item_name}s found for match_at_least_one_set', match_at_least_one_sets=match_at_least_one_key_sets)
-                return tuple()
-
-        self.log.format_with_message('Using all_keys', all_keys=all_keys)
-        for include_all_key in all_keys:
-            if include_all_key is None:
-                continue
-            if include_all_key.key not in self.item_library:
-                # One of All keys is not within the item library! This means no items match ALL keys.
-                if self.log.enabled:
-                    self.log.format_with_message(f'All Key not found within the {self._item_name} library, meaning there are no {self._item_name}s available for it! Skipping this key.', key=include_all_key.key)
-                return tuple()
-            new_found_items = self.item_library[include_all_key.key]
-            if found_item_identifiers is not None:
-                if self.log.enabled:
-                    before_intersect_all_count = len(found_item_identifiers)
-                    self.log.format_with_message(f'Before intersect for all_keys {before_intersect_all_count}', include_all_key=include_all_key)
-                new_found_items = found_item_identifiers & new_found_items
-                if self.log.enabled:
-                    after_intersect_all_count = len(new_found_items)
-                    self.log.format_with_message(f'After intersect for all_keys {after_intersect_all_count}', include_all_key=include_all_key)
-            else:
-                if self.log.enabled:
-                    new_match_all_count = len(new_found_items)
-                    self.log.format_with_message(f'Found with all_keys {new_match_all_count}', include_all_key=include_all_key)
-
-            found_item_identifiers = new_found_items
-
-        if found_item_identifiers is None and all_keys:
-            if self.log.enabled:
-                self.log.format_with_message(f'No {self._item_name}s found for all_keys.', all_keys=all_keys)
+                self.log.debug(f'No found {self._item_name}s after filtering by keys. All Keys: {request.include_all_keys} Any Keys: {request.include_any_keys}')
             return tuple()
 
-        if self.log.enabled:
-            after_all_keys = len(found_item_identifiers) if found_item_identifiers is not None else 0
-            self.log.debug(f'After all_keys {after_all_keys}')
         if self.verbose_log.enabled:
-            if found_item_identifiers is not None:
-                found_all_items: List[str] = list()
-                for anim_identifier in found_item_identifiers:
-                    item = self._registry.locate_by_identifier(anim_identifier)
-                    if item is None:
-                        continue
-                    found_all_items.append(item.short_name)
-                self.verbose_log.format_with_message(f'Found {self._item_name}s via all keys', items=found_all_items)
+            found_item_names: List[str] = [item.short_name for item in found_items]
+            self.verbose_log.format_with_message(f'Found {self._item_name}s via keys', items=found_item_names)
 
-        self.log.format_with_message('Using any_keys', any_keys=any_keys)
-        found_items_via_any_keys = set()
-        for include_any_key in any_keys:
-            if include_any_key is None:
-                continue
-            if include_any_key.key not in self.item_library:
-                if self.log.enabled:
-                    self.log.format_with_message(f'Any Key not found within the {self._item_name} library, meaning there are no {self._item_name}s available for it! Skipping this key.', key=include_any_key.key)
+        stop_watch = CommonStopWatch()
+        stop_watch.start()
+        count = 0
+        for item in found_items:
+            passes_tests = self._run_tests(item, item_tests)
+            if not passes_tests:
+                if self.log.is_enabled:
+                    self.log.format_with_message(f'{self._item_name} failed item test', item=item.short_name, reason=passes_tests.reason)
                 continue
-            found_items_via_any_keys = found_items_via_any_keys | self.item_library[include_any_key.key]
+            count += 1
+            yield item
 
         if self.log.enabled:
-            found_any_keys_count = len(found_items_via_any_keys) if found_items_via_any_keys is not None else 0
-            self.log.debug(f'Found {self._item_name}s via any {found_any_keys_count}')
+            self.log.debug(f'After item tests keys {count}')
+            time_taken = CommonTextUtils.to_truncated_decimal(stop_watch.stop_milliseconds())
+            self.log.format_with_message(f'Finished running loaded item tests in {time_taken}ms')
+        else:
+            stop_watch.stop()
 
-        if self.verbose_log.enabled:
-            found_any_items: List[str] = list()
-            for anim_identifier in found_items_via_any_keys:
-                item = self._registry.locate_by_identifier(anim_identifier)
-                if item is None:
-                    continue
-                found_any_items.append(item.short_name)
-            self.verbose_log.format_with_message(f'Found {self._item_name}s via any keys', items=found_any_items)
+    def _get_found_items(self, request: CommonLoadedItemFilterRequest) -> Iterable[CommonLoadedItemType]:
+        if self._max_cached_queries <= 0:
+            found_items_mask = self._filter_items_by_keys(request)
+            if not found_items_mask:
+                return tuple()
+            return tuple(self._get_items_from_mask(found_items_mask))
+        cached_queries_generation = (self._generation, self._registry.generation)
+        if self._cached_queries_generation != cached_queries_generation:
+            self._cached_queries.clear()
+            self._cached_queries_generation = cached_queries_generation
+        query_cache_key = self._get_query_cache_key(request)
+        found_items = self._cached_queries.get(query_cache_key, None)
+        if found_items is not None:
+            self._query_cache_hits += 1
+            self._cached_queries.move_to_end(query_cache_key)
+            return found_items
+        self._query_cache_misses += 1
+        found_items = tuple(self._get_items_from_mask(self._filter_items_by_keys(request)))
+        self._cached_queries[query_cache_key] = found_items
+        if len(self._cached_queries) > self._max_cached_queries:
+            self._cached_queries.popitem(last=False)
+        return found_items
+
+    @staticmethod
+    def _get_query_cache_key(request: CommonLoadedItemFilterRequest) -> Tuple[Any, ...]:
+        # Keys are order independent, but whether all keys and any keys were specified at all changes the outcome of a query even when they are all None.
+        def _to_key_set(_item_keys: Iterator[Any]) -> frozenset:
+            return frozenset([_item_key.key for _item_key in _item_keys if _item_key is not None])
+
+        return (
+            request.query_type,
+            len(request.include_all_keys) > 0,
+            _to_key_set(request.include_all_keys),
+            len(request.include_any_keys) > 0,
+            _to_key_set(request.include_any_keys),
+            _to_key_set(request.exclude_keys),
+            frozenset([_to_key_set(match_at_least_one_key_set) for match_at_least_one_key_set in request.must_match_at_least_one_key_sets])
+        )
+
+    def _filter_items_by_keys(self, request: CommonLoadedItemFilterRequest) -> int:
+        # Plans the key filtering of a query. All keys are intersected from the fewest to the most matching items, any keys are only evaluated against the surviving items when they are intersected, and filtering stops as soon as no items remain.
+        item_key_masks = self._item_key_masks
+        all_keys = request.include_all_keys
+        any_keys = request.include_any_keys
+        # Each mask has one bit set for each item ordinal (See _organize) that matches.
+        found_items_mask = None
 
-        if found_item_identifiers is None:
+        for match_at_least_one_key_set in request.must_match_at_least_one_key_sets:
+            matching_items_mask = 0
+            for match_at_least_one_key in match_at_least_one_key_set:
+                if match_at_least_one_key is None:
+                    continue
+                # Keys not within the item library match no items and are skipped.
+                matching_items_mask |= item_key_masks.get(match_at_least_one_key.key, 0)
+            if not matching_items_mask:
+                if self.log.enabled:
+                    self.log.format_with_message(f'No {self._item_name}s found for match_at_least_one_set.', match_at_least_one_set=match_at_least_one_key_set)
+                return 0
+            found_items_mask = matching_items_mask if found_items_mask is None else found_items_mask & matching_items_mask
+
+        if self.log.enabled and found_items_mask is not None:
+            self.log.debug(f'After match_at_least_one_sets {self._count_items(found_items_mask)}')
+
+        if all_keys:
+            include_all_keys = tuple([include_all_key.key for include_all_key in all_keys if include_all_key is not None])
+            for include_all_key in include_all_keys:
+                if include_all_key not in item_key_masks:
+                    # One of All keys is not within the item library! This means no items match ALL keys.
+                    if self.log.enabled:
+                        self.log.format_with_message(f'All Key not found within the {self._item_name} library, meaning there are no {self._item_name}s available for it!', key=include_all_key)
+                    return 0
+            item_key_counts = self._item_key_counts
+            for include_all_key in sorted(include_all_keys, key=lambda _include_all_key: item_key_counts[_include_all_key]):
+                new_found_items_mask = item_key_masks[include_all_key]
+                found_items_mask = new_found_items_mask if found_items_mask is None else found_items_mask & new_found_items_mask
+                if not found_items_mask:
+                    break
+            if found_items_mask is None:
+                if self.log.enabled:
+                    self.log.format_with_message(f'No {self._item_name}s found for all_keys.', all_keys=all_keys)
+                return 0
             if self.log.enabled:
-                self.log.debug(f'No {self._item_name}s found for all_keys.')
-            if not all_keys:
-                self.log.debug('Returning any keys.')
-                yield from _convert_found_items(found_items_via_any_keys)
-                return tuple()
-        else:
-            query_type = request.query_type
-            if not any_keys and (query_type == CommonQueryMethodType.ALL_INTERSECT_ANY or query_type == CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE):
-                query_type = CommonQueryMethodType.ALL_PLUS_ANY
-            if query_type == CommonQueryMethodType.ALL_PLUS_ANY:
-                found_item_identifiers = found_item_identifiers | found_items_via_any_keys
-            elif query_type == CommonQueryMethodType.ALL_INTERSECT_ANY:
-                found_item_identifiers = found_item_identifiers & found_items_via_any_keys
-
-            if query_type == CommonQueryMethodType.ALL_PLUS_ANY_MUST_HAVE_ONE:
-                if not found_items_via_any_keys:
-                    return tuple()
-                found_item_identifiers = found_item_identifiers | found_items_via_any_keys
-            elif query_type == CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE:
-                if not found_items_via_any_keys:
-                    return tuple()
-                found_item_identifiers = found_item_identifiers & found_items_via_any_keys
-
-        if found_item_identifiers is None or not found_item_identifiers:
+                self.log.debug(f'After all_keys {self._count_items(found_items_mask)}')
+
+        if found_items_mask is None:
+            # Without all keys or match at least one keys, the items matching any of the any keys are returned as they are.
+            found_items_via_any_keys_mask = 0
+            for include_any_key in any_keys:
+                if include_any_key is None:
+                    continue
+                found_items_via_any_keys_mask |= item_key_masks.get(include_any_key.key, 0)
             if self.log.enabled:
-                self.log.debug(f'No found {self._item_name}s after combining any keys. All Keys: {all_keys} Any Keys: {any_keys}')
-            return tuple()
+                self.log.debug(f'Returning {self._count_items(found_items_via_any_keys_mask)} {self._item_name}s found via any keys.')
+            return found_items_via_any_keys_mask
+
+        query_type = request.query_type
+        if not any_keys and (query_type == CommonQueryMethodType.ALL_INTERSECT_ANY or query_type == CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE):
+            query_type = CommonQueryMethodType.ALL_PLUS_ANY
+        if query_type == CommonQueryMethodType.ALL_INTERSECT_ANY or query_type == CommonQueryMethodType.ALL_INTERSECT_ANY_MUST_HAVE_ONE:
+            if not found_items_mask:
+                return 0
+            candidate_items_mask = found_items_mask
+            found_items_mask = 0
+            for include_any_key in any_keys:
+                if include_any_key is None or include_any_key.key not in item_key_masks:
+                    continue
+                found_items_mask |= item_key_masks[include_any_key.key] & candidate_items_mask
+                if found_items_mask == candidate_items_mask:
+                    # Every candidate has matched at least one any key.
+                    break
+        elif query_type == CommonQueryMethodType.ALL_PLUS_ANY or query_type == CommonQueryMethodType.ALL_PLUS_ANY_MUST_HAVE_ONE:
+            found_items_via_any_keys_mask = 0
+            for include_any_key in any_keys:
+                if include_any_key is None:
+                    continue
+                found_items_via_any_keys_mask |= item_key_masks.get(include_any_key.key, 0)
+            if query_type == CommonQueryMethodType.ALL_PLUS_ANY_MUST_HAVE_ONE and not found_items_via_any_keys_mask:
+                return 0
+            found_items_mask |= found_items_via_any_keys_mask
 
         if self.log.enabled:
-            after_any_keys_count = len(found_item_identifiers)
-            self.log.debug(f'After any keys {after_any_keys_count}')
+            self.log.debug(f'After any keys {self._count_items(found_items_mask)}')
 
-        self.log.format_with_message('Using exclude', exclude_keys=exclude_keys)
-        for exclude_key in exclude_keys:
-            if exclude_key is None:
+        for exclude_key in request.exclude_keys:
+            if not found_items_mask:
+                return 0
+            if exclude_key is None or exclude_key.key not in item_key_masks:
                 continue
-            exclude_key = exclude_key.key
-            if exclude_key not in self.item_library:
-                continue
-            to_exclude_items = self.item_library[exclude_key]
-            if self.log.enabled:
-                before_found_item_count = len(found_item_identifiers)
-                before_to_exclude_item_count = len(to_exclude_items)
-                self.log.debug(f'Before exclude key {exclude_key} {before_found_item_count} to exclude {before_to_exclude_item_count}')
-            found_item_identifiers = found_item_identifiers - to_exclude_items
-            if self.log.enabled:
-                after_found_item_count = len(found_item_identifiers)
-                after_to_exclude_item_count = len(to_exclude_items)
-                self.log.debug(f'After exclude key {exclude_key} {after_found_item_count} to exclude {after_to_exclude_item_count}')
+            found_items_mask &= ~item_key_masks[exclude_key.key]
 
         if self.log.enabled:
-            after_exclude_item_count = len(found_item_identifiers)
-            self.log.debug(f'After exclude {after_exclude_item_count}')
-        stop_watch = CommonStopWatch()
-        stop_watch.start()
-        yield from _convert_found_items(found_item_identifiers)
-
-        if self.log.enabled:
-            time_taken = CommonTextUtils.to_truncated_decimal(stop_watch.stop_milliseconds())
-            self.log.format_with_message(f'Finished running loaded item tests in {time_taken}ms')
-        else:
-            stop_watch.stop()
+            self.log.debug(f'After exclude {self._count_items(found_items_mask)}')
+        return found_items_mask
+
+    def _set_item_key_masks(self, items_by_ordinal: List[CommonLoadedItemType], item_key_masks: Dict[Tuple[Any, Any], int]) -> None:
+        self._items_by_ordinal = items_by_ordinal
+        self._item_key_masks = item_key_masks
+        self._item_key_counts = {item_key: self._count_items(items_mask) for (item_key, items_mask) in item_key_masks.items()}
+        self._item_library = None
+        self._generation += 1
+
+    def _get_items_from_mask(self, items_mask: int) -> Iterator[CommonLoadedItemType]:
+        items_by_ordinal = self._items_by_ordinal
+        # The binary text is reversed so that the index of each '1' is the ordinal of an item.
+        item_bits = bin(items_mask)[:1:-1]
+        item_ordinal = item_bits.find('1')
+        while item_ordinal != -1:
+            yield items_by_ordinal[item_ordinal]
+            item_ordinal = item_bits.find('1', item_ordinal + 1)
+
+    @staticmethod
+    def _count_items(items_mask: int) -> int:
+        return bin(items_mask).count('1')
+
+    @staticmethod
+    def _to_items_mask(item_ordinals: Iterator[int]) -> int:
+        # Setting bits within a byte array and converting it once avoids creating a new int for every item.
+        item_ordinals = tuple(item_ordinals)
+        if not item_ordinals:
+            return 0
+        item_bits = bytearray((max(item_ordinals) >> 3) + 1)
+        for item_ordinal in item_ordinals:
+            item_bits[item_ordinal >> 3] |= 1 << (item_ordinal & 7)
+        return int.from_bytes(item_bits, byteorder='little')
 
     def get_all(self) -> Tuple[CommonLoadedItemType]:
         """ Get all items. """
-        if self._collecting:
+        if not self._wait_until_items_can_be_queried():
             return tuple()
         return tuple(self._all)
 
     def _organize(self, items: Tuple[CommonLoadedItemType]):
         if self.log.enabled:
             self.log.debug(f'Collecting {self._item_name}s Query Data...')
-        self.item_library.clear()
-        new_item_library = dict()
+        item_ordinals_by_identifier: Dict[str, int] = dict()
+        items_by_ordinal: List[CommonLoadedItemType] = list()
+        item_ordinals_by_key: Dict[Tuple[Any, Any], List[int]] = dict()
         item_organizers = tuple(self._item_organizers)
         for item in items:
             item.clear_cached_data()
             if self.log.enabled:
                 self.log.format_with_message(f'Handling keys for {self._item_name}', item=item.short_name)
             item_identifier = item.identifier
+            item_ordinal = item_ordinals_by_identifier.get(item_identifier, None)
+            if item_ordinal is None:
+                item_ordinal = len(items_by_ordinal)
+                item_ordinals_by_identifier[item_identifier] = item_ordinal
+                items_by_ordinal.append(item)
             item_keys = list()
             for item_organizer in item_organizers:
                 if not item_organizer.applies(item):
@@ -383,17 +469,15 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
                 for item_key_value in item_organizer.get_key_values(item):
                     item_key = (item_key_type, item_key_value)
                     item_keys.append(item_key)
-                    if item_key not in new_item_library:
-                        new_item_library[item_key] = set()
-                    if item_identifier in new_item_library[item_key]:
-                        continue
-                    new_item_library[item_key].add(item_identifier)
+                    if item_key not in item_ordinals_by_key:
+                        item_ordinals_by_key[item_key] = list()
+                    item_ordinals_by_key[item_key].append(item_ordinal)
             if self.log.enabled:
                 self.log.format_with_message(f'Applied keys to {self._item_name}.', name=item.short_name, keys=item_keys)
 
+        self._set_item_key_masks(items_by_ordinal, {item_key: self._to_items_mask(item_ordinals) for (item_key, item_ordinals) in item_ordinals_by_key.items()})
         if self.log.enabled:
-            self.log.format_with_message(f'Completed collecting {self._item_name} Query Data.', item_library=new_item_library)
-        self.item_library = new_item_library
+            self.log.format_with_message(f'Completed collecting {self._item_name} Query Data.', item_library=self.item_library)
 
     def trigger_collection(self, show_loading_notification: bool = True) -> None:
         """trigger_collection(show_loading_notification=True)
@@ -418,18 +502,21 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
                     self._registry.load()
                     return
 
-                number_of_items = self._collect()
-                if number_of_items == -1:
+                if self._registry.loads_asynchronously:
+                    self._collect_asynchronously(_on_collected)
                     return
-                CommonBasicNotification(
-                    self._finished_loading_title(),
-                    self._finished_loading_description(),
-                    description_tokens=(str(self.total_valid), str(self.total), str(self.duplicates), str(self.total_invalid))
-                ).show()
+                _on_collected(self._collect())
             except Exception as ex:
                 self.log.error(f'Error occurred while collecting {self._item_name}s.', exception=ex)
-            finally:
-                self._collecting = False
+
+        def _on_collected(number_of_items: int) -> None:
+            if number_of_items == -1:
+                return
+            CommonBasicNotification(
+                self._finished_loading_title(),
+                self._finished_loading_description(),
+                description_tokens=(str(self.total_valid), str(self.total), str(self.duplicates), str(self.total_invalid))
+            ).show()
 
         _recollect_data()
 
@@ -437,6 +524,31 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
         if self._collecting:
             return -1
         self._collecting = True
+        try:
+            return self._collect_items()
+        finally:
+            self._collecting = False
+
+    def _collect_asynchronously(self, on_collected: Callable[[int], None]) -> None:
+        # Items are organized on a background thread, the result is handed back to the main thread.
+        if self._collecting:
+            return
+        self._collecting = True
+
+        def _collect_on_background_thread() -> None:
+            number_of_items = -1
+            try:
+                number_of_items = self._collect_items()
+            finally:
+                CommonMainThreadService().call_soon(_finish_collecting, number_of_items)
+
+        def _finish_collecting(number_of_items: int) -> None:
+            self._collecting = False
+            on_collected(number_of_items)
+
+        Thread(target=_collect_on_background_thread, name=f'{self.__class__.__name__}Collector', daemon=True).start()
+
+    def _collect_items(self) -> int:
         try:
             # noinspection PyTypeChecker
             self._all: Tuple[CommonLoadedItemType] = tuple(self._registry.loaded_items.values())
@@ -458,7 +570,6 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
             stop_watch = CommonStopWatch()
             stop_watch.start()
             self._organize(self._all)
-            self._collecting = False
             self.log.enable()
             time_taken = CommonTextUtils.to_truncated_decimal(stop_watch.stop_milliseconds())
             after_organize_time = time_taken
@@ -471,10 +582,20 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
                 self.log.debug(f'Loaded {found_all_count} {self._item_name}s.')
             return len(self._all)
         except Exception as ex:
-            self.log.error(f'Error occurred while collecting {self._item_name}s.', exception=ex)
+            main_thread_service = CommonMainThreadService()
+            if main_thread_service.is_main_thread:
+                self._log_collection_error(ex)
+            else:
+                # Logging an error may show a notification, which must be done on the main thread.
+                main_thread_service.call_soon(self._log_collection_error, ex)
             return -1
-        finally:
-            self._collecting = False
+
+    def _log_collection_error(self, exception: Exception) -> None:
+        try:
+            # Raised again, so the traceback of the exception is logged even when it was caught on the background thread.
+            raise exception
+        except Exception as ex:
+            self.log.error(f'Error occurred while collecting {self._item_name}s.', exception=ex)
 
     @classmethod
     def register_item_organizer(cls, key_type: Any) -> Callable[[Any], Any]:
@@ -528,7 +649,7 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
         if event_data.game_loaded:
             # If the game is already loaded, we've already notified about the data once.
             return False
-        if not cls().collecting and cls._should_show_finished_loading_notification():
+        if not cls().collecting and not cls()._registry.loading and cls._should_show_finished_loading_notification():
             CommonBasicNotification(
                 cls._finished_loading_title(),
                 cls._finished_loading_description(),
@@ -538,7 +659,7 @@ class CommonLoadedItemQueryRegistry(CommonService, HasLog, Generic[CommonLoadedI
 
     @classmethod
     def _show_item_loading_notification_on_first_update(cls) -> None:
-        if cls().collecting:
+        if cls().collecting or cls()._registry.loading:
             CommonBasicNotification(
                 cls._loading_items_title(),
                 cls._loading_items_description()
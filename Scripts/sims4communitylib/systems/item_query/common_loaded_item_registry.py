@@ -6,7 +6,7 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 Copyright (c) COLONOLNUTTY
 """
 from threading import Thread
-from typing import Iterator, Dict, List, Union, TypeVar, Generic, Tuple, Any
+from typing import Iterator, Dict, List, Union, TypeVar, Generic, Tuple, Any, Set, Callable
 
 from sims4communitylib.systems.item_query.persistence.common_loaded_item_cache import CommonLoadedItemCache
 from sims4communitylib.systems.item_query.persistence.common_loaded_item_cache_service import \
@@ -17,6 +17,7 @@ from sims4.callback_utils import CallableList
 from sims4communitylib.classes.time.common_stop_watch import CommonStopWatch
 from sims4communitylib.logging.has_log import HasLog
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.services.common_main_thread_service import CommonMainThreadService
 from sims4communitylib.services.common_service import CommonService
 
 CommonLoadedItemType = TypeVar('CommonLoadedItemType', bound=CommonLoadedItem)
@@ -39,6 +40,7 @@ class CommonLoadedItemRegistry(CommonService, HasLog, Generic[CommonLoadedItemTy
         super().__init__()
         self._loaded = False
         self.item_loaders = list()
+        self._generation = 0
         self.loaded_items = None
         self._total = 0
         self._total_valid = 0
@@ -48,6 +50,7 @@ class CommonLoadedItemRegistry(CommonService, HasLog, Generic[CommonLoadedItemTy
         self._loading = False
         self._load_thread: Union[Thread, None] = None
         self._on_finished_loading_callback = CallableList()
+        self._on_loading_progress_callback = CallableList()
 
     @property
     def loaded(self) -> bool:
@@ -106,6 +109,12 @@ class CommonLoadedItemRegistry(CommonService, HasLog, Generic[CommonLoadedItemTy
     @loaded_items.setter
     def loaded_items(self, value: Dict[str, CommonLoadedItemType]):
         self._loaded_items = value
+        self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """A number that changes whenever items are loaded or added to the registry."""
+        return self._generation
 
     def add_item_loader(self, item_loader: CommonBaseItemLoader) -> bool:
         """ Add a loader of items. """
@@ -130,6 +139,7 @@ class CommonLoadedItemRegistry(CommonService, HasLog, Generic[CommonLoadedItemTy
                 if _unique_id in self.loaded_items:
                     return
                 self.loaded_items[_unique_id] = item
+                self._generation += 1
                 return
 
             self.register_on_finished_loading_callback(_add_on_finished_loading)
@@ -139,16 +149,73 @@ class CommonLoadedItemRegistry(CommonService, HasLog, Generic[CommonLoadedItemTy
         if unique_id in self.loaded_items:
             return False
         self.loaded_items[unique_id] = item
+        self._generation += 1
         return True
 
+    def register_on_loading_progress_callback(self, callback: Callable[[int], None]) -> None:
+        """register_on_loading_progress_callback(callback)
+
+        Register a callback invoked as items are loaded.
+
+        .. note:: The callback receives the number of items loaded so far. It is always invoked on the main thread.
+
+        :param callback: The callback to invoke.
+        :type callback: Callable[[int], None]
+        """
+        if callback not in self._on_loading_progress_callback:
+            self._on_loading_progress_callback.append(callback)
+
+    @property
+    def loads_asynchronously(self) -> bool:
+        """Determine if items are loaded on a background thread.
+
+        :return: True, if items are loaded on a background thread and :func:`load` returns before they have finished loading. False, if items are loaded before :func:`load` returns.
+        :rtype: bool
+        """
+        return self._should_load_asynchronously()
+
     def load(self) -> None:
-        """ Load data. """
+        """ Load data.
+
+        .. note:: When the registry loads asynchronously, loading, verifying, and caching items is done on a background thread. Snippets and checksums are still retrieved on the main thread and the finished loading callbacks are invoked on the main thread once all items are loaded.
+
+        .. warning:: When loading asynchronously, items, item loaders, and `_add_additional_item_data` must use :class:`.CommonMainThreadService` for anything that interacts with the game.
+        """
         if self._loaded or self._loading:
             self.log.format_with_message('Not loading because already loaded.', loaded=self._loaded, loading=self._loading)
             return
-        try:
-            self._loading = True
+        self._loading = True
+        if self._should_load_asynchronously():
+            # Created on the main thread, so the background thread never creates the service itself.
+            CommonMainThreadService()
+            self._load_thread = Thread(target=self._load_items, name=f'{self.__class__.__name__}Loader', daemon=True)
+            self._load_thread.start()
+            return
+        self._load_items()
+
+    def wait_until_loaded(self) -> bool:
+        """wait_until_loaded()
+
+        Wait for items that are loading on a background thread to finish loading.
 
+        .. note:: When called from the main thread, functions the background thread needs run on the main thread are run while waiting.
+
+        :return: True, if the registry has finished loading. False, if loading failed.
+        :rtype: bool
+        """
+        main_thread_service = CommonMainThreadService()
+        while self._loading:
+            main_thread_service.process_queued_calls()
+            load_thread = self._load_thread
+            if load_thread is not None and load_thread.is_alive():
+                load_thread.join(0.01)
+        return self._loaded
+
+    def _should_load_asynchronously(self) -> bool:
+        return False
+
+    def _load_items(self) -> None:
+        try:
             should_use_cache = self._should_use_cache()
 
             stop_watch = CommonStopWatch()
@@ -158,21 +225,21 @@ class CommonLoadedItemRegistry(CommonService, HasLog, Generic[CommonLoadedItemTy
             self._total_valid = 0
             self._total_invalid = 0
             items_library: Dict[str, CommonLoadedItemType] = dict()
-            if not should_use_cache or self._update_cache():
-                self.log.debug(f'Clearing {self.__class__.__name__} cache.')
-                self._clear_cache()
+            items: Union[Tuple[CommonLoadedItem, ...], None] = None
+            if should_use_cache:
+                items = self._load_items_from_cache()
 
-            loaded_items_cache = self._load_from_cache()
-            if should_use_cache and loaded_items_cache is not None:
-                items: Tuple[CommonLoadedItem, ...] = loaded_items_cache.cached_objects
+            if items is not None:
                 self._total = len(items)
                 self._total_valid = self._total
                 should_verify = True
             else:
-                items: Tuple[CommonLoadedItem, ...] = tuple(self._load())
-                cache_service = self._get_cache_service()
-                if cache_service is not None:
-                    self._save_to_cache(cache_service.create_cache(items, self._get_checksums()))
+                self.log.debug(f'Clearing {self.__class__.__name__} cache.')
+                self._clear_cache()
+                items_by_checksum_key = self._load_snippets()
+                items: Tuple[CommonLoadedItem, ...] = tuple([item for snippet_items in items_by_checksum_key.values() for item in snippet_items])
+                if self._get_cache_service() is not None:
+                    self._save_partitioned_cache(items_by_checksum_key, self._get_checksums())
                 should_verify = False
 
             self._duplicates = 0
@@ -188,21 +255,112 @@ class CommonLoadedItemRegistry(CommonService, HasLog, Generic[CommonLoadedItemTy
                     continue
                 self._add_additional_item_data(item)
                 items_library[identifier] = item
+            self._report_loading_progress(len(items_library))
 
-            self.loaded_items = items_library
-            self._loaded = True
-            self._load_thread = None
-            self._loading = False
-            self._total_time = stop_watch.stop_milliseconds()
-            self._on_finished_loading_callback()
-            self._on_finished_loading_callback.clear()
-            self.log.debug('Finished loading items.')
+            total_time = stop_watch.stop_milliseconds()
+            main_thread_service = CommonMainThreadService()
+            if main_thread_service.is_main_thread:
+                self._finish_loading(items_library, total_time)
+            else:
+                main_thread_service.call_soon(self._finish_loading, items_library, total_time)
+        except Exception as ex:
+            main_thread_service = CommonMainThreadService()
+            if main_thread_service.is_main_thread:
+                self._fail_loading(ex)
+            else:
+                # Logging an error may show a notification, which must be done on the main thread.
+                main_thread_service.call_soon(self._fail_loading, ex)
+
+    def _fail_loading(self, exception: Exception) -> None:
+        try:
+            # Raised again, so the traceback of the exception is logged even when it was caught on the background thread.
+            raise exception
         except Exception as ex:
             self.log.error('Error occurred while loading items.', exception=ex)
+        if self._load_thread is not None:
+            self._load_thread = None
+            self._loading = False
+
+    def _finish_loading(self, items_library: Dict[str, CommonLoadedItemType], total_time: float) -> None:
+        self.loaded_items = items_library
+        self._loaded = True
+        self._load_thread = None
+        self._loading = False
+        self._total_time = total_time
+        self._on_finished_loading_callback()
+        self._on_finished_loading_callback.clear()
+        self.log.debug('Finished loading items.')
+
+    def _report_loading_progress(self, total_items_loaded: int) -> None:
+        if not self._on_loading_progress_callback:
+            return
+        main_thread_service = CommonMainThreadService()
+        if main_thread_service.is_main_thread:
+            self._on_loading_progress_callback(total_items_loaded)
+        else:
+            main_thread_service.call_soon(self._on_loading_progress_callback, total_items_loaded)
 
     def _should_use_cache(self) -> bool:
         return True
 
+    def _load_items_from_cache(self) -> Union[Tuple[CommonLoadedItemType, ...], None]:
+        loaded_items_cache = self._load_from_cache()
+        if loaded_items_cache is None:
+            return None
+        if loaded_items_cache.cached_partitions is None:
+            # Caches without partitions are rebuilt entirely when any checksum changes.
+            if self._update_cache():
+                return None
+            return loaded_items_cache.cached_objects
+        return self._update_cache_partitions(loaded_items_cache)
+
+    def _update_cache_partitions(self, loaded_items_cache: CommonLoadedItemCache[CommonLoadedItemType]) -> Union[Tuple[CommonLoadedItemType, ...], None]:
+        # Only the snippets with a new or changed checksum are loaded again, the items of every other snippet are reused from the cache.
+        cache_service = self._get_cache_service()
+        if cache_service is None:
+            return loaded_items_cache.cached_objects
+        checksums = self._get_checksums()
+        cached_checksums = loaded_items_cache.cached_checksums
+        checksum_keys: List[str] = list()
+        changed_snippet_keys: Set[Tuple[str, int]] = set()
+        for (snippet_name, snippet_id, checksum) in checksums:
+            checksum_key = cache_service.get_checksum_key(snippet_name, snippet_id)
+            checksum_keys.append(checksum_key)
+            if cached_checksums.get(checksum_key, -1) != checksum:
+                changed_snippet_keys.add((snippet_name, snippet_id))
+        removed_checksum_keys = set(cached_checksums.keys()) - set(checksum_keys)
+        if not changed_snippet_keys and not removed_checksum_keys:
+            self.log.debug(f'Cache does not need update. {self.__class__.__name__}')
+            return loaded_items_cache.cached_objects
+
+        self.log.debug(f'Updating {len(changed_snippet_keys)} changed snippet(s) and removing {len(removed_checksum_keys)} snippet(s) from cache. {self.__class__.__name__}')
+        changed_items_by_checksum_key = self._load_snippets(snippet_keys=changed_snippet_keys)
+        if not set(changed_items_by_checksum_key.keys()).issubset(checksum_keys):
+            self.log.debug(f'Loaded snippets did not match their checksums. {self.__class__.__name__}')
+            return None
+        cached_items_by_checksum_key = loaded_items_cache.get_cached_objects_by_partition()
+        items_by_checksum_key: Dict[str, Tuple[CommonLoadedItemType, ...]] = dict()
+        for ((snippet_name, snippet_id, _), checksum_key) in zip(checksums, checksum_keys):
+            if (snippet_name, snippet_id) in changed_snippet_keys:
+                items_by_checksum_key[checksum_key] = changed_items_by_checksum_key.get(checksum_key, tuple())
+            else:
+                items_by_checksum_key[checksum_key] = cached_items_by_checksum_key.get(checksum_key, tuple())
+        self._save_partitioned_cache(items_by_checksum_key, checksums)
+        return tuple([item for snippet_items in items_by_checksum_key.values() for item in snippet_items])
+
+    def _save_partitioned_cache(self, items_by_checksum_key: Dict[str, Tuple[CommonLoadedItemType, ...]], checksums: Tuple[Any]) -> None:
+        cache_service = self._get_cache_service()
+        if cache_service is None:
+            return
+        items = tuple([item for snippet_items in items_by_checksum_key.values() for item in snippet_items])
+        item_cache = cache_service.create_cache(items, checksums)
+        if set(items_by_checksum_key.keys()).issubset(item_cache.cached_checksums.keys()):
+            item_cache.cached_partitions = {checksum_key: len(snippet_items) for (checksum_key, snippet_items) in items_by_checksum_key.items()}
+        else:
+            # When loaders identify snippets differently than their checksums, the cache cannot be partitioned.
+            self.log.debug(f'Loaded snippets did not match their checksums, the cache will not be partitioned. {self.__class__.__name__}')
+        self._save_to_cache(item_cache)
+
     def _save_to_cache(self, item_cache: CommonLoadedItemCache[CommonLoadedItemType]):
         cache_service = self._get_cache_service()
         if cache_service is None:
@@ -231,39 +389,46 @@ class CommonLoadedItemRegistry(CommonService, HasLog, Generic[CommonLoadedItemTy
         return self.loaded_items.get(identifier, None)
 
     def _get_checksums(self) -> Tuple[Any]:
-        checksums: List[Any] = list()
-        for item_loader in self.item_loaders:
-            for new_checksum_data in item_loader.get_checksum_data_gen():
-                checksums.append(new_checksum_data)
-        return tuple(checksums)
+        def _get_checksums_on_main_thread() -> Tuple[Any]:
+            checksums: List[Any] = list()
+            for item_loader in self.item_loaders:
+                for new_checksum_data in item_loader.get_checksum_data_gen():
+                    checksums.append(new_checksum_data)
+            return tuple(checksums)
+
+        # Checksums are created from tuning, which is only safe to access from the main thread.
+        return CommonMainThreadService().run_on_main_thread(_get_checksums_on_main_thread)
 
     def _update_cache(self) -> bool:
         cache_service = self._get_cache_service()
         if cache_service is None:
             self.log.debug(f'No cache service found. {self.__class__.__name__}')
             return False
-        for item_loader in self.item_loaders:
-            for new_checksum_data in item_loader.get_checksum_data_gen():
-                if cache_service.cache_needs_update(new_checksum_data):
-                    self.log.debug(f'Found a checksum that was different. {self.__class__.__name__} {new_checksum_data}')
-                    return True
+        for new_checksum_data in self._get_checksums():
+            if cache_service.cache_needs_update(new_checksum_data):
+                self.log.debug(f'Found a checksum that was different. {self.__class__.__name__} {new_checksum_data}')
+                return True
         self.log.debug(f'Cache does not need update. {self.__class__.__name__}')
         return False
 
     def _load(self) -> Iterator[CommonLoadedItemType]:
-        total_invalid = 0
-        total_valid = 0
+        for snippet_items in self._load_snippets().values():
+            yield from snippet_items
+
+    def _load_snippets(self, snippet_keys: Set[Tuple[str, int]] = None) -> Dict[str, Tuple[CommonLoadedItemType, ...]]:
+        items_by_checksum_key: Dict[str, Tuple[CommonLoadedItemType, ...]] = dict()
+        total_items_loaded = 0
         for item_loader in self.item_loaders:
-            for item in item_loader.load():
-                if item is None:
-                    total_valid -= 1
-                    total_invalid += 1
-                    continue
-                yield item
+            for (snippet_name, snippet_id, items) in item_loader.load_snippets_gen(snippet_keys=snippet_keys):
+                checksum_key = CommonLoadedItemCacheService.get_checksum_key(snippet_name, snippet_id)
+                items_by_checksum_key[checksum_key] = items_by_checksum_key.get(checksum_key, tuple()) + items
+                total_items_loaded += len(items)
+                self._report_loading_progress(total_items_loaded)
             self.log.format_with_message('Done loading for loader.', loader=item_loader)
             self._total += item_loader.total
-            self._total_valid += item_loader.total_valid + total_valid
-            self._total_invalid += item_loader.total_invalid + total_invalid
+            self._total_valid += item_loader.total_valid
+            self._total_invalid += item_loader.total_invalid
+        return items_by_checksum_key
 
     def _add_additional_item_data(self, item: CommonLoadedItemType) -> None:
         raise NotImplementedError()
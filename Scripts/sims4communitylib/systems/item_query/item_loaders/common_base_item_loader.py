@@ -5,12 +5,13 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
-from typing import Tuple, Iterator, Any, Union, TypeVar, Generic
+from typing import Tuple, Iterator, Any, Union, TypeVar, Generic, Set, List
 
 from sims4communitylib.systems.item_query.dtos.common_loaded_item import CommonLoadedItem
 from sims4.resources import Types
 from sims4communitylib.logging.has_log import HasLog
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.services.common_main_thread_service import CommonMainThreadService
 from sims4communitylib.services.common_service import CommonService
 from sims4communitylib.utils.common_resource_utils import CommonResourceUtils
 
@@ -60,6 +61,20 @@ class CommonBaseItemLoader(CommonService, HasLog, Generic[CommonLoadedItemType])
         """Generate checksums."""
         raise NotImplementedError()
 
+    def get_snippet_key(self, item_package: Any) -> Tuple[str, int]:
+        """get_snippet_key(item_package)
+
+        Retrieve the name and id of a snippet, as they appear within the checksum data of the snippet.
+
+        .. note:: Override this if :func:`get_checksum_data_gen` identifies snippets differently.
+
+        :param item_package: A snippet containing items.
+        :type item_package: Any
+        :return: The name and id of the snippet.
+        :rtype: Tuple[str, int]
+        """
+        return item_package.__name__, getattr(item_package, 'guid64', None)
+
     def load(self) -> Iterator[CommonLoadedItemType]:
         """load()
 
@@ -68,18 +83,37 @@ class CommonBaseItemLoader(CommonService, HasLog, Generic[CommonLoadedItemType])
         :return: An iterator of the valid items.
         :rtype: Iterator[Any]
         """
+        for (_, _, items) in self.load_snippets_gen():
+            yield from items
+
+    def load_snippets_gen(self, snippet_keys: Set[Tuple[str, int]] = None) -> Iterator[Tuple[str, int, Tuple[CommonLoadedItemType, ...]]]:
+        """load_snippets_gen(snippet_keys=None)
+
+        Loads the items of each snippet.
+
+        :param snippet_keys: The name and id of the snippets to load. If None, all snippets will be loaded. Default is None.
+        :type snippet_keys: Set[Tuple[str, int]], optional
+        :return: An iterator of the name, id, and valid items of each snippet. Snippets without valid items are included.
+        :rtype: Iterator[Tuple[str, int, Tuple[CommonLoadedItemType, ...]]]
+        """
         self._total = 0
         self._total_valid = 0
         self._total_invalid = 0
         snippet_names: Tuple[str] = self.snippet_names
-        for item_package in CommonResourceUtils.load_instances_with_any_tags(Types.SNIPPET, snippet_names):
+        # Snippets are retrieved from the instance manager, which is only safe to access from the main thread.
+        item_packages = CommonMainThreadService().run_on_main_thread(CommonResourceUtils.load_instances_with_any_tags, Types.SNIPPET, snippet_names)
+        for item_package in item_packages:
             tuning_name = item_package.__name__
             try:
+                (snippet_name, snippet_id) = self.get_snippet_key(item_package)
+                if snippet_keys is not None and (snippet_name, snippet_id) not in snippet_keys:
+                    continue
                 items = tuple(self._load(item_package, tuning_name))
 
                 total = 0
                 total_valid = 0
                 total_invalid = 0
+                valid_items: List[CommonLoadedItemType] = list()
 
                 for item in items:
                     total += 1
@@ -90,7 +124,7 @@ class CommonBaseItemLoader(CommonService, HasLog, Generic[CommonLoadedItemType])
                     verify_result = item.verify()
                     if verify_result:
                         total_valid += 1
-                        yield item
+                        valid_items.append(item)
                     else:
                         self.log.warn(f'{item.short_name} was not valid. Reason: {verify_result}')
                         total_invalid += 1
@@ -99,6 +133,7 @@ class CommonBaseItemLoader(CommonService, HasLog, Generic[CommonLoadedItemType])
                 self._total_valid += total_valid
                 self._total_invalid += total_invalid
                 self.log.warn(f'Loaded {tuning_name}, Valid: {total_valid}, Total Invalid: {total_invalid}, Total: {total}')
+                yield snippet_name, snippet_id, tuple(valid_items)
             except Exception as ex:
                 self.log.error(f'An error occurred while parsing items from snippet \'{tuning_name}\'', exception=ex)
 
@@ -41,5 +41,5 @@ class CommonLoadedItemCacheService(CommonSerializableObjectCacheService[CommonLo
     def create_cache(self, objects: Tuple[CommonLoadedItem], checksums: Tuple[Any]) -> CommonLoadedItemCacheType:
         checksum_data = dict()
         for (snippet_name, snippet_id, checksum_value) in checksums:
-            checksum_data[f'{snippet_name}-{snippet_id}'] = checksum_value
+            checksum_data[self.get_checksum_key(snippet_name, snippet_id)] = checksum_value
         return CommonLoadedItemCacheType[Any](objects, checksum_data)
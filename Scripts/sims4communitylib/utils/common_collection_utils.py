@@ -184,23 +184,7 @@ class CommonCollectionUtils:
                 if isinstance(source_val, dict) and isinstance(destination_val, dict):
                     merged[source_key] = CommonCollectionUtils.merge_dict(destination_val, source_val, allow_duplicates_in_collections=allow_duplicates_in_collections)
                 elif CommonCollectionUtils.is_collection(source_val) and CommonCollectionUtils.is_collection(destination_val):
-                    if allow_duplicates_in_collections:
-                        if prefer_source_values:
-                            merged[source_key] = (
-                                *source_val,
-                                *destination_val
-                            )
-                        else:
-                            merged[source_key] = (
-                                *destination_val,
-                                *source_val
-                            )
-                    else:
-                        new_collection = list(destination_val)
-                        for val in source_val:
-                            if val not in new_collection:
-                                new_collection.append(val)
-                        merged[source_key] = tuple(new_collection)
+                    merged[source_key] = CommonCollectionUtils._merge_collections(destination_val, source_val, prefer_source_values, allow_duplicates_in_collections)
                 elif source_val == destination_val:
                     continue
                 else:
@@ -210,6 +194,77 @@ class CommonCollectionUtils:
                 merged[source_key] = source_val
         return merged
 
+    @staticmethod
+    def merge_dict_in_place(destination: Dict[Any, Any], source: Dict[Any, Any], prefer_source_values: bool=True, allow_duplicates_in_collections: bool=True) -> Dict[Any, Any]:
+        """merge_dict_in_place(destination, source, prefer_source_values=True, allow_duplicates_in_collections=True)
+
+        Merge a source dictionary into a destination dictionary, the same as :func:`merge_dict`, but modify the destination instead of copying it.
+
+        .. note:: Dictionaries of the source may become a part of the destination and be modified by later merges, only use this when the source is no longer needed.
+
+        :param destination: The dictionary to use as the destination. Source will be merged into this.
+        :type destination: Dict[Any, Any]
+        :param source: The dictionary to use as the source. Destination will have this merged into itself.
+        :type source: Dict[Any, Any]
+        :param prefer_source_values: When an entry is found within both the destination and the source, setting it to True will prefer to overwrite the destination value with the source value, setting this to False will prefer to use the destination value. Default is True.
+        :type prefer_source_values: bool, optional
+        :param allow_duplicates_in_collections: When a collection is found within both dictionaries, setting this to True will allow duplicate entries, setting it to False will not allow duplicate entries. Default is True.
+        :type allow_duplicates_in_collections: bool, optional
+        :return: The destination dictionary, containing the source merged into it.
+        :rtype: Dict[Any, Any]
+        """
+        for (source_key, source_val) in source.items():
+            if source_key in destination:
+                destination_val = destination[source_key]
+                if isinstance(source_val, dict) and isinstance(destination_val, dict):
+                    CommonCollectionUtils.merge_dict_in_place(destination_val, source_val, allow_duplicates_in_collections=allow_duplicates_in_collections)
+                elif CommonCollectionUtils.is_collection(source_val) and CommonCollectionUtils.is_collection(destination_val):
+                    destination[source_key] = CommonCollectionUtils._merge_collections(destination_val, source_val, prefer_source_values, allow_duplicates_in_collections)
+                elif source_val == destination_val:
+                    continue
+                elif prefer_source_values:
+                    destination[source_key] = source_val
+            else:
+                destination[source_key] = source_val
+        return destination
+
+    @staticmethod
+    def _merge_collections(destination_val: Any, source_val: Any, prefer_source_values: bool, allow_duplicates_in_collections: bool) -> Tuple[Any]:
+        if allow_duplicates_in_collections:
+            if prefer_source_values:
+                return (
+                    *source_val,
+                    *destination_val
+                )
+            return (
+                *destination_val,
+                *source_val
+            )
+        new_collection = list(destination_val)
+        # Hashable values are looked up in a set, the rest are compared one by one.
+        hashable_values = set()
+        unhashable_values = list()
+        for val in new_collection:
+            try:
+                hashable_values.add(val)
+            except TypeError:
+                unhashable_values.append(val)
+        for val in source_val:
+            try:
+                if val in hashable_values:
+                    continue
+            except TypeError:
+                if val in new_collection:
+                    continue
+                unhashable_values.append(val)
+                new_collection.append(val)
+                continue
+            if unhashable_values and val in unhashable_values:
+                continue
+            hashable_values.add(val)
+            new_collection.append(val)
+        return tuple(new_collection)
+
     @staticmethod
     def _process_item_sets(item_set: Union[Tuple[Any], List[Any], Set[Any]]) -> Tuple[bool, Union[Set[Any], List[Any]]]:
         item_sets = []
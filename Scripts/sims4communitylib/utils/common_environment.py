@@ -0,0 +1,136 @@
+"""
+The Sims 4 Community Library is licensed under the Creative Commons Attribution 4.0 International public license (CC BY 4.0).
+https://creativecommons.org/licenses/by/4.0/
+https://creativecommons.org/licenses/by/4.0/legalcode
+
+Copyright (c) COLONOLNUTTY
+"""
+import os
+from typing import Union, Set
+
+
+class CommonEnvironment:
+    """CommonEnvironment(mods_location_path, sims_documents_location_path)
+
+    The locations of the folders S4CL reads files from and writes files to, resolved once instead of each time they are used.
+
+    .. note:: The environment is resolved the first time it is used. Use :func:`reload` or the `s4clib.reload_environment` command to resolve it again.
+
+    :Example usage:
+
+    .. highlight:: python
+    .. code-block:: python
+
+        mod_data_location_path = CommonEnvironment.get().mod_data_location_path
+
+    :param mods_location_path: The full path of the 'Documents\\Electronic Arts\\The Sims 4\\Mods' folder.
+    :type mods_location_path: str
+    :param sims_documents_location_path: The full path of the 'Documents\\Electronic Arts\\The Sims 4' folder.
+    :type sims_documents_location_path: str
+    """
+    _environment: Union['CommonEnvironment', None] = None
+
+    def __init__(self, mods_location_path: str, sims_documents_location_path: str) -> None:
+        self._mods_location_path = mods_location_path
+        self._sims_documents_location_path = sims_documents_location_path
+        self._mod_data_location_path = os.path.join(mods_location_path, 'mod_data') if mods_location_path != '' else ''
+        self._mod_logs_location_path = os.path.join(sims_documents_location_path, 'mod_logs') if sims_documents_location_path != '' else ''
+        self._created_folder_paths: Set[str] = set()
+
+    @property
+    def mods_location_path(self) -> str:
+        """The full path of the 'Documents\\Electronic Arts\\The Sims 4\\Mods' folder.
+
+        :return: The full path of the Mods folder.
+        :rtype: str
+        """
+        return self._mods_location_path
+
+    @property
+    def sims_documents_location_path(self) -> str:
+        """The full path of the 'Documents\\Electronic Arts\\The Sims 4' folder.
+
+        :return: The full path of the Sims 4 documents folder or an empty string if it could not be found.
+        :rtype: str
+        """
+        return self._sims_documents_location_path
+
+    @property
+    def mod_data_location_path(self) -> str:
+        """The full path of the 'Documents\\Electronic Arts\\The Sims 4\\Mods\\mod_data' folder.
+
+        :return: The full path of the mod_data folder or an empty string if it could not be found.
+        :rtype: str
+        """
+        return self._mod_data_location_path
+
+    @property
+    def mod_logs_location_path(self) -> str:
+        """The full path of the 'Documents\\Electronic Arts\\The Sims 4\\mod_logs' folder.
+
+        :return: The full path of the mod_logs folder or an empty string if it could not be found.
+        :rtype: str
+        """
+        return self._mod_logs_location_path
+
+    def ensure_folder_exists(self, folder_path: str) -> None:
+        """ensure_folder_exists(folder_path)
+
+        Create a folder, unless it was already created through this environment.
+
+        :param folder_path: The full path of the folder.
+        :type folder_path: str
+        """
+        if folder_path in self._created_folder_paths:
+            return
+        os.makedirs(folder_path, exist_ok=True)
+        self._created_folder_paths.add(folder_path)
+
+    @classmethod
+    def get(cls) -> 'CommonEnvironment':
+        """get()
+
+        Retrieve the current environment, resolving it if it was not resolved yet.
+
+        :return: The current environment.
+        :rtype: CommonEnvironment
+        """
+        environment = cls._environment
+        if environment is None:
+            environment = cls.reload()
+        return environment
+
+    @classmethod
+    def reload(cls) -> 'CommonEnvironment':
+        """reload()
+
+        Resolve the environment again, forgetting which folders were created.
+
+        :return: The newly resolved environment.
+        :rtype: CommonEnvironment
+        """
+        mods_location_path = cls._resolve_mods_location_path()
+        cls._environment = cls(mods_location_path, cls._resolve_sims_documents_location_path(mods_location_path))
+        return cls._environment
+
+    @staticmethod
+    def _resolve_mods_location_path() -> str:
+        current_file_path = os.path.dirname(os.path.abspath(__file__))
+        return os.path.join(current_file_path.partition(f"{os.sep}Mods{os.sep}")[0], 'Mods')
+
+    @staticmethod
+    def _resolve_sims_documents_location_path(mods_location_path: str) -> str:
+        documents_path = os.path.dirname(mods_location_path)
+        if os.path.exists(documents_path):
+            return documents_path
+        from sims4communitylib.modinfo import ModInfo
+        root_file = os.path.normpath(os.path.dirname(os.path.realpath(ModInfo.get_identity().file_path))).replace(os.sep, '/')
+        root_file_split = root_file.split('/')
+        if 'Mods' not in root_file_split:
+            return ''
+        file_path = ''
+        # noinspection PyTypeChecker
+        exit_index = len(root_file_split) - root_file_split.index('Mods')
+        for index in range(0, len(root_file_split) - exit_index):
+            file_path = os.path.join(file_path + os.sep, str(root_file_split[index]))
+        return file_path
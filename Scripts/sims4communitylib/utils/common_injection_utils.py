@@ -5,9 +5,11 @@ https://creativecommons.org/licenses/by/4.0/legalcode
 
 Copyright (c) COLONOLNUTTY
 """
+import inspect
 import os
-from functools import wraps
-from typing import Any, Callable, TYPE_CHECKING
+from functools import partial, update_wrapper
+from types import MethodType
+from typing import Any, Callable, TYPE_CHECKING, Dict, Tuple, List
 
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 
@@ -43,6 +45,118 @@ StaticMethodType = type(_TypeChecking.static_method)
 PropertyType = type(_TypeChecking.property_type)
 
 
+def _log_injection_exception(mod_identity: CommonModIdentity, new_function: Callable[..., Any], target_object: Any, exception: Exception) -> None:
+    # noinspection PyBroadException
+    try:
+        from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
+        CommonExceptionHandler.log_exception(mod_identity, 'Error occurred while injecting into function \'{}\' of class \'{}\''.format(new_function.__name__, target_object.__name__), exception=exception)
+    except Exception:
+        pass
+
+
+class _CommonInjectionChain:
+    # Every injection into the same attribute of the same object, invoked through a single installed function.
+    # Each injection is given a continuation built when it is injected, instead of a wrapper that builds closures on every call.
+    _INJECTION_CHAINS: Dict[Tuple[int, str], '_CommonInjectionChain'] = dict()
+
+    def __init__(self, target_object: Any, target_function_name: str, original_function: Any) -> None:
+        self._target_object = target_object
+        self._target_function_name = target_function_name
+        self._original_function = original_function
+        self._injections: List[Tuple[CommonModIdentity, Callable[..., Any], bool]] = list()
+        self._installed_function = None
+        self._installed_attribute = None
+        self._is_class_method = False
+        self._is_static_method = False
+        self._is_property = False
+        if isinstance(original_function, ClassMethodType):
+            self._is_class_method = True
+            self._base_function = original_function.__func__
+        elif isinstance(original_function, PropertyType):
+            self._is_property = True
+            self._base_function = original_function.fget
+        else:
+            # A static method is retrieved as a plain function, so the attribute itself has to be checked.
+            self._is_static_method = inspect.isclass(target_object) and isinstance(inspect.getattr_static(target_object, target_function_name, None), staticmethod)
+            self._base_function = original_function
+
+    @classmethod
+    def inject(cls, mod_identity: CommonModIdentity, target_object: Any, target_function_name: str, new_function: Callable[..., Any], handle_exceptions: bool) -> None:
+        # A new chain is started when the attribute was replaced since the chain was installed, so the replacement is kept as the original.
+        key = (id(target_object), target_function_name)
+        original_function = getattr(target_object, target_function_name)
+        injection_chain = cls._INJECTION_CHAINS.get(key, None)
+        if injection_chain is None or not injection_chain._is_installed(original_function):
+            injection_chain = cls(target_object, target_function_name, original_function)
+            cls._INJECTION_CHAINS[key] = injection_chain
+        injection_chain._injections.append((mod_identity, new_function, handle_exceptions))
+        setattr(target_object, target_function_name, injection_chain._build())
+
+    def _is_installed(self, current_function: Any) -> bool:
+        installed_function = self._installed_function
+        if installed_function is None:
+            return False
+        return current_function is installed_function or getattr(current_function, '__func__', None) is installed_function or current_function is self._installed_attribute
+
+    def _build(self) -> Any:
+        # noinspection PyBroadException
+        try:
+            continuation = self._base_function
+            last_index = len(self._injections) - 1
+            for (index, (mod_identity, new_function, handle_exceptions)) in enumerate(self._injections):
+                continuation = self._create_continuation(mod_identity, new_function, continuation, handle_exceptions, index == last_index)
+            update_wrapper(continuation, self._original_function)
+            self._installed_function = continuation
+            if self._is_class_method:
+                self._installed_attribute = classmethod(continuation)
+            elif self._is_static_method:
+                self._installed_attribute = staticmethod(continuation)
+            elif self._is_property:
+                self._installed_attribute = property(continuation)
+            else:
+                self._installed_attribute = continuation
+            return self._installed_attribute
+        except:
+            def _func(*_, **__) -> Any:
+                pass
+            return _func
+
+    def _create_continuation(self, mod_identity: CommonModIdentity, new_function: Callable[..., Any], original: Callable[..., Any], handle_exceptions: bool, is_outermost: bool) -> Callable[..., Any]:
+        target_object = self._target_object
+        if self._is_class_method:
+            # Class method injections receive an original that is already bound to the class they were invoked on.
+            if handle_exceptions:
+                def _continuation(cls, *args, **kwargs) -> Any:
+                    try:
+                        return new_function(MethodType(original, cls), cls, *args, **kwargs)
+                    except Exception as ex:
+                        _log_injection_exception(mod_identity, new_function, target_object, ex)
+                        return original(cls, *args, **kwargs)
+                return _continuation
+
+            def _continuation(cls, *args, **kwargs) -> Any:
+                return new_function(MethodType(original, cls), cls, *args, **kwargs)
+            return _continuation
+
+        if handle_exceptions:
+            def _continuation(*args, **kwargs) -> Any:
+                try:
+                    return new_function(original, *args, **kwargs)
+                except Exception as ex:
+                    _log_injection_exception(mod_identity, new_function, target_object, ex)
+                    return original(*args, **kwargs)
+            return _continuation
+
+        if not is_outermost:
+            # Nothing to handle, so the injection is invoked directly without a frame of its own.
+            return partial(new_function, original)
+
+        # The installed function has to be a function, so it is bound to the instance it is retrieved from.
+        def _continuation(*args, **kwargs) -> Any:
+            return new_function(original, *args, **kwargs)
+        return _continuation
+
+
 class CommonInjectionUtils:
     """Utilities to inject custom functionality into functions.
 
@@ -118,166 +232,8 @@ class CommonInjectionUtils:
                 return wrap_function
             return _injected
 
-        if handle_exceptions:
-            def _function_wrapper(original_function, new_function: Callable[..., Any]) -> Any:
-                # noinspection PyBroadException
-                try:
-                    if isinstance(original_function, ClassMethodType):
-                        original_function_func = original_function.__func__
-
-                        # noinspection PyDecorator
-                        @wraps(original_function)
-                        def _wrapped_class_function(cls, *args, **kwargs) -> Any:
-                            try:
-                                # noinspection PyMissingTypeHints
-                                def _do_original(*_, **__):
-                                    return original_function_func(cls, *_, **__)
-
-                                return new_function(_do_original, cls, *args, **kwargs)
-                            except Exception as ex:
-                                # noinspection PyBroadException
-                                try:
-                                    from sims4communitylib.exceptions.common_exceptions_handler import \
-                                        CommonExceptionHandler
-                                    CommonExceptionHandler.log_exception(mod_identity, 'Error occurred while injecting into function \'{}\' of class \'{}\''.format(new_function.__name__, target_object.__name__), exception=ex)
-                                except Exception:
-                                    pass
-                                return original_function_func(cls, *args, **kwargs)
-                        return classmethod(_wrapped_class_function)
-
-                    if isinstance(original_function, SelfMethodType):
-                        @wraps(original_function)
-                        def _wrapped_self_function(self, *args, **kwargs) -> Any:
-                            try:
-                                return new_function(original_function, self, *args, **kwargs)
-                            except Exception as ex:
-                                # noinspection PyBroadException
-                                try:
-                                    from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
-                                    CommonExceptionHandler.log_exception(mod_identity, 'Error occurred while injecting into function \'{}\' of class \'{}\''.format(new_function.__name__, target_object.__name__), exception=ex)
-                                except Exception:
-                                    pass
-                                return original_function(self, *args, **kwargs)
-
-                        return _wrapped_self_function
-
-                    if isinstance(original_function, PropertyType):
-                        # noinspection PyTypeChecker
-                        @wraps(original_function)
-                        def _wrapped_property_function(self, *args, **kwargs) -> Any:
-                            try:
-                                return new_function(original_function.fget, self, *args, **kwargs)
-                            except Exception as ex:
-                                # noinspection PyBroadException
-                                try:
-                                    from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
-                                    CommonExceptionHandler.log_exception(mod_identity, 'Error occurred while injecting into function \'{}\' of class \'{}\''.format(new_function.__name__, target_object.__name__), exception=ex)
-                                except Exception:
-                                    pass
-                                return original_function(self, *args, **kwargs)
-
-                        return property(_wrapped_property_function)
-
-                    if isinstance(original_function, StaticMethodType):
-                        original_function_func = original_function.__func__
-
-                        # noinspection PyDecorator
-                        @wraps(original_function)
-                        def _wrapped_static_function(*args, **kwargs) -> Any:
-                            try:
-                                # noinspection PyMissingTypeHints
-                                def _do_original(*_, **__):
-                                    return original_function_func(*_, **__)
-
-                                return new_function(_do_original, *args, **kwargs)
-                            except Exception as ex:
-                                # noinspection PyBroadException
-                                try:
-                                    from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
-                                    CommonExceptionHandler.log_exception(mod_identity, 'Error occurred while injecting into function \'{}\' of class \'{}\''.format(new_function.__name__, target_object.__name__), exception=ex)
-                                except Exception:
-                                    pass
-                                return original_function_func(*args, **kwargs)
-
-                        return staticmethod(_wrapped_static_function)
-
-                    @wraps(original_function)
-                    def _wrapped_other_function(*args, **kwargs) -> Any:
-                        try:
-                            return new_function(original_function, *args, **kwargs)
-                        except Exception as ex:
-                            # noinspection PyBroadException
-                            try:
-                                from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
-                                CommonExceptionHandler.log_exception(mod_identity, 'Error occurred while injecting into function \'{}\' of class \'{}\''.format(new_function.__name__, target_object.__name__), exception=ex)
-                            except Exception:
-                                pass
-                            return original_function(*args, **kwargs)
-
-                    return _wrapped_other_function
-                except:
-                    def _func(*_, **__) -> Any:
-                        pass
-                    return _func
-        else:
-            def _function_wrapper(original_function, new_function: Callable[..., Any]) -> Any:
-                # noinspection PyBroadException
-                try:
-                    if isinstance(original_function, ClassMethodType):
-                        original_function_func = original_function.__func__
-
-                        # noinspection PyDecorator
-                        @wraps(original_function)
-                        def _wrapped_class_function(cls, *args, **kwargs) -> Any:
-                            # noinspection PyMissingTypeHints
-                            def _do_original(*_, **__):
-                                return original_function_func(cls, *_, **__)
-
-                            return new_function(_do_original, cls, *args, **kwargs)
-                        return classmethod(_wrapped_class_function)
-
-                    if isinstance(original_function, SelfMethodType):
-                        @wraps(original_function)
-                        def _wrapped_self_function(self, *args, **kwargs) -> Any:
-                            return new_function(original_function, self, *args, **kwargs)
-
-                        return _wrapped_self_function
-
-                    if isinstance(original_function, PropertyType):
-                        # noinspection PyTypeChecker
-                        @wraps(original_function)
-                        def _wrapped_property_function(self, *args, **kwargs) -> Any:
-                            return new_function(original_function.fget, self, *args, **kwargs)
-
-                        return property(_wrapped_property_function)
-
-                    if isinstance(original_function, StaticMethodType):
-                        original_function_func = original_function.__func__
-
-                        # noinspection PyDecorator
-                        @wraps(original_function)
-                        def _wrapped_static_function(*args, **kwargs) -> Any:
-                            # noinspection PyMissingTypeHints
-                            def _do_original(*_, **__):
-                                return original_function_func(*_, **__)
-
-                            return new_function(_do_original, *args, **kwargs)
-
-                        return staticmethod(_wrapped_static_function)
-
-                    @wraps(original_function)
-                    def _wrapped_other_function(*args, **kwargs) -> Any:
-                        return new_function(original_function, *args, **kwargs)
-
-                    return _wrapped_other_function
-                except:
-                    def _func(*_, **__) -> Any:
-                        pass
-                    return _func
-
         def _injected(wrap_function) -> Any:
-            original_function = getattr(target_object, str(target_function_name))
-            setattr(target_object, str(target_function_name), _function_wrapper(original_function, wrap_function))
+            _CommonInjectionChain.inject(mod_identity, target_object, str(target_function_name), wrap_function, handle_exceptions)
             return wrap_function
         return _injected
 
@@ -7,32 +7,42 @@ Copyright (c) COLONOLNUTTY
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from json import JSONEncoder, JSONDecoder
 from os import DirEntry
-from typing import Union, Any, Iterator, Dict, Type, Callable
+from typing import Union, Any, Iterator, Dict, Type, Callable, List, Tuple
 
-from sims4communitylib.classes.serialization.common_serializable import CommonSerializable
-from sims4communitylib.utils.common_io_utils import CommonIOUtils
+from sims4communitylib.classes.serialization.common_serializable_json_encoder import CommonSerializableJSONEncoder
 
 
 class CommonJSONIOUtils:
     """Utilities for reading/writing JSON data to and from files."""
+    _ENCODERS: Dict[Tuple[Type[JSONEncoder], bool], JSONEncoder] = dict()
+    # Containers nested deeper than this are encoded all at once when streaming.
+    _STREAMED_CONTAINER_DEPTH = 2
+
     @staticmethod
-    def write_to_file(file_path: str, obj: Any, buffering: int=1, encoding: str='utf-8', encoder_class: Type[JSONEncoder]=None) -> bool:
-        """write_to_file(file_path, obj, buffering=1, encoding='utf-8', encoder_class=None)
+    def write_to_file(file_path: str, obj: Any, buffering: int=1, encoding: str='utf-8', encoder_class: Type[JSONEncoder]=None, stream: bool=False, compact: bool=False) -> bool:
+        """write_to_file(file_path, obj, buffering=1, encoding='utf-8', encoder_class=None, stream=False, compact=False)
 
         Serialize an object to a file as JSON.
 
+        .. note:: The object is written to a temporary file first, which then replaces the file, so an interrupted write never leaves a partially written file behind.
+
         :param file_path: The file to write to.
         :type file_path: str
         :param obj: The object to write as JSON.
         :type obj: Any
-        :param buffering: See the built-in python :func:`~open` function documentation for more details.
+        :param buffering: See the built-in python :func:`~open` function documentation for more details. When streaming, line buffering (1) is replaced with the default buffering, since it would write each line separately.
         :type buffering: int, optional
         :param encoding: See the built-in python :func:`~open` function documentation for more details.
         :type encoding: str, optional
         :param encoder_class: Specify a custom JSON encoder class to use in place of the default serialization. Default is None.
         :type encoder_class: Type[JSONEncoder], optional
+        :param stream: If True, the object is written to the file while it is encoded instead of being encoded as a whole first, which uses less memory for large objects. Default is False.
+        :type stream: bool, optional
+        :param compact: If True, the JSON is written without indentation or whitespace, which is smaller and faster to write. If False, the JSON is indented to be readable. Default is False.
+        :type compact: bool, optional
         :return: True if successful. False if not.
         :rtype: bool
         """
@@ -41,25 +51,72 @@ class CommonJSONIOUtils:
         dir_name = os.path.dirname(file_path)
         temp_file_name = 'temp' + os.path.basename(file_path)
         temp_file_path = os.path.join(dir_name, temp_file_name)
-        if encoder_class is not None:
-            json_obj = json.dumps(obj, cls=encoder_class, indent=2)
+        encoder = CommonJSONIOUtils._get_encoder(encoder_class or CommonSerializableJSONEncoder, compact)
+        if stream:
+            if buffering == 1:
+                buffering = -1
+            with open(temp_file_path, mode='w', buffering=buffering, encoding=encoding) as file:
+                write = file.write
+                if compact:
+                    for chunk in CommonJSONIOUtils._iterencode_compact(encoder, obj, CommonJSONIOUtils._STREAMED_CONTAINER_DEPTH):
+                        write(chunk)
+                else:
+                    for chunk in encoder.iterencode(obj):
+                        write(chunk)
+                file.flush()
         else:
-            json_obj = json.dumps(obj, default=lambda o: o.serialize() if isinstance(o, CommonSerializable) else o.__dict__ if hasattr(o, '__dict__') else o, indent=2)
-
-        with open(temp_file_path, mode='w+', buffering=buffering, encoding=encoding) as file:
-            file.write(json_obj)
-            file.flush()
+            json_obj = encoder.encode(obj)
+            with open(temp_file_path, mode='w+', buffering=buffering, encoding=encoding) as file:
+                file.write(json_obj)
+                file.flush()
 
         # File is empty.
         if os.stat(temp_file_path).st_size != 0:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            os.rename(temp_file_path, file_path)
+            os.replace(temp_file_path, file_path)
         else:
             os.remove(temp_file_path)
             raise Exception(f'Failed to write file {file_path}, it wrote empty for some reason!')
         return True
 
+    @staticmethod
+    def _get_encoder(encoder_class: Type[JSONEncoder], compact: bool) -> JSONEncoder:
+        encoder_key = (encoder_class, compact)
+        encoder = CommonJSONIOUtils._ENCODERS.get(encoder_key, None)
+        if encoder is None:
+            if compact:
+                encoder = encoder_class(separators=(',', ':'))
+            else:
+                encoder = encoder_class(indent=2)
+            CommonJSONIOUtils._ENCODERS[encoder_key] = encoder
+        return encoder
+
+    @staticmethod
+    def _iterencode_compact(encoder: JSONEncoder, obj: Any, depth: int) -> Iterator[str]:
+        # Without indentation, each value is encoded all at once by the much faster C encoder, so only the outer containers are split into values.
+        if depth > 0 and isinstance(obj, dict) and all(isinstance(key, str) for key in obj.keys()):
+            yield '{'
+            is_first = True
+            for (key, value) in obj.items():
+                if is_first:
+                    is_first = False
+                    yield f'{encoder.encode(key)}:'
+                else:
+                    yield f',{encoder.encode(key)}:'
+                yield from CommonJSONIOUtils._iterencode_compact(encoder, value, depth - 1)
+            yield '}'
+        elif depth > 0 and isinstance(obj, (list, tuple)):
+            yield '['
+            is_first = True
+            for value in obj:
+                if is_first:
+                    is_first = False
+                else:
+                    yield ','
+                yield from CommonJSONIOUtils._iterencode_compact(encoder, value, depth - 1)
+            yield ']'
+        else:
+            yield encoder.encode(obj)
+
     @staticmethod
     def load_from_file(file_path: str, buffering: int=1, encoding: str='utf-8', decoder_class: Type[JSONDecoder]=None, object_hook: Callable[[Dict[str, Any]], Any]=None) -> Union[Any, None]:
         """load_from_file(file_path, buffering=1, encoding='utf-8', decoder_class=None, object_hook=None)
@@ -68,7 +125,7 @@ class CommonJSONIOUtils:
 
         :param file_path: The file to read from.
         :type: file_path: str
-        :param buffering: See the built-in python :func:`~open` function documentation for more details.
+        :param buffering: See the built-in python :func:`~open` function documentation for more details. The file is read as bytes, so line buffering (1) is replaced with the default buffering.
         :type buffering: int, optional
         :param encoding: See the built-in python :func:`~open` function documentation for more details.
         :type encoding: str, optional
@@ -80,9 +137,13 @@ class CommonJSONIOUtils:
         :rtype: Union[Any, None]
         """
         try:
-            file_contents: str = CommonIOUtils.load_from_file(file_path, buffering=buffering, encoding=encoding)
-            if file_contents is None:
+            if not os.path.isfile(file_path):
                 return None
+            if buffering == 1:
+                buffering = -1
+            with open(file_path, mode='rb', buffering=buffering) as file:
+                # Decoded right away, so the bytes are released before the contents are deserialized.
+                file_contents = file.read().decode(encoding)
             if len(file_contents) == 0:
                 return None
             return json.loads(file_contents, cls=decoder_class, object_hook=object_hook)
@@ -97,7 +158,8 @@ class CommonJSONIOUtils:
         encoding: str='utf-8',
         decoder_class: Type[JSONDecoder]=None,
         object_hook: Callable[[Dict[str, Any]], Any]=None,
-        on_file_read_failure: Callable[[str, Exception], bool]=lambda *_, **__: True
+        on_file_read_failure: Callable[[str, Exception], bool]=lambda *_, **__: True,
+        max_thread_count: int=4
     ) -> Union[Dict[str, Any], None]:
         """load_from_folder(\
             folder_path,\
@@ -106,11 +168,16 @@ class CommonJSONIOUtils:
             encoding='utf-8',\
             decoder_class=None,\
             object_hook=None,\
-            on_file_read_failure=lambda \*_, \*\*__: True\
+            on_file_read_failure=lambda \*_, \*\*__: True,\
+            max_thread_count=4\
         )
 
         Deserialize objects from a folder containing JSON files.
 
+        .. note:: Files are read and deserialized on background threads, the results are organized in order of file name.
+
+        .. warning:: The decoder_class and object_hook are used on the background threads, they should not interact with the game.
+
         :param folder_path: The folder to read from.
         :type: folder_path: str
         :param skip_file_names: A collection of file names to ignore. Default is an empty collection.
@@ -125,6 +192,8 @@ class CommonJSONIOUtils:
         :type object_hook: Callable[[Dict[str, Any]], Any], optional
         :param on_file_read_failure: When a file fails to read due to an exception, this callback will be called. If the callback returns False, no more files will be read. If the callback returns True, the rest of the files will continue to be read. Default is a callback that returns True.
         :type on_file_read_failure: Callable[[str, Exception], bool], optional
+        :param max_thread_count: The maximum number of files to read at the same time. If 1 or less, files are read one after another on the calling thread. Default is 4.
+        :type max_thread_count: int, optional
         :return: A dictionary of the contents of each file within the specified folder organized by file name or None if the folder path does not exist.
         :rtype: Union[Dict[str, Any], None]
         """
@@ -138,18 +207,44 @@ class CommonJSONIOUtils:
             '.DS_Store',
             'desktop.ini'
         )
-        data = dict()
+        entries: List[DirEntry] = list()
         for entry in os.scandir(folder_path):
             entry: DirEntry = entry
             if not entry.is_file() or entry.name is None or entry.name in skip_file_names:
                 continue
-            try:
-                file_contents: str = CommonJSONIOUtils.load_from_file(entry.path, buffering=buffering, encoding=encoding, decoder_class=decoder_class, object_hook=object_hook)
-            except Exception as ex:
-                if not on_file_read_failure(entry.path, ex):
-                    break
-                continue
-            if file_contents is None:
-                continue
-            data[entry.name] = file_contents
+            entries.append(entry)
+        # The order the system lists files in differs between systems, so the files are sorted the way Windows lists them.
+        entries.sort(key=lambda _entry: (_entry.name.upper(), _entry.name))
+
+        def _load_from_file(file_path: str) -> Union[Any, None]:
+            return CommonJSONIOUtils.load_from_file(file_path, buffering=buffering, encoding=encoding, decoder_class=decoder_class, object_hook=object_hook)
+
+        data = dict()
+        if max_thread_count <= 1 or len(entries) <= 1:
+            for entry in entries:
+                try:
+                    file_contents = _load_from_file(entry.path)
+                except Exception as ex:
+                    if not on_file_read_failure(entry.path, ex):
+                        break
+                    continue
+                if file_contents is None:
+                    continue
+                data[entry.name] = file_contents
+            return data
+
+        with ThreadPoolExecutor(max_workers=min(max_thread_count, len(entries))) as executor:
+            futures = [executor.submit(_load_from_file, entry.path) for entry in entries]
+            for (entry, future) in zip(entries, futures):
+                try:
+                    file_contents = future.result()
+                except Exception as ex:
+                    if not on_file_read_failure(entry.path, ex):
+                        for remaining_future in futures:
+                            remaining_future.cancel()
+                        break
+                    continue
+                if file_contents is None:
+                    continue
+                data[entry.name] = file_contents
         return data
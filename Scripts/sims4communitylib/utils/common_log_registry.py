@@ -14,7 +14,7 @@ from sims4communitylib.exceptions.common_stacktrace_utils import CommonStacktrac
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
 from sims4communitylib.modinfo import ModInfo
 from sims4communitylib.services.common_service import CommonService
-from sims4communitylib.utils.common_io_utils import CommonIOUtils
+from sims4communitylib.utils.common_environment import CommonEnvironment
 from sims4communitylib.utils.common_log_utils import CommonLogUtils
 
 _log = None
@@ -48,6 +48,8 @@ class CommonLog:
         from sims4communitylib.utils.misc.common_mod_identity_utils import CommonModIdentityUtils
         self._mod_name = CommonModIdentityUtils.determine_mod_name_from_identifier(mod_identifier)
         self._custom_file_path = custom_file_path
+        self._messages_file_path: Union[str, None] = None
+        self._exceptions_file_path: Union[str, None] = None
         self._enabled_message_types = tuple()
         self._should_log_extra_sim_details = False
 
@@ -124,15 +126,7 @@ class CommonLog:
         :type kwargs: Any
         """
         if self.is_enabled(message_type):
-            if update_tokens:
-                args = self._update_args(*args)
-                kwargs = self._update_kwargs(**kwargs)
-            if args and kwargs:
-                self._log_message(message_type, '{}, {}'.format(pformat(args), pformat(kwargs)))
-            elif args:
-                self._log_message(message_type, '{}'.format(pformat(args)))
-            else:
-                self._log_message(message_type, '{}'.format(pformat(kwargs)))
+            self._log_message(message_type, self._format_message(None, args, kwargs, update_tokens))
 
     def format_with_message(
         self,
@@ -158,17 +152,7 @@ class CommonLog:
         :type kwargs: Any
         """
         if self.is_enabled(message_type):
-            if update_tokens:
-                args = self._update_args(*args)
-                kwargs = self._update_kwargs(**kwargs)
-            if args and kwargs:
-                self._log_message(message_type, '{} {}, {}'.format(message, pformat(args), pformat(kwargs)))
-            elif args:
-                self._log_message(message_type, '{} {}'.format(message, pformat(args)))
-            elif kwargs:
-                self._log_message(message_type, '{} {}'.format(message, pformat(kwargs)))
-            else:
-                self._log_message(message_type, message)
+            self._log_message(message_type, self._format_message(message, args, kwargs, update_tokens))
 
     def warn(self, message: str):
         """warn(message)
@@ -235,7 +219,6 @@ class CommonLog:
         :type throw: bool, optional
         """
         if throw:
-            stack_trace = stack_trace or CommonStacktraceUtil.get_full_stack_trace()
             self._log_error(message, exception=exception, stack_trace=stack_trace)
         self._log_message(message_type, message)
         if exception is not None:
@@ -267,16 +250,7 @@ class CommonLog:
         :param kwargs: Keyword Arguments to format into the message.
         :type kwargs: Any
         """
-        if update_tokens:
-            args = self._update_args(*args)
-            kwargs = self._update_kwargs(**kwargs)
-        stack_trace = stack_trace or CommonStacktraceUtil.get_full_stack_trace()
-        if args and kwargs:
-            self.error('{}, {}'.format(pformat(args), pformat(kwargs)), exception=exception, throw=throw, stack_trace=stack_trace)
-        elif args:
-            self.error('{}'.format(pformat(args)), exception=exception, throw=throw, stack_trace=stack_trace)
-        else:
-            self.error('{}'.format(pformat(kwargs)), exception=exception, throw=throw, stack_trace=stack_trace)
+        self.error(self._format_message(None, args, kwargs, update_tokens), exception=exception, throw=throw, stack_trace=stack_trace)
 
     def format_error_with_message(
         self,
@@ -315,18 +289,7 @@ class CommonLog:
         :param kwargs: Keyword Arguments to format into the message.
         :type kwargs: Any
         """
-        if update_tokens:
-            args = self._update_args(*args)
-            kwargs = self._update_kwargs(**kwargs)
-        stack_trace = stack_trace or CommonStacktraceUtil.get_full_stack_trace()
-        if args and kwargs:
-            self.error('{} {}, {}'.format(message, pformat(args), pformat(kwargs)), exception=exception, throw=throw, stack_trace=stack_trace)
-        elif args:
-            self.error('{} {}'.format(message, pformat(args)), exception=exception, throw=throw, stack_trace=stack_trace)
-        elif kwargs:
-            self.error('{} {}'.format(message, pformat(kwargs)), exception=exception, throw=throw, stack_trace=stack_trace)
-        else:
-            self.error(message, exception=exception, throw=throw, stack_trace=stack_trace)
+        self.error(self._format_message(message, args, kwargs, update_tokens), exception=exception, throw=throw, stack_trace=stack_trace)
 
     def log_stack(self) -> None:
         """log_stack()
@@ -427,7 +390,9 @@ class CommonLog:
         :return: The file path messages are logged to.
         :rtype: str
         """
-        return CommonLogUtils.get_message_file_path(self.mod_name, custom_file_path=self._custom_file_path)
+        if self._messages_file_path is None:
+            self._messages_file_path = CommonLogUtils.get_message_file_path(self.mod_name, custom_file_path=self._custom_file_path)
+        return self._messages_file_path
 
     @property
     def exceptions_file_path(self) -> str:
@@ -436,7 +401,17 @@ class CommonLog:
         :return: The file path exceptions are logged to.
         :rtype: str
         """
-        return CommonLogUtils.get_exceptions_file_path(self.mod_name, custom_file_path=self._custom_file_path)
+        if self._exceptions_file_path is None:
+            self._exceptions_file_path = CommonLogUtils.get_exceptions_file_path(self.mod_name, custom_file_path=self._custom_file_path)
+        return self._exceptions_file_path
+
+    def reset_file_paths(self) -> None:
+        """reset_file_paths()
+
+        Resolve the file paths messages and exceptions are logged to again the next time something is logged.
+        """
+        self._messages_file_path = None
+        self._exceptions_file_path = None
 
     def is_enabled(self, message_type: CommonMessageType) -> bool:
         """is_enabled(message_type)
@@ -456,10 +431,8 @@ class CommonLog:
         current_date_time = CommonRealDateUtils.get_current_date_string()
         new_message = '{} {}: [{}]: {}\n'.format(current_date_time, getattr(message_type, 'name', str(message_type)), self.name, message)
         try:
-            from sims4communitylib.utils.common_io_utils import CommonIOUtils
-            file_path = self.messages_file_path
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            CommonIOUtils.write_to_file(file_path, new_message, ignore_errors=True)
+            from sims4communitylib.logging.common_log_file_writer import CommonLogFileWriter
+            CommonLogFileWriter().write(self.messages_file_path, new_message)
         except Exception as ex:
             CommonExceptionHandler.log_exception(self.mod_name, 'Error occurred while attempting to log message: {}'.format(pformat(message)), exception=ex, custom_file_path=self._custom_file_path)
 
@@ -467,75 +440,63 @@ class CommonLog:
         from sims4communitylib.utils.common_date_utils import CommonRealDateUtils
         from sims4communitylib.exceptions.common_exceptions_handler import CommonExceptionHandler
         try:
+            from sims4communitylib.exceptions.common_exception_coalescer import CommonExceptionCoalescer
+            # The stack is only formatted when the error is logged in full.
+            if CommonExceptionCoalescer().try_coalesce(self.mod_name, CommonStacktraceUtil.get_stack_signature(exception=exception), message if exception is None else '{} -> {}: {}'.format(message, type(exception).__name__, exception), custom_file_path=self._custom_file_path):
+                return
             exceptions = stack_trace or CommonStacktraceUtil.get_full_stack_trace()
             if exception is not None:
                 stack_trace_message = '{}{} -> {}: {}\n'.format(''.join(exceptions), message, type(exception).__name__, exception)
             else:
                 stack_trace_message = '{}{}\n'.format(''.join(exceptions), message)
+            from sims4communitylib.logging.common_log_file_writer import CommonLogFileWriter
             file_path = self.exceptions_file_path
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
             exception_traceback_text = '[{}] {} {}\n'.format(self.mod_name, CommonRealDateUtils.get_current_date_string(), stack_trace_message)
-            result = CommonIOUtils.write_to_file(file_path, exception_traceback_text, ignore_errors=True)
+            # Errors are written before returning, so a crash right after cannot lose them.
+            CommonLogFileWriter().flush(file_path=self.messages_file_path)
+            result = CommonLogFileWriter().write(file_path, exception_traceback_text, flush_immediately=True)
             if result:
                 CommonExceptionHandler._notify_exception_occurred(file_path, mod_identifier=self.mod_name)
         except Exception as ex:
             CommonExceptionHandler.log_exception(self.mod_name, 'Error occurred while attempting to log message: {}'.format(pformat(message)), exception=ex, custom_file_path=self._custom_file_path)
 
+    def _format_message(self, message: Union[str, None], args: Tuple[Any, ...], kwargs: Dict[str, Any], update_tokens: bool) -> str:
+        # Only invoked once a message is known to be written, so no formatting is done for disabled logs.
+        if update_tokens:
+            args = self._update_args(*args)
+            kwargs = self._update_kwargs(**kwargs)
+        if args and kwargs:
+            formatted_arguments = '{}, {}'.format(pformat(args), pformat(kwargs))
+        elif args:
+            formatted_arguments = pformat(args)
+        elif kwargs or message is None:
+            formatted_arguments = pformat(kwargs)
+        else:
+            return message
+        if message is None:
+            return formatted_arguments
+        return '{} {}'.format(message, formatted_arguments)
+
     def _update_args(self, *args: Any) -> Tuple[Any]:
         if not args:
             return args
-        from sims4communitylib.utils.common_type_utils import CommonTypeUtils
-        from sims4communitylib.utils.sims.common_sim_name_utils import CommonSimNameUtils
-        from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
+        from sims4communitylib.logging.common_log_sim_descriptor_cache import CommonLogSimDescriptorCache
+        descriptor_cache = CommonLogSimDescriptorCache()
         new_args: List[Any] = list()
         for arg in args:
-            if CommonTypeUtils.is_sim_or_sim_info(arg) or CommonTypeUtils.is_sim_info_base_wrapper(arg):
-                obj_type_acronym = 'Unknown'
-                if CommonTypeUtils.is_sim_info(arg):
-                    obj_type_acronym = 'SI'
-                elif CommonTypeUtils.is_sim_instance(arg):
-                    obj_type_acronym = 'S'
-                elif CommonTypeUtils.is_sim_info_base_wrapper(arg):
-                    obj_type_acronym = 'SIBW'
-                if self._should_log_extra_sim_details:
-                    from sims4communitylib.utils.sims.common_sim_type_utils import CommonSimTypeUtils
-                    sim_info = CommonSimUtils.get_sim_info(arg)
-                    sim_types = tuple(CommonSimTypeUtils.get_all_sim_types_gen(sim_info, combine_teen_young_adult_and_elder_age=False, combine_child_dog_types=False))
-                    current_sim_type = CommonSimTypeUtils.determine_sim_type(sim_info, combine_teen_young_adult_and_elder_age=False, combine_child_dog_types=False, use_current_occult_type=True)
-                    new_args.append('{} ({}, ({}), C:{}) [{}]'.format(CommonSimNameUtils.get_full_name(arg), str(CommonSimUtils.get_sim_id(arg)), ', '.join([sim_type.name for sim_type in sim_types]), current_sim_type.name, obj_type_acronym))
-                else:
-                    new_args.append('{} ({}) [{}]'.format(CommonSimNameUtils.get_full_name(arg), str(CommonSimUtils.get_sim_id(arg)), obj_type_acronym))
-            else:
-                new_args.append(arg)
+            descriptor = descriptor_cache.get_descriptor(arg, include_sim_types=self._should_log_extra_sim_details)
+            new_args.append(arg if descriptor is None else descriptor)
         return tuple(new_args)
 
     def _update_kwargs(self, **kwargs: Any) -> Dict[str, Any]:
         if not kwargs:
             return kwargs
+        from sims4communitylib.logging.common_log_sim_descriptor_cache import CommonLogSimDescriptorCache
+        descriptor_cache = CommonLogSimDescriptorCache()
         new_kwargs: Dict[str, Any] = dict()
-        from sims4communitylib.utils.common_type_utils import CommonTypeUtils
-        from sims4communitylib.utils.sims.common_sim_name_utils import CommonSimNameUtils
-        from sims4communitylib.utils.sims.common_sim_utils import CommonSimUtils
         for (key, val) in kwargs.items():
-            if CommonTypeUtils.is_sim_or_sim_info(val) or CommonTypeUtils.is_sim_info_base_wrapper(val):
-                obj_type_acronym = 'UnknownType'
-                if CommonTypeUtils.is_sim_info(val):
-                    obj_type_acronym = 'SI'
-                elif CommonTypeUtils.is_sim_instance(val):
-                    obj_type_acronym = 'S'
-                elif CommonTypeUtils.is_sim_info_base_wrapper(val):
-                    obj_type_acronym = 'SIBW'
-
-                if self._should_log_extra_sim_details:
-                    from sims4communitylib.utils.sims.common_sim_type_utils import CommonSimTypeUtils
-                    sim_info = CommonSimUtils.get_sim_info(val)
-                    sim_types = tuple(CommonSimTypeUtils.get_all_sim_types_gen(sim_info, combine_teen_young_adult_and_elder_age=False, combine_child_dog_types=False))
-                    current_sim_type = CommonSimTypeUtils.determine_sim_type(sim_info, combine_teen_young_adult_and_elder_age=False, combine_child_dog_types=False, use_current_occult_type=True)
-                    new_kwargs[key] = '{} ({}, ({}), C:{}) [{}]'.format(CommonSimNameUtils.get_full_name(val), str(CommonSimUtils.get_sim_id(val)), ', '.join([sim_type.name for sim_type in sim_types]), current_sim_type.name, obj_type_acronym)
-                else:
-                    new_kwargs[key] = '{} ({}) [{}]'.format(CommonSimNameUtils.get_full_name(val), str(CommonSimUtils.get_sim_id(val)), obj_type_acronym)
-            else:
-                new_kwargs[key] = val
+            descriptor = descriptor_cache.get_descriptor(val, include_sim_types=self._should_log_extra_sim_details)
+            new_kwargs[key] = val if descriptor is None else descriptor
         return new_kwargs
 
 
@@ -669,6 +630,8 @@ class CommonLogRegistry(CommonService):
                     CommonIOUtils.delete_directory(file_to_delete, ignore_errors=True)
             except:
                 continue
+        # The deleted folders need to be created again.
+        CommonEnvironment.reload()
 
     # noinspection PyUnusedLocal
     def log_exists(self, log_name: str, mod_identifier: Union[str, CommonModIdentity] = None) -> bool:
@@ -813,6 +776,17 @@ class CommonLogRegistry(CommonService):
                 self._registered_logs[mod_name][log_name].disable()
         return True
 
+    def reset_log_file_paths(self) -> None:
+        """reset_log_file_paths()
+
+        Resolve the file paths of all registered logs again the next time they log something, such as after the folder logs are written to has changed.
+        """
+        if self._registered_logs is None:
+            return
+        for log_mod_name in self._registered_logs:
+            for log_name in self._registered_logs[log_mod_name]:
+                self._registered_logs[log_mod_name][log_name].reset_file_paths()
+
 
 # noinspection PyRedeclaration
 _log = CommonLogRegistry().register_log(ModInfo.get_identity(), 's4cl_log_registry')
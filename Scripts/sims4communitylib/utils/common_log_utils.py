@@ -9,11 +9,14 @@ import os
 from typing import Union
 
 from sims4communitylib.mod_support.mod_identity import CommonModIdentity
+from sims4communitylib.utils.common_environment import CommonEnvironment
 
 
 class CommonLogUtils:
     """Utilities for retrieving the paths used for logging.
 
+    .. note:: The paths are resolved once, see :class:`.CommonEnvironment` for more details.
+
     """
 
     @staticmethod
@@ -102,21 +105,7 @@ class CommonLogUtils:
         :return: The file path to 'Documents\Electronic Arts\The Sims 4' folder.
         :rtype: str
         """
-        # return os.environ['TS4_MODS_FOLDER']
-        documents_path = os.path.dirname(CommonLogUtils.get_mods_location_path())
-        if os.path.exists(documents_path):
-            return documents_path
-        from sims4communitylib.modinfo import ModInfo
-        root_file = os.path.normpath(os.path.dirname(os.path.realpath(ModInfo.get_identity().file_path))).replace(os.sep, '/')
-        root_file_split = root_file.split('/')
-        if 'Mods' not in root_file_split:
-            return ''
-        file_path = ''
-        # noinspection PyTypeChecker
-        exit_index = len(root_file_split) - root_file_split.index('Mods')
-        for index in range(0, len(root_file_split) - exit_index):
-            file_path = os.path.join(file_path + os.sep, str(root_file_split[index]))
-        return file_path
+        return CommonEnvironment.get().sims_documents_location_path
 
     @staticmethod
     def get_mods_location_path() -> str:
@@ -127,9 +116,7 @@ class CommonLogUtils:
         :return: The file path to 'Documents\Electronic Arts\The Sims 4\Mods' folder.
         :rtype: str
         """
-        current_file_path = os.path.dirname(os.path.abspath(__file__))
-        mods_folder = os.path.join(current_file_path.partition(f"{os.sep}Mods{os.sep}")[0], 'Mods')
-        return mods_folder
+        return CommonEnvironment.get().mods_location_path
 
     @staticmethod
     def get_mod_logs_location_path() -> str:
@@ -140,10 +127,7 @@ class CommonLogUtils:
         :return: The file path to 'Documents\Electronic Arts\The Sims 4\mod_logs' folder.
         :rtype: str
         """
-        sims_documents_location = CommonLogUtils.get_sims_documents_location_path()
-        if sims_documents_location == '':
-            return ''
-        return os.path.join(sims_documents_location, 'mod_logs')
+        return CommonEnvironment.get().mod_logs_location_path
 
     @staticmethod
     def get_mod_data_location_path() -> str:
@@ -154,48 +138,51 @@ class CommonLogUtils:
         :return: The file path to 'Documents\Electronic Arts\The Sims 4\Mods\mod_data' folder.
         :rtype: str
         """
-        mods_location = CommonLogUtils.get_mods_location_path()
-        if mods_location == '':
-            return ''
-        return os.path.join(mods_location, 'mod_data')
+        return CommonEnvironment.get().mod_data_location_path
 
     @staticmethod
     def _get_file_name(mod_identifier: Union[str, CommonModIdentity], file_name: str, custom_file_path: str=None) -> str:
         from sims4communitylib.utils.misc.common_mod_identity_utils import CommonModIdentityUtils
         mod_identifier = CommonModIdentityUtils.determine_mod_name_from_identifier(mod_identifier)
-        file_path = CommonLogUtils.get_mod_logs_location_path()
+        environment = CommonEnvironment.get()
+        file_path = environment.mod_logs_location_path
         file_name = '{}_{}.txt'.format(mod_identifier, file_name)
-        if not os.path.exists(file_path):
-            os.makedirs(file_path, exist_ok=True)
+        environment.ensure_folder_exists(file_path)
         if custom_file_path is not None:
             file_path = os.path.join(file_path, custom_file_path)
         current_file = os.path.join(file_path, file_name)
         try:
             if os.path.exists(current_file) and CommonLogUtils._file_is_too_big(current_file):
-                new_file_name = file_name.replace('.txt', '')
-                old_file_name = None
-                for x in range(20):
-                    old_file_name = 'Old_{}_{}.txt'.format(new_file_name, x)
-                    if not os.path.exists(os.path.join(file_path, old_file_name)):
-                        break
-                if old_file_name is None:
-                    return current_file
-                old_file_path = os.path.join(file_path, old_file_name)
-                if os.path.exists(old_file_path):
-                    os.remove(old_file_path)
-                os.rename(current_file, old_file_path)
+                CommonLogUtils._roll_over_file(current_file)
         except PermissionError:
             pass
         return current_file
 
+    @staticmethod
+    def _roll_over_file(current_file: str) -> bool:
+        file_path = os.path.dirname(current_file)
+        new_file_name = os.path.basename(current_file).replace('.txt', '')
+        old_file_name = None
+        for x in range(20):
+            old_file_name = 'Old_{}_{}.txt'.format(new_file_name, x)
+            if not os.path.exists(os.path.join(file_path, old_file_name)):
+                break
+        if old_file_name is None:
+            return False
+        old_file_path = os.path.join(file_path, old_file_name)
+        if os.path.exists(old_file_path):
+            os.remove(old_file_path)
+        os.rename(current_file, old_file_path)
+        return True
+
     @staticmethod
     def _get_old_file_path_name(mod_identifier: Union[str, CommonModIdentity], file_name: str, custom_file_path: str=None) -> str:
         from sims4communitylib.utils.misc.common_mod_identity_utils import CommonModIdentityUtils
         mod_identifier = CommonModIdentityUtils.determine_mod_name_from_identifier(mod_identifier)
-        file_path = CommonLogUtils.get_mod_logs_location_path()
+        environment = CommonEnvironment.get()
+        file_path = environment.mod_logs_location_path
         old_file_name = 'Old_{}_{}.txt'.format(mod_identifier, file_name)
-        if not os.path.exists(file_path):
-            os.makedirs(file_path, exist_ok=True)
+        environment.ensure_folder_exists(file_path)
         if custom_file_path is not None:
             file_path = os.path.join(file_path, custom_file_path)
         return os.path.join(file_path, old_file_name)